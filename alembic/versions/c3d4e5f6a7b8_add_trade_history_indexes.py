@@ -0,0 +1,34 @@
+"""add_trade_history_indexes
+
+Revision ID: c3d4e5f6a7b8
+Revises: 7db86ff346ef
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c3d4e5f6a7b8'
+down_revision = '7db86ff346ef'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    def has_index(table: str, name: str) -> bool:
+        return name in {idx["name"] for idx in inspector.get_indexes(table)}
+
+    # GET /api/trades filters by user and bot or mode, ordered by executed_at
+    if not has_index("trades", "ix_trades_user_bot_executed"):
+        op.create_index('ix_trades_user_bot_executed', 'trades', ['user_id', 'bot_id', 'executed_at'], unique=False)
+    if not has_index("trades", "ix_trades_user_mode_executed"):
+        op.create_index('ix_trades_user_mode_executed', 'trades', ['user_id', 'mode', 'executed_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_trades_user_mode_executed', table_name='trades')
+    op.drop_index('ix_trades_user_bot_executed', table_name='trades')
@@ -1,10 +1,11 @@
 import { useEffect, useRef, useState } from 'react';
 
 interface BotStatusMessage {
-  type: 'auth_success' | 'bot_status' | 'pong' | 'error';
+  type: 'auth_success' | 'bot_status' | 'initial_bot_statuses' | 'pong' | 'error';
   bot_id?: string;
   status?: string;
   message?: string;
+  bots?: BotStatusMessage[];
 }
 
 export function useBotStatus() {
@@ -41,6 +42,14 @@ export function useBotStatus() {
         if (msg.type === 'bot_status' && msg.bot_id && msg.status) {
           setBotStatuses(prev => ({ ...prev, [msg.bot_id!]: msg.status! }));
         }
+        if (msg.type === 'initial_bot_statuses' && Array.isArray(msg.bots)) {
+          // Snapshot of every bot sent once after auth
+          const statuses: Record<string, string> = {};
+          for (const bot of msg.bots) {
+            if (bot.bot_id && bot.status) statuses[bot.bot_id] = bot.status;
+          }
+          setBotStatuses(prev => ({ ...prev, ...statuses }));
+        }
       } catch (e) {
         // ignore
       }
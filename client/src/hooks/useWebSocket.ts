@@ -129,6 +129,19 @@ export const useWebSocket = () => {
               // Invalidate markets with visibility-aware throttle
               maybeInvalidateMarkets();
               break; }
+            case "market_batch": {
+              // Several market_data updates coalesced into one frame
+              const updates: IncomingMarketUpdate[] = Array.isArray(data.updates) ? data.updates : [];
+              for (const update of updates) {
+                if (update.symbol) {
+                  if (!update.ts) {
+                    update.ts = Date.now();
+                  }
+                  latestMarketDataRef.current[update.symbol] = update;
+                }
+              }
+              maybeInvalidateMarkets();
+              break; }
             case "backfill": {
               const { symbol, candles } = data;
               if (symbol && Array.isArray(candles)) {
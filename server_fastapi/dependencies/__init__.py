@@ -7,7 +7,6 @@ from .auth import (
     get_current_active_user,
     get_optional_user,
     require_permission,
-    security,
 )
 
 __all__ = [
@@ -15,6 +14,5 @@ __all__ = [
     "get_current_active_user",
     "get_optional_user",
     "require_permission",
-    "security",
 ]
 
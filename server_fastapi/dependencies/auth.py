@@ -3,39 +3,60 @@ Centralized authentication dependencies for FastAPI routes.
 Eliminates code duplication across route files.
 """
 
-from typing import Optional
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from typing import Optional, Tuple
+from fastapi import Depends, Header, HTTPException, status
 import jwt
 import os
 import logging
+import time
+
+from ..utils.token_cache import VerifiedTokenCache
 
 logger = logging.getLogger(__name__)
 
 # JWT secret from environment
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
+# PyJWT verifies HS256 through the stdlib hmac/hashlib (OpenSSL), so the
+# secret is only encoded once here rather than on every decode
+_JWT_KEY = JWT_SECRET.encode()
+_JWT_ALGORITHMS = ["HS256"]
+
 
-# Security scheme for Bearer token
-security = HTTPBearer()
+def _extract_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """
+    Return the token from an ``Authorization: Bearer <token>`` header value.
+    Returns None if the header is missing, uses another scheme or is empty.
+    """
+    if not authorization or authorization[:7].lower() != "bearer ":
+        return None
+    token = authorization[7:].strip()
+    return token or None
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> dict:
+def _verify_token(token: str) -> Tuple[dict, Optional[int]]:
+    payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+    return payload, payload.get("exp")
+
+
+_token_cache = VerifiedTokenCache(maxsize=8192)
+
+
+def _decode_token(token: str) -> Tuple[dict, Optional[int]]:
     """
-    Centralized dependency to get current authenticated user.
-    Validates JWT token and returns user data.
-    
-    Usage:
-        @router.get("/protected")
-        async def protected_route(current_user: dict = Depends(get_current_user)):
-            ...
+    Verify a JWT once and remember its payload and expiry.
+    Invalid tokens raise and are therefore never cached.
     """
+    return _token_cache.get_or_decode(token, _verify_token)
+
+
+def _decode_user(token: str) -> dict:
+    """Validate a JWT and build the user dict returned by the auth dependencies."""
     try:
-        token = credentials.credentials
-        
-        # Decode and validate JWT token
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+        # Signature is checked on the first sighting of a token; later requests
+        # only need the expiry re-checked against the clock
+        payload, exp = _decode_token(token)
+        if exp is not None and exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
         user_id = payload.get("id") or payload.get("sub")
         
         if not user_id:
@@ -75,6 +96,38 @@ def get_current_user(
         )
 
 
+async def get_current_user(
+    authorization: Optional[str] = Header(None)
+) -> dict:
+    """
+    Centralized dependency to get current authenticated user.
+    Validates JWT token and returns user data.
+
+    The Authorization header is parsed directly instead of going through
+    HTTPBearer, which allocates credentials objects on every request.
+    
+    Usage:
+        @router.get("/protected")
+        async def protected_route(current_user: dict = Depends(get_current_user)):
+            ...
+    """
+    if not authorization:
+        # Same status/detail HTTPBearer used, so clients see no change
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authenticated"
+        )
+
+    token = _extract_bearer_token(authorization)
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid authentication credentials"
+        )
+
+    return _decode_user(token)
+
+
 def get_current_active_user(
     current_user: dict = Depends(get_current_user)
 ) -> dict:
@@ -95,7 +148,7 @@ def get_current_active_user(
 
 
 def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
+    authorization: Optional[str] = Header(None)
 ) -> Optional[dict]:
     """
     Optional authentication - returns user if authenticated, None otherwise.
@@ -111,11 +164,12 @@ def get_optional_user(
                 # Unauthenticated user logic
                 ...
     """
-    if not credentials:
+    token = _extract_bearer_token(authorization)
+    if token is None:
         return None
     
     try:
-        return get_current_user(credentials)
+        return _decode_user(token)
     except HTTPException:
         return None
 
@@ -10,7 +10,7 @@ os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -297,6 +297,14 @@ async def lifespan(app: FastAPI):
     except ImportError:
         logger.warning("Advanced health checks not available")
 
+    # Compile technical indicator kernels before the first analysis request
+    try:
+        from .services.market.indicators import warmup as warmup_indicators
+
+        warmup_indicators()
+    except Exception as e:
+        logger.warning(f"Indicator kernel warmup failed: {e}")
+
     # Start market data streaming service
     try:
         from .services.websocket_manager import connection_manager
@@ -309,6 +317,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Market data streaming not available: {e}")
 
+    # Keep the trading-pair snapshot behind tickers/summary warm
+    try:
+        from .routes.markets import refresh_pairs_forever
+
+        app.state.pairs_refresher = asyncio.create_task(refresh_pairs_forever())
+        logger.info("Trading pair snapshot refresher started")
+    except Exception as e:
+        logger.warning(f"Trading pair snapshot refresher not available: {e}")
+
     # Export OpenAPI JSON schema to docs/openapi.json
     try:
         os.makedirs("docs", exist_ok=True)
@@ -332,6 +349,10 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping market streamer: {e}")
 
+    # Stop trading pair snapshot refresher
+    if getattr(app.state, "pairs_refresher", None):
+        app.state.pairs_refresher.cancel()
+
     # Close distributed rate limiter
     if hasattr(app.state, "rate_limiter") and app.state.rate_limiter:
         try:
@@ -356,6 +377,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error closing Redis: {e}")
 
+    # Close the Binance testnet exchange session
+    try:
+        from .services.exchange.binance_testnet_service import (
+            close_binance_testnet_service,
+        )
+
+        await close_binance_testnet_service()
+    except Exception as e:
+        logger.error(f"Error closing Binance testnet client: {e}")
+
     # Stop cache warmer service
     if hasattr(app.state, "cache_warmer") and app.state.cache_warmer:
         try:
@@ -814,17 +845,22 @@ async def health_check():
     return health_status
 
 
+# Static probe payloads, serialized once at import
+_HEALTHZ_BODY = b'{"status":"ok"}'
+_ROOT_BODY = b'{"message":"CryptoOrchestrator API","version":"1.0.0"}'
+
+
 # Simple health check endpoint for load balancers and monitoring
 @app.get("/healthz")
 async def healthz():
     """Simple health check endpoint returning status: ok"""
-    return {"status": "ok"}
+    return Response(content=_HEALTHZ_BODY, media_type="application/json")
 
 
 # Root endpoint
 @app.get("/")
 async def root():
-    return {"message": "CryptoOrchestrator API", "version": "1.0.0"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -1268,8 +1304,10 @@ if __name__ == "__main__":
         "log_level": "debug" if is_development else "info",
         "access_log": is_development,  # Disable access logs in production for performance
         "workers": 1,  # Single worker for desktop app (avoid port conflicts)
-        "loop": "asyncio",
-        "http": "auto",  # Use auto for compatibility
+        # "auto" picks uvloop and httptools (both shipped with uvicorn[standard])
+        # and falls back to asyncio/h11 where they are unavailable, e.g. Windows
+        "loop": "auto",
+        "http": "auto",
     }
 
     uvicorn.run(**uvicorn_config)
@@ -6,10 +6,14 @@ Caches database query results to improve performance
 import hashlib
 import json
 import logging
+import time
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 from datetime import timedelta
 
+from fastapi.responses import Response
+from pydantic_core import to_json
+
 logger = logging.getLogger(__name__)
 
 # Try to import Redis cache service
@@ -131,3 +135,82 @@ def invalidate_cache_pattern(pattern: str):
         # TODO: Implement pattern-based cache invalidation in cache_service
     except Exception as e:
         logger.error(f"Cache invalidation error for pattern {pattern}: {e}")
+
+
+# Serialized response bodies: (key_prefix, *params) -> (expires_at, body)
+MAX_RESPONSE_CACHE_ENTRIES = 2048
+_response_cache: Dict[Tuple[Any, ...], Tuple[float, bytes]] = {}
+
+
+def _store_response(key: Tuple[Any, ...], ttl: float, body: bytes) -> None:
+    if len(_response_cache) >= MAX_RESPONSE_CACHE_ENTRIES:
+        now = time.monotonic()
+        for stale_key in [k for k, v in _response_cache.items() if v[0] <= now]:
+            del _response_cache[stale_key]
+        if len(_response_cache) >= MAX_RESPONSE_CACHE_ENTRIES:
+            # Still full of live entries: drop the oldest insertion
+            del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (time.monotonic() + ttl, body)
+
+
+def cache_response(
+    ttl: Union[float, Callable[..., float]],
+    key_prefix: str,
+    key_params: Sequence[str],
+    should_cache: Optional[Callable[[Any], bool]] = None,
+):
+    """
+    Decorator caching an endpoint's serialized JSON body in process memory.
+
+    Intended for short-lived market data (prices, order books, candles) where
+    many clients request the same thing within a few seconds. Hits return the
+    stored bytes directly, skipping both the upstream call and serialization.
+
+    Args:
+        ttl: Seconds to keep a body, or a callable taking the endpoint kwargs
+        key_prefix: Prefix for cache key (also used by invalidate_response_cache)
+        key_params: Names of endpoint parameters that make up the cache key
+        should_cache: Optional predicate on the result; falsy skips caching
+
+    Usage:
+        @router.get("/price/{pair}")
+        @cache_response(ttl=1.0, key_prefix="price", key_params=("pair",))
+        async def get_price(pair: str, exchange=Depends(get_exchange_service)):
+            ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (key_prefix,) + tuple(kwargs.get(name) for name in key_params)
+            entry = _response_cache.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return Response(content=entry[1], media_type="application/json")
+
+            result = await func(*args, **kwargs)
+            if isinstance(result, Response) or (
+                should_cache is not None and not should_cache(result)
+            ):
+                return result
+
+            body = to_json(result)
+            entry_ttl = ttl(**kwargs) if callable(ttl) else ttl
+            _store_response(key, entry_ttl, body)
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_response_cache(key_prefix: str, *key_values: Any) -> None:
+    """
+    Drop cached response bodies whose key starts with key_prefix and key_values.
+
+    Usage:
+        invalidate_response_cache("orderbook", "BTC/USD")
+    """
+    prefix = (key_prefix,) + key_values
+    size = len(prefix)
+    for key in [k for k in _response_cache if k[:size] == prefix]:
+        del _response_cache[key]
@@ -4,7 +4,16 @@ Trade Model - Trade execution history
 
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    Boolean,
+    ForeignKey,
+    Index,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .base import Base, TimestampMixin
 
@@ -23,6 +32,11 @@ class Trade(Base, TimestampMixin):
     """Model for storing trade history"""
 
     __tablename__ = "trades"
+    # Cover the trade history filters (user + bot / user + mode, newest first)
+    __table_args__ = (
+        Index("ix_trades_user_bot_executed", "user_id", "bot_id", "executed_at"),
+        Index("ix_trades_user_mode_executed", "user_id", "mode", "executed_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
@@ -12,8 +12,15 @@ class PreferencesRepository(SQLAlchemyRepository[UserPreferencesModel]):
         result = await session.execute(select(UserPreferencesModel).where(UserPreferencesModel.user_id == user_id))
         return result.scalar_one_or_none()
 
-    async def upsert_for_user(self, session: AsyncSession, user_id: int, **kwargs) -> UserPreferencesModel:
-        prefs = await self.get_by_user_id(session, user_id)
+    async def upsert_for_user(
+        self,
+        session: AsyncSession,
+        user_id: int,
+        existing: Optional[UserPreferencesModel] = None,
+        **kwargs,
+    ) -> UserPreferencesModel:
+        # Callers that already loaded the row pass it in to skip the lookup
+        prefs = existing if existing is not None else await self.get_by_user_id(session, user_id)
         if prefs is None:
             prefs = UserPreferencesModel(user_id=user_id, **kwargs)
             session.add(prefs)
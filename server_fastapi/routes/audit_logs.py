@@ -4,7 +4,6 @@ Provides access to audit logs for compliance and security
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.security import HTTPBearer
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import logging
@@ -17,7 +16,6 @@ from ..dependencies.auth import get_current_user
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/audit-logs", tags=["audit-logs"])
-security = HTTPBearer()
 
 # Audit log directory
 AUDIT_LOG_DIR = Path("logs")
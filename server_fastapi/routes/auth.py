@@ -1,5 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Request
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import APIRouter, HTTPException, Depends, Header, status, Request
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -185,7 +184,6 @@ def _get_user_repository_lazy():
 
 
 router = APIRouter()
-security = HTTPBearer()
 
 # Import rate limiting configuration
 auth_limiter = (
@@ -531,8 +529,8 @@ def generate_refresh_token(user: dict) -> str:
     )
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+async def get_current_user(
+    authorization: Optional[str] = Header(None),
 ) -> dict:
     """
     Legacy get_current_user - kept for backward compatibility.
@@ -544,13 +542,13 @@ def get_current_user(
             get_current_user as _get_current_user,
         )
 
-        return _get_current_user(credentials)
+        return await _get_current_user(authorization)
     except ImportError:
         # Fallback to legacy implementation
+        if not authorization or authorization[:7].lower() != "bearer ":
+            raise HTTPException(status_code=403, detail="Not authenticated")
         try:
-            payload = jwt.decode(
-                credentials.credentials, JWT_SECRET, algorithms=["HS256"]
-            )
+            payload = jwt.decode(authorization[7:], JWT_SECRET, algorithms=["HS256"])
             user = storage.getUserById(payload["id"])
             if not user:
                 raise HTTPException(status_code=401, detail="User not found")
@@ -11,9 +11,11 @@ import logging
 from server_fastapi.services.exchange.binance_testnet_service import (
     get_binance_testnet_service,
 )
+from server_fastapi.utils.api_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+# Exchange results are already plain JSON types; encode them without json.dumps
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 class MarketOrderRequest(BaseModel):
@@ -145,7 +147,8 @@ async def get_order_history(
             status_code=500, detail=result.get("error", "Order history fetch failed")
         )
 
-    return result
+    # Returned as a response so up to `limit` raw ccxt orders skip jsonable_encoder
+    return FastJSONResponse(result)
 
 
 @router.get("/open-orders", summary="Get Open Orders")
@@ -161,7 +164,7 @@ async def get_open_orders(
             status_code=500, detail=result.get("error", "Open orders fetch failed")
         )
 
-    return result
+    return FastJSONResponse(result)
 
 
 @router.get("/ticker/{symbol}", summary="Get Current Price")
@@ -18,7 +18,7 @@ def _get_user_id(current_user: dict) -> str:
     """Helper function to safely extract user_id from current_user dict"""
     user_id = current_user.get("id") or current_user.get("user_id") or current_user.get("sub")
     if not user_id:
-        logger.warning(f"User ID not found in current_user: {current_user}")
+        logger.warning("User ID not found in current_user: %s", current_user)
         raise HTTPException(status_code=401, detail="User not authenticated")
     return str(user_id)
 
@@ -84,6 +84,7 @@ class MockBotStorage:
         self._seed_default_bots()
 
     def _seed_default_bots(self):
+        now = datetime.now()
         default_bot = {
             "id": "bot-1",
             "user_id": 1,  # Associate with default user
@@ -101,21 +102,37 @@ class MockBotStorage:
                     "features": ["price", "volume", "rsi", "macd"],
                 },
             },
-            "created_at": datetime.now(),
-            "updated_at": datetime.now(),
+            "created_at": now,
+            "updated_at": now,
         }
         self.bots["bot-1"] = default_bot
 
     def get_all_bots(self) -> List[BotConfig]:
         return [BotConfig(**bot) for bot in self.bots.values()]
 
+    def _get_raw(self, bot_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored bot dict without building a BotConfig"""
+        return self.bots.get(bot_id)
+
+    def _patch(self, bot: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply non-None updates in place to a stored bot dict"""
+        for key, value in updates.items():
+            if value is not None:
+                if key == "config":
+                    bot["config"].update(value)
+                else:
+                    bot[key] = value
+        bot["updated_at"] = datetime.now()
+        return bot
+
     def get_bot(self, bot_id: str) -> Optional[BotConfig]:
-        bot = self.bots.get(bot_id)
+        bot = self._get_raw(bot_id)
         return BotConfig(**bot) if bot else None
 
     def create_bot(self, bot_data: Dict[str, Any], user_id: int) -> BotConfig:
         bot_id = f"bot-{self.next_id}"
         self.next_id += 1
+        now = datetime.now()
         bot = {
             "id": bot_id,
             "user_id": user_id,
@@ -124,8 +141,8 @@ class MockBotStorage:
             "strategy": bot_data["strategy"],
             "is_active": False,
             "config": bot_data["config"],
-            "created_at": datetime.now(),
-            "updated_at": datetime.now(),
+            "created_at": now,
+            "updated_at": now,
         }
         self.bots[bot_id] = bot
         return BotConfig(**bot)
@@ -136,25 +153,14 @@ class MockBotStorage:
         ]
 
     def update_bot(self, bot_id: str, updates: Dict[str, Any]) -> Optional[BotConfig]:
-        if bot_id not in self.bots:
+        bot = self._get_raw(bot_id)
+        if bot is None:
             return None
 
-        bot = self.bots[bot_id]
-        for key, value in updates.items():
-            if value is not None:
-                if key == "config":
-                    bot["config"].update(value)
-                else:
-                    bot[key] = value
-        bot["updated_at"] = datetime.now()
-
-        return BotConfig(**bot)
+        return BotConfig(**self._patch(bot, updates))
 
     def delete_bot(self, bot_id: str) -> bool:
-        if bot_id in self.bots:
-            del self.bots[bot_id]
-            return True
-        return False
+        return self.bots.pop(bot_id, None) is not None
 
 
 @router.get("/")
@@ -163,7 +169,7 @@ async def get_bots(current_user: dict = Depends(get_current_user)) -> List[BotCo
     try:
         user_id = current_user.get("id") or current_user.get("user_id") or current_user.get("sub")
         if not user_id:
-            logger.warning(f"User ID not found in current_user: {current_user}")
+            logger.warning("User ID not found in current_user: %s", current_user)
             return []
         
         bot_service = get_bot_service()
@@ -182,10 +188,13 @@ async def get_bots(current_user: dict = Depends(get_current_user)) -> List[BotCo
         raise
     except Exception as e:
         logger.error(
-            f"Error fetching bots for user {current_user.get('id', 'unknown')}: {e}", exc_info=True
+            "Error fetching bots for user %s: %s",
+            current_user.get('id', 'unknown'),
+            e,
+            exc_info=True,
         )
         # Return empty list instead of 500 error for better UX during development
-        logger.warning(f"Returning empty bots list due to error: {e}")
+        logger.warning("Returning empty bots list due to error: %s", e)
         return []
 
 
@@ -204,7 +213,7 @@ async def get_bot(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching bot {bot_id}: {e}")
+        logger.error("Error fetching bot %s: %s", bot_id, e)
         raise HTTPException(status_code=500, detail="Failed to fetch bot")
 
 
@@ -223,7 +232,10 @@ async def create_bot(
             request.strategy, request.config
         )
         logger.info(
-            f"Bot config validation result: {is_valid} for strategy {request.strategy} with config {request.config}"
+            "Bot config validation result: %s for strategy %s with config %s",
+            is_valid,
+            request.strategy,
+            request.config,
         )
         if not is_valid:
             raise HTTPException(status_code=400, detail="Invalid bot configuration")
@@ -247,7 +259,7 @@ async def create_bot(
                 status_code=500, detail="Failed to retrieve created bot"
             )
 
-        logger.info(f"Created new bot: {bot_id} for user {user_id}")
+        logger.info("Created new bot: %s for user %s", bot_id, user_id)
         return BotConfig(**bot_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -255,7 +267,7 @@ async def create_bot(
         raise
     except Exception as e:
         user_id = current_user.get("id") or current_user.get("user_id") or current_user.get("sub") or "unknown"
-        logger.error(f"Error creating bot for user {user_id}: {e}")
+        logger.error("Error creating bot for user %s: %s", user_id, e)
         raise HTTPException(status_code=500, detail="Failed to create bot")
 
 
@@ -294,12 +306,12 @@ async def update_bot(
                 status_code=500, detail="Failed to retrieve updated bot"
             )
 
-        logger.info(f"Updated bot: {bot_id}")
+        logger.info("Updated bot: %s", bot_id)
         return BotConfig(**updated_bot)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating bot {bot_id}: {e}")
+        logger.error("Error updating bot %s: %s", bot_id, e)
         raise HTTPException(status_code=500, detail="Failed to update bot")
 
 
@@ -319,12 +331,12 @@ async def delete_bot(bot_id: str, current_user: dict = Depends(get_current_user)
         if not success:
             raise HTTPException(status_code=500, detail="Failed to delete bot")
 
-        logger.info(f"Deleted bot: {bot_id}")
+        logger.info("Deleted bot: %s", bot_id)
         return {"message": "Bot deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting bot {bot_id}: {e}")
+        logger.error("Error deleting bot %s: %s", bot_id, e)
         raise HTTPException(status_code=500, detail="Failed to delete bot")
 
 
@@ -350,7 +362,7 @@ async def start_bot(
 
         if validation.get("warnings"):
             logger.warning(
-                f"Starting bot {bot_id} despite warnings: {validation['warnings']}"
+                "Starting bot %s despite warnings: %s", bot_id, validation['warnings']
             )
 
         # Check if bot is already active
@@ -371,12 +383,12 @@ async def start_bot(
             trading_service.run_bot_loop, bot_id, user_id
         )
 
-        logger.info(f"Started bot: {bot_id}")
+        logger.info("Started bot: %s", bot_id)
         return {"message": f"Bot {bot_id} started successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error starting bot {bot_id}: {e}")
+        logger.error("Error starting bot %s: %s", bot_id, e)
         raise HTTPException(status_code=500, detail="Failed to start bot")
 
 
@@ -399,12 +411,12 @@ async def stop_bot(bot_id: str, current_user: dict = Depends(get_current_user)):
         if not success:
             raise HTTPException(status_code=500, detail="Failed to stop bot")
 
-        logger.info(f"Stopped bot: {bot_id}")
+        logger.info("Stopped bot: %s", bot_id)
         return {"message": f"Bot {bot_id} stopped successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error stopping bot {bot_id}: {e}")
+        logger.error("Error stopping bot %s: %s", bot_id, e)
         raise HTTPException(status_code=500, detail="Failed to stop bot")
 
 
@@ -445,7 +457,7 @@ async def get_bot_model(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting model status for bot {bot_id}: {e}")
+        logger.error("Error getting model status for bot %s: %s", bot_id, e)
         raise HTTPException(status_code=500, detail="Failed to get model status")
 
 
@@ -476,7 +488,7 @@ async def get_bot_performance(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting performance for bot {bot_id}: {e}")
+        logger.error("Error getting performance for bot %s: %s", bot_id, e)
         raise HTTPException(status_code=500, detail="Failed to get performance data")
 
 
@@ -492,7 +504,7 @@ async def get_safety_status(current_user: dict = Depends(get_current_user)):
         status = await bot_service.get_system_safety_status()
         return status
     except Exception as e:
-        logger.error(f"Error getting safety status: {e}")
+        logger.error("Error getting safety status: %s", e)
         raise HTTPException(status_code=500, detail="Failed to get safety status")
 
 
@@ -513,7 +525,9 @@ async def emergency_stop(current_user: dict = Depends(get_current_user)):
         )
 
         logger.critical(
-            f"Emergency stop activated by user {user_id}: stopped {stopped_count} bots"
+            "Emergency stop activated by user %s: stopped %s bots",
+            user_id,
+            stopped_count,
         )
         return {
             "message": "Emergency stop activated",
@@ -524,7 +538,7 @@ async def emergency_stop(current_user: dict = Depends(get_current_user)):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error activating emergency stop: {e}")
+        logger.error("Error activating emergency stop: %s", e)
         raise HTTPException(status_code=500, detail="Failed to activate emergency stop")
 
 
@@ -578,7 +592,7 @@ async def get_bot_analysis(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting bot analysis: {e}", exc_info=True)
+        logger.error("Error getting bot analysis: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get analysis: {str(e)}")
 
 
@@ -652,7 +666,7 @@ async def get_bot_risk_metrics(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting risk metrics: {e}", exc_info=True)
+        logger.error("Error getting risk metrics: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500, detail=f"Failed to get risk metrics: {str(e)}"
         )
@@ -731,7 +745,7 @@ async def optimize_bot_parameters(
             smart_params = await smart_engine.get_adaptive_parameters(market_regime)
             adaptive_params.update(smart_params)
         except Exception as e:
-            logger.warning(f"Could not get smart engine adaptive parameters: {e}")
+            logger.warning("Could not get smart engine adaptive parameters: %s", e)
 
         # Add market regime and reasoning
         adaptive_params["market_regime"] = market_regime
@@ -743,7 +757,7 @@ async def optimize_bot_parameters(
             f"Confidence improvement: +{metrics['confidence_improvement']:.1f}%",
         ]
 
-        logger.info(f"Optimized parameters for bot {bot_id}: {adaptive_params}")
+        logger.info("Optimized parameters for bot %s: %s", bot_id, adaptive_params)
 
         return {
             "bot_id": bot_id,
@@ -755,7 +769,7 @@ async def optimize_bot_parameters(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error optimizing bot: {e}", exc_info=True)
+        logger.error("Error optimizing bot: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to optimize: {str(e)}")
 
 
@@ -4,7 +4,6 @@ Manages exchange API keys for users
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Security
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import logging
@@ -17,7 +16,6 @@ from ..dependencies.auth import get_current_user
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/exchange-keys", tags=["exchange-keys"])
-security = HTTPBearer()
 
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
 
@@ -4,7 +4,6 @@ Provides exchange connectivity status and health checks
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import logging
@@ -18,7 +17,6 @@ from ..dependencies.auth import get_current_user
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/exchange-status", tags=["exchange-status"])
-security = HTTPBearer()
 
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
 
@@ -3,7 +3,7 @@ Health Check and System Status Endpoints
 Provides comprehensive health monitoring for the application
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from pydantic import BaseModel
 from typing import Dict, Optional, List, Any
 from datetime import datetime
@@ -43,6 +43,11 @@ import time
 
 _app_start_time = time.time()
 
+# Load balancers poll the health endpoint at high rates; the serialized
+# result is reused for a short window instead of re-running every check.
+HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: tuple = (0.0, b"")  # (expires_at, serialized HealthStatus)
+
 
 async def check_database() -> ComponentHealth:
     """Check database connectivity"""
@@ -237,6 +242,13 @@ async def get_health():
     - Response times
     - System uptime
     """
+    global _health_cache
+
+    now = time.monotonic()
+    expires_at, cached_body = _health_cache
+    if cached_body and now < expires_at:
+        return Response(content=cached_body, media_type="application/json")
+
     try:
         # Run all health checks in parallel
         checks = await asyncio.gather(
@@ -295,13 +307,20 @@ async def get_health():
         # Calculate uptime
         uptime_seconds = time.time() - _app_start_time
 
-        return HealthStatus(
-            status=overall_status,
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            version="1.0.0",  # Could be read from config or package.json
-            uptime_seconds=round(uptime_seconds, 2),
-            checks=health_checks,
+        body = (
+            HealthStatus(
+                status=overall_status,
+                timestamp=datetime.utcnow().isoformat() + "Z",
+                version="1.0.0",  # Could be read from config or package.json
+                uptime_seconds=round(uptime_seconds, 2),
+                checks=health_checks,
+            )
+            .model_dump_json()
+            .encode()
         )
+        _health_cache = (now + HEALTH_CACHE_TTL_SECONDS, body)
+
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Health check failed: {e}", exc_info=True)
         raise HTTPException(status_code=503, detail=f"Health check failed: {str(e)}")
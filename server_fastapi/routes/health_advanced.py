@@ -10,11 +10,19 @@ from datetime import datetime
 import asyncio
 import psutil
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+# psutil probes walk /proc and cpu_percent(interval=...) blocks, so the
+# snapshot is shared across health requests for a few seconds.
+SYSTEM_METRICS_TTL_SECONDS = 5.0
+_system_metrics_cache: tuple = (0.0, None)  # (expires_at, metrics)
+# Give the non-blocking cpu_percent() a baseline, its first call returns 0.0
+psutil.cpu_percent(interval=None)
+
 
 class ComponentHealth(BaseModel):
     name: str
@@ -109,9 +117,24 @@ class HealthChecker:
         )
 
     def _get_system_metrics(self) -> Dict:
-        """Get system resource metrics"""
+        """Get system resource metrics, cached for SYSTEM_METRICS_TTL_SECONDS"""
+        global _system_metrics_cache
+
+        now = time.monotonic()
+        expires_at, cached = _system_metrics_cache
+        if cached is not None and now < expires_at:
+            return cached
+
+        metrics = self._collect_system_metrics()
+        if metrics:
+            _system_metrics_cache = (now + SYSTEM_METRICS_TTL_SECONDS, metrics)
+        return metrics
+
+    def _collect_system_metrics(self) -> Dict:
+        """Read system resource metrics from psutil"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # Non-blocking: percentage since the previous call
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage("/")
 
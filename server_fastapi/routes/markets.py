@@ -1,11 +1,18 @@
-from fastapi import APIRouter, HTTPException, Query, Depends, WebSocket
+from fastapi import APIRouter, HTTPException, Header, Query, Depends, WebSocket
+from fastapi.responses import Response
+from pydantic_core import to_json
 from .ws import get_current_user_ws
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+import asyncio
+import hashlib
+import heapq
 import logging
+import operator
 import time
 
+import numpy as np
+
 from server_fastapi.services.exchange_service import (
     ExchangeService,
     default_exchange,
@@ -18,12 +25,14 @@ from server_fastapi.services.exchange.enhanced_kraken_service import (
 )
 from server_fastapi.services.market_analysis_service import MarketAnalysisService
 from server_fastapi.services.volatility_analyzer import VolatilityAnalyzer
+from server_fastapi.services.market import indicators as indicator_kernels
 from ..dependencies.auth import get_current_user
 from ..database import get_db_session
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..repositories.candle_repository import CandleRepository
 from ..models.candle import Candle
-from ..middleware.query_cache import cache_query_result
+from ..middleware.query_cache import cache_response
+from ..utils.api_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +51,174 @@ def get_enhanced_kraken_service():
     return enhanced_kraken_service
 
 
-router = APIRouter()
+# Market payloads are long float lists; encode them without json.dumps
+router = APIRouter(default_response_class=FastJSONResponse)
+
+# Trading pairs change slowly relative to request rate, so each exchange's
+# list is fetched and ranked by volume once per TTL window and shared by
+# the tickers/summary/search/favorites/watchlist endpoints.
+PAIRS_CACHE_TTL_SECONDS = 2.0
+# Largest top-by-volume slice any endpoint serves (tickers allows limit=500)
+MAX_TOP_PAIRS = 500
+# How often refresh_pairs_forever rebuilds the default exchange's snapshot;
+# each rebuild is a full fetch_tickers, so keep this within the rate budget
+PAIRS_REFRESH_INTERVAL_SECONDS = 5.0
+
+_by_volume = operator.attrgetter("volume_24h")
+
+
+class _PairsSnapshot(NamedTuple):
+    expires_at: float
+    pairs: List[TradingPair]
+    # Top MAX_TOP_PAIRS pairs by volume, descending
+    top_pairs: List[TradingPair]
+    # (lowercased "symbol\0base\0quote", pair) used by search
+    search_index: List[Tuple[str, TradingPair]]
+    total_volume_24h: float
+    # JSON-encoded ticker object per top pair, joined per request by limit
+    ticker_rows: List[bytes]
+    # Full pair list as served by GET /, and its content hash used for ETags
+    pairs_json: bytes
+    etag: str
+
+
+# Response body TTLs for the per-pair market data endpoints
+PRICE_CACHE_TTL_SECONDS = 1.0
+ORDERBOOK_CACHE_TTL_SECONDS = 2.0
+OHLCV_CACHE_TTL_SECONDS = {
+    "1m": 5.0,
+    "5m": 15.0,
+    "15m": 30.0,
+    "30m": 60.0,
+    "1h": 60.0,
+    "4h": 120.0,
+    "1d": 300.0,
+}
+
+
+def _ohlcv_cache_ttl(timeframe: str, **_: Any) -> float:
+    return OHLCV_CACHE_TTL_SECONDS.get(timeframe, 5.0)
+
+
+# exchange name -> snapshot
+_pairs_cache: Dict[str, _PairsSnapshot] = {}
+_pairs_locks: Dict[str, asyncio.Lock] = {}
+# Exchanges whose snapshot was requested since the last background refresh
+_pairs_read: Set[str] = set()
+
+
+def _build_pairs_snapshot(pairs: List[TradingPair], ttl: float) -> _PairsSnapshot:
+    """Rank, index and pre-encode a freshly fetched pair list"""
+    # Top-K selection is O(N log K) rather than a full O(N log N) sort
+    top_pairs = heapq.nlargest(MAX_TOP_PAIRS, pairs, key=_by_volume)
+    pairs_json = to_json(pairs)
+    return _PairsSnapshot(
+        expires_at=time.monotonic() + ttl,
+        pairs=pairs,
+        top_pairs=top_pairs,
+        # Lowercased once here so search is one substring scan per pair
+        search_index=[
+            (f"{p.symbol}\0{p.base_asset}\0{p.quote_asset}".lower(), p) for p in pairs
+        ],
+        total_volume_24h=float(
+            np.fromiter(
+                (p.volume_24h for p in pairs), dtype=np.float64, count=len(pairs)
+            ).sum()
+        ),
+        ticker_rows=[
+            to_json(
+                {
+                    "symbol": p.symbol,
+                    "last_price": p.current_price,
+                    "change_24h": p.change_24h,
+                    "volume_24h": p.volume_24h,
+                    "high_24h": p.high_24h,
+                    "low_24h": p.low_24h,
+                }
+            )
+            for p in top_pairs
+        ],
+        pairs_json=pairs_json,
+        # Content hash, so an unchanged refresh keeps the same ETag
+        etag=hashlib.blake2b(pairs_json, digest_size=16).hexdigest(),
+    )
+
+
+def _etag_response(
+    etag: str, if_none_match: Optional[str], build_body: Callable[[], bytes]
+) -> Response:
+    """304 if the client already holds etag, otherwise the body built on demand"""
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=1"}
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=build_body(), media_type="application/json", headers=headers
+    )
+
+
+async def _refresh_pairs(exchange: ExchangeService, ttl: float) -> _PairsSnapshot:
+    """Fetch and rebuild an exchange's snapshot. Caller holds its lock."""
+    pairs = await exchange.get_all_trading_pairs()
+    snapshot = _build_pairs_snapshot(pairs, ttl)
+    # Empty results usually mean a failed fetch, so they are not cached
+    if pairs:
+        _pairs_cache[exchange.name] = snapshot
+    return snapshot
+
+
+async def _get_pairs_cached(
+    exchange: ExchangeService, ttl: float = PAIRS_CACHE_TTL_SECONDS
+) -> _PairsSnapshot:
+    """Return the pair snapshot for an exchange, cached for ttl seconds"""
+    key = exchange.name
+    _pairs_read.add(key)
+    snapshot = _pairs_cache.get(key)
+    if snapshot is not None and time.monotonic() < snapshot.expires_at:
+        return snapshot
+
+    # One fetch per exchange on a miss; concurrent callers wait for it
+    lock = _pairs_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        snapshot = _pairs_cache.get(key)
+        if snapshot is not None and time.monotonic() < snapshot.expires_at:
+            return snapshot
+
+        return await _refresh_pairs(exchange, ttl)
+
+
+async def refresh_pairs_forever(
+    exchange: ExchangeService = default_exchange,
+    interval: float = PAIRS_REFRESH_INTERVAL_SECONDS,
+) -> None:
+    """
+    Keep an exchange's pair snapshot materialised in the background so the
+    tickers/summary/favorites requests never wait on an exchange fetch.
+    Started from the app lifespan; if it stalls, snapshots expire and the
+    request path falls back to fetching on a miss. Rounds where nobody read
+    the snapshot since the last refresh are skipped, so an idle server does
+    not keep polling the exchange.
+    """
+    key = exchange.name
+    lock = _pairs_locks.setdefault(key, asyncio.Lock())
+    while True:
+        if key in _pairs_cache and key not in _pairs_read:
+            await asyncio.sleep(interval)
+            continue
+        _pairs_read.discard(key)
+        try:
+            async with lock:
+                # Valid until a little after the next scheduled refresh
+                await _refresh_pairs(exchange, interval + PAIRS_CACHE_TTL_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "Background pair refresh failed for %s: %s", exchange.name, e
+            )
+        await asyncio.sleep(interval)
 
 
 # Pydantic models for requests and responses
@@ -134,22 +310,29 @@ class MarketAnalysisResponse(BaseModel):
 
 # Existing endpoints updated with dependency injection and improved models
 @router.get("/", response_model=List[TradingPair])
-@cache_query_result(
-    ttl=600, key_prefix="markets", include_user=False, include_params=False
-)
 async def get_markets(
     exchange: ExchangeService = Depends(get_exchange_service),
-) -> List[TradingPair]:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """Get all available trading pairs"""
     try:
-        pairs = await exchange.get_all_trading_pairs()
-        return pairs
+        snapshot = await _get_pairs_cached(exchange)
+        return _etag_response(
+            f'"{snapshot.etag}"', if_none_match, lambda: snapshot.pairs_json
+        )
     except Exception as e:
         logger.error(f"Error fetching markets: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch markets")
 
 
 @router.get("/{pair:path}/ohlcv", response_model=PriceChartResponse)
+@cache_response(
+    ttl=_ohlcv_cache_ttl,
+    key_prefix="ohlcv",
+    key_params=("pair", "timeframe", "limit"),
+    # Empty data is the error fallback, don't pin it
+    should_cache=lambda chart: bool(chart.data),
+)
 async def get_ohlcv(
     pair: str,
     timeframe: str = Query(
@@ -224,6 +407,12 @@ async def get_candle_history(
 
 
 @router.get("/{pair:path}/orderbook", response_model=OrderBook)
+@cache_response(
+    ttl=ORDERBOOK_CACHE_TTL_SECONDS,
+    key_prefix="orderbook",
+    key_params=("pair",),
+    should_cache=lambda book: bool(book.bids or book.asks),
+)
 async def get_order_book(
     pair: str, exchange: ExchangeService = Depends(get_exchange_service)
 ) -> OrderBook:
@@ -253,6 +442,7 @@ async def get_order_book(
 
 
 @router.get("/price/{pair}")
+@cache_response(ttl=PRICE_CACHE_TTL_SECONDS, key_prefix="price", key_params=("pair",))
 async def get_price(
     pair: str, exchange: ExchangeService = Depends(get_exchange_service)
 ) -> dict:
@@ -279,28 +469,19 @@ async def get_price(
 async def get_tickers(
     limit: int = Query(50, description="Number of tickers to return", ge=1, le=500),
     exchange: ExchangeService = Depends(get_exchange_service),
-) -> List[TickerResponse]:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """Get ticker data for multiple trading pairs"""
     try:
-        pairs = await exchange.get_all_trading_pairs()
-
-        # Sort by volume and limit results
-        sorted_pairs = sorted(pairs, key=lambda x: x.volume_24h, reverse=True)[:limit]
-
-        tickers = []
-        for pair in sorted_pairs:
-            tickers.append(
-                TickerResponse(
-                    symbol=pair.symbol,
-                    last_price=pair.current_price,
-                    change_24h=pair.change_24h,
-                    volume_24h=pair.volume_24h,
-                    high_24h=pair.high_24h,
-                    low_24h=pair.low_24h,
-                )
-            )
-
-        return tickers
+        snapshot = await _get_pairs_cached(exchange)
+
+        # Rows were encoded when the snapshot was built; TickerResponse is
+        # only the documented schema
+        return _etag_response(
+            f'"{snapshot.etag}-t{limit}"',
+            if_none_match,
+            lambda: b"[" + b",".join(snapshot.ticker_rows[:limit]) + b"]",
+        )
     except Exception as e:
         logger.error(f"Error fetching tickers: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch tickers")
@@ -312,22 +493,22 @@ async def get_market_summary(
         10, description="Number of top pairs to include", ge=1, le=50
     ),
     exchange: ExchangeService = Depends(get_exchange_service),
-) -> MarketSummary:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """Get market summary with total statistics and top pairs"""
     try:
-        pairs = await exchange.get_all_trading_pairs()
-
-        if not pairs:
-            return MarketSummary(total_pairs=0, total_volume_24h=0.0, top_pairs=[])
-
-        # Calculate total volume
-        total_volume = sum(pair.volume_24h for pair in pairs)
-
-        # Get top pairs by volume
-        top_pairs = sorted(pairs, key=lambda x: x.volume_24h, reverse=True)[:top_count]
-
-        return MarketSummary(
-            total_pairs=len(pairs), total_volume_24h=total_volume, top_pairs=top_pairs
+        snapshot = await _get_pairs_cached(exchange)
+
+        return _etag_response(
+            f'"{snapshot.etag}-s{top_count}"',
+            if_none_match,
+            lambda: to_json(
+                {
+                    "total_pairs": len(snapshot.pairs),
+                    "total_volume_24h": snapshot.total_volume_24h,
+                    "top_pairs": snapshot.top_pairs[:top_count],
+                }
+            ),
         )
     except Exception as e:
         logger.error(f"Error fetching market summary: {e}")
@@ -348,19 +529,15 @@ async def search_trading_pairs(
             )
 
         query_lower = query.lower().strip()
-        pairs = await exchange.get_all_trading_pairs()
+        snapshot = await _get_pairs_cached(exchange)
 
-        # Filter pairs that contain the query in their symbol
+        # Filter pairs whose symbol, base or quote asset contain the query
         matching_pairs = [
-            pair
-            for pair in pairs
-            if query_lower in pair.symbol.lower()
-            or query_lower in pair.base_asset.lower()
-            or query_lower in pair.quote_asset.lower()
+            pair for haystack, pair in snapshot.search_index if query_lower in haystack
         ]
 
-        # Sort by volume and limit results
-        return sorted(matching_pairs, key=lambda x: x.volume_24h, reverse=True)[:limit]
+        # Top results by volume
+        return heapq.nlargest(limit, matching_pairs, key=_by_volume)
 
     except HTTPException:
         raise
@@ -381,7 +558,7 @@ async def get_trading_pair_details(
             )
 
         # Get basic pair info
-        pairs = await exchange.get_all_trading_pairs()
+        pairs = (await _get_pairs_cached(exchange)).pairs
         pair_info = next((p for p in pairs if p.symbol == pair), None)
 
         if not pair_info:
@@ -440,8 +617,7 @@ async def get_favorite_pairs(
     try:
         # In a real implementation, this would fetch from user's preferences
         # For now, return popular pairs as favorites
-        pairs = await exchange.get_all_trading_pairs()
-        favorites = sorted(pairs, key=lambda x: x.volume_24h, reverse=True)[:5]
+        favorites = (await _get_pairs_cached(exchange)).top_pairs[:5]
         return favorites
     except Exception as e:
         logger.error(
@@ -459,7 +635,7 @@ async def get_watchlist(
     try:
         # In a real implementation, this would fetch from user's watchlist
         # For now, return some pairs as watchlist
-        pairs = await exchange.get_all_trading_pairs()
+        pairs = (await _get_pairs_cached(exchange)).pairs
         watchlist = pairs[:10]  # First 10 pairs as mock watchlist
         return watchlist
     except Exception as e:
@@ -467,6 +643,73 @@ async def get_watchlist(
         raise HTTPException(status_code=500, detail="Failed to fetch watchlist")
 
 
+def _rsi_indicator(
+    closes: np.ndarray, period: int, current_price: Optional[float]
+) -> Optional[TechnicalIndicator]:
+    if len(closes) <= period:
+        return None
+    if indicator_kernels.JIT_ENABLED:
+        rsi_value = float(indicator_kernels.rsi(closes, period))
+    else:
+        rsi_value = indicator_kernels.rsi_numpy(closes, period)
+    signal = "bullish" if rsi_value < 30 else "bearish" if rsi_value > 70 else "neutral"
+    return TechnicalIndicator(
+        name="rsi", value=round(rsi_value, 2), signal=signal, period=period
+    )
+
+
+def _macd_indicator(
+    closes: np.ndarray, period: int, current_price: Optional[float]
+) -> Optional[TechnicalIndicator]:
+    if len(closes) < 26:
+        return None
+    if indicator_kernels.JIT_ENABLED:
+        macd_value, signal_line, _ = indicator_kernels.macd(closes, 12, 26, 9)
+    else:
+        macd_value, signal_line, _ = indicator_kernels.macd_numpy(closes, 12, 26, 9)
+    signal = "bullish" if macd_value > signal_line else "bearish"
+    return TechnicalIndicator(
+        name="macd", value=round(float(macd_value), 4), signal=signal, period=26
+    )
+
+
+def _bollinger_indicator(
+    closes: np.ndarray, period: int, current_price: Optional[float]
+) -> Optional[TechnicalIndicator]:
+    if len(closes) < 20:
+        return None
+    if indicator_kernels.JIT_ENABLED:
+        upper, middle, lower = indicator_kernels.bollinger(closes, 20, 2.0)
+    else:
+        upper, middle, lower = indicator_kernels.bollinger_numpy(closes, 20, 2.0)
+    band_width = float(upper - middle)
+
+    # Signal based on current price relative to bands
+    if current_price and current_price > upper:
+        signal = "overbought"
+    elif current_price and current_price < lower:
+        signal = "oversold"
+    else:
+        signal = "neutral"
+
+    value = (
+        (current_price - float(middle)) / band_width
+        if current_price and band_width != 0
+        else 0
+    )
+    return TechnicalIndicator(
+        name="bollinger", value=round(value, 2), signal=signal, period=20
+    )
+
+
+# Indicators accepted by validation but without a builder are skipped
+_INDICATOR_BUILDERS = {
+    "rsi": _rsi_indicator,
+    "macd": _macd_indicator,
+    "bollinger": _bollinger_indicator,
+}
+
+
 # Rate-limited endpoints with enhanced validation and authentication
 @router.get("/advanced/{pair}/analysis", response_model=MarketAnalysisResponse)
 async def get_advanced_market_analysis(
@@ -494,8 +737,11 @@ async def get_advanced_market_analysis(
                 detail=f"Invalid indicators: {', '.join(invalid_indicators)}. Valid: {', '.join(valid_indicators)}",
             )
 
-        # Get historical data for analysis
-        historical_data = await exchange.get_historical_data(pair, "1h", 200)
+        # Historical data and current price are independent fetches
+        historical_data, current_price = await asyncio.gather(
+            exchange.get_historical_data(pair, "1h", 200),
+            exchange.get_market_price(pair),
+        )
 
         if not historical_data:
             raise HTTPException(
@@ -520,98 +766,24 @@ async def get_advanced_market_analysis(
             ohlcv_data, volatility_analyzer
         )
 
-        # Get current price
-        current_price = await exchange.get_market_price(pair)
         if not current_price and historical_data:
             current_price = historical_data[-1].close
 
         # Calculate technical indicators
         calculated_indicators = []
-        closes = [d["close"] for d in ohlcv_data[-period:]]
+        closes = np.fromiter(
+            (d.close for d in historical_data),
+            dtype=np.float64,
+            count=len(historical_data),
+        )
 
         for indicator in indicators:
-            if indicator == "rsi" and len(closes) >= period:
-                # Simple RSI calculation
-                gains = []
-                losses = []
-                for i in range(1, len(closes)):
-                    change = closes[i] - closes[i - 1]
-                    if change > 0:
-                        gains.append(change)
-                        losses.append(0)
-                    else:
-                        gains.append(0)
-                        losses.append(abs(change))
-
-                avg_gain = sum(gains) / len(gains) if gains else 0
-                avg_loss = sum(losses) / len(losses) if losses else 0
-                rs = avg_gain / avg_loss if avg_loss != 0 else 100
-                rsi_value = 100 - (100 / (1 + rs))
-
-                signal = (
-                    "bullish"
-                    if rsi_value < 30
-                    else "bearish" if rsi_value > 70 else "neutral"
-                )
-                calculated_indicators.append(
-                    TechnicalIndicator(
-                        name="rsi",
-                        value=round(rsi_value, 2),
-                        signal=signal,
-                        period=period,
-                    )
-                )
-
-            elif indicator == "macd" and len(closes) >= 26:
-                # Simple MACD calculation
-                ema12 = sum(closes[-12:]) / 12
-                ema26 = sum(closes[-26:]) / 26
-                macd = ema12 - ema26
-                signal_line = sum(
-                    [ema12 - ema26 for _ in range(min(9, len(closes)))]
-                ) / min(9, len(closes))
-                histogram = macd - signal_line
-
-                signal = "bullish" if macd > signal_line else "bearish"
-                calculated_indicators.append(
-                    TechnicalIndicator(
-                        name="macd", value=round(macd, 4), signal=signal, period=26
-                    )
-                )
-
-            elif indicator == "bollinger" and len(closes) >= 20:
-                # Bollinger Bands
-                sma = sum(closes[-20:]) / 20
-                std = (sum((x - sma) ** 2 for x in closes[-20:]) / 20) ** 0.5
-                upper = sma + (std * 2)
-                lower = sma - (std * 2)
-
-                # Signal based on current price relative to bands
-                if current_price:
-                    if current_price > upper:
-                        signal = "overbought"
-                    elif current_price < lower:
-                        signal = "oversold"
-                    else:
-                        signal = "neutral"
-                else:
-                    signal = "neutral"
-
-                calculated_indicators.append(
-                    TechnicalIndicator(
-                        name="bollinger",
-                        value=round(
-                            (
-                                (current_price - sma) / (std * 2)
-                                if current_price and std != 0
-                                else 0
-                            ),
-                            2,
-                        ),
-                        signal=signal,
-                        period=20,
-                    )
-                )
+            builder = _INDICATOR_BUILDERS.get(indicator)
+            if builder is None:
+                continue
+            result = builder(closes, period, current_price)
+            if result is not None:
+                calculated_indicators.append(result)
 
         # Determine trend and strength from analysis
         trend_strength = analysis_result.summary.get("trendStrength", 0.0)
@@ -664,18 +836,20 @@ async def get_realtime_price_stream(
                 status_code=400, detail="Invalid pair format. Use format: BASE/QUOTE"
             )
 
-        # Get current price
-        price = await exchange.get_market_price(pair)
+        # Price, order book (bid/ask) and pair data (24h change/volume) are
+        # independent, so fetch them concurrently
+        price, order_book, snapshot = await asyncio.gather(
+            exchange.get_market_price(pair),
+            exchange.get_order_book(pair),
+            _get_pairs_cached(exchange),
+        )
         if price is None:
             raise HTTPException(status_code=404, detail=f"Price not found for {pair}")
 
-        # Get order book for bid/ask prices
-        order_book = await exchange.get_order_book(pair)
         bid_price = order_book.bids[0][0] if order_book.bids else None
         ask_price = order_book.asks[0][0] if order_book.asks else None
 
-        # Get recent trading pair data for 24h change and volume
-        pairs = await exchange.get_all_trading_pairs()
+        pairs = snapshot.pairs
         pair_data = next((p for p in pairs if p.symbol == pair), None)
 
         return RealTimeMarketData(
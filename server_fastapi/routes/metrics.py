@@ -14,10 +14,37 @@ from prometheus_client import (
 from fastapi.responses import Response
 import psutil
 import os
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
 
 router = APIRouter(prefix="/metrics", tags=["Metrics"])
 
+# Scrapers poll these endpoints frequently; psutil reads are shared for a
+# few seconds instead of hitting /proc on every request.
+SYSTEM_SNAPSHOT_TTL_SECONDS = 5.0
+_system_snapshot_cache: Tuple[float, Optional[Tuple[Any, Any, Any]]] = (0.0, None)
+# The first non-blocking cpu_percent() call has no baseline and returns 0.0;
+# prime it here so the first cached snapshot reports a real figure
+psutil.cpu_percent(interval=None)
+
+
+def _get_system_snapshot() -> Tuple[Any, Any, Any]:
+    """Return cached (cpu_percent, virtual_memory, disk_usage) for "/"."""
+    global _system_snapshot_cache
+
+    now = time.monotonic()
+    expires_at, snapshot = _system_snapshot_cache
+    if snapshot is None or now >= expires_at:
+        snapshot = (
+            # Non-blocking: percentage since the previous call
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory(),
+            psutil.disk_usage("/"),
+        )
+        _system_snapshot_cache = (now + SYSTEM_SNAPSHOT_TTL_SECONDS, snapshot)
+    return snapshot
+
+
 # HTTP Metrics (using unique prefixes to avoid conflicts)
 crypto_http_requests_total = Counter(
     "crypto_http_requests_total",
@@ -108,18 +135,17 @@ async def get_metrics():
     """
     # Update system metrics
     try:
+        cpu_percent, memory, disk = _get_system_snapshot()
+
         # CPU
-        cpu_percent = psutil.cpu_percent(interval=0.1)
         crypto_system_cpu_percent.set(cpu_percent)
 
         # Memory
-        memory = psutil.virtual_memory()
         crypto_system_memory_bytes.labels(type="used").set(memory.used)
         crypto_system_memory_bytes.labels(type="available").set(memory.available)
         crypto_system_memory_bytes.labels(type="total").set(memory.total)
 
         # Disk
-        disk = psutil.disk_usage("/")
         crypto_system_disk_bytes.labels(path="/", type="used").set(disk.used)
         crypto_system_disk_bytes.labels(path="/", type="free").set(disk.free)
         crypto_system_disk_bytes.labels(path="/", type="total").set(disk.total)
@@ -140,9 +166,7 @@ async def get_metrics_summary() -> Dict[str, Any]:
     Returns key metrics in JSON format
     """
     try:
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage("/")
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        cpu_percent, memory, disk = _get_system_snapshot()
     except Exception:
         memory = None
         disk = None
@@ -107,7 +107,9 @@ async def create_notification(
 
 @router.patch("/{notification_id}/read")
 async def mark_notification_read(
-    notification_id: int, current_user: dict = Depends(get_current_user)
+    notification_id: int,
+    current_user: dict = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
 ):
     """Mark a specific notification as read"""
     try:
@@ -133,7 +135,9 @@ async def mark_notification_read(
 
 @router.patch("/read-all")
 async def mark_all_notifications_read(
-    category: Optional[str] = None, current_user: dict = Depends(get_current_user)
+    category: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
 ):
     """Mark all notifications as read, optionally filtered by category"""
     try:
@@ -158,7 +162,9 @@ async def mark_all_notifications_read(
 
 @router.delete("/{notification_id}")
 async def delete_notification(
-    notification_id: int, current_user: dict = Depends(get_current_user)
+    notification_id: int,
+    current_user: dict = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
 ):
     """Delete a specific notification"""
     try:
@@ -181,7 +187,10 @@ async def delete_notification(
 
 
 @router.get("/stats", response_model=Dict[str, Any])
-async def get_notification_stats(current_user: dict = Depends(get_current_user)):
+async def get_notification_stats(
+    current_user: dict = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
+):
     """Get notification statistics for the user"""
     try:
         user_id = current_user.get("id") or current_user.get("user_id") or current_user.get("sub")
@@ -202,6 +211,7 @@ async def get_unread_count(
     category: Optional[str] = None,
     priority: Optional[List[str]] = Query(None),
     current_user: dict = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
 ):
     """Get count of unread notifications with optional filters"""
     try:
@@ -228,7 +238,9 @@ async def get_unread_count(
 
 @router.post("/broadcast")
 async def broadcast_notification(
-    broadcast_data: Dict[str, Any], current_user: dict = Depends(get_current_user)
+    broadcast_data: Dict[str, Any],
+    current_user: dict = Depends(get_current_user),
+    notification_service: NotificationService = Depends(get_notification_service),
 ):
     """Broadcast notification to multiple users (admin only)"""
     # Note: In a real implementation, you'd check if current_user has admin privileges
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from ..services.exchange_service import default_exchange
@@ -38,9 +38,49 @@ class Portfolio(BaseModel):
     averageLoss: Optional[float] = None
 
 
+# Static fallback portfolios, built once at import and never mutated
+_LIVE_FALLBACK = Portfolio(
+    totalBalance=50000.0,
+    availableBalance=48000.0,
+    positions={
+        "BTC": Position(
+            asset="BTC",
+            amount=0.5,
+            averagePrice=49000.0,
+            currentPrice=50000.0,
+            totalValue=25000.0,
+            profitLoss=500.0,
+            profitLossPercent=2.0,
+        )
+    },
+    profitLoss24h=320.75,
+    profitLossTotal=1820.0,
+    successfulTrades=23,
+    failedTrades=8,
+    totalTrades=31,
+    winRate=0.742,
+    averageWin=145.25,
+    averageLoss=-125.50,
+)
+
+_MINIMAL = Portfolio(
+    totalBalance=100000.0,
+    availableBalance=95000.0,
+    positions={},
+    profitLoss24h=0.0,
+    profitLossTotal=0.0,
+    successfulTrades=0,
+    failedTrades=0,
+    totalTrades=0,
+    winRate=0.0,
+    averageWin=0.0,
+    averageLoss=0.0,
+)
+
+
 @router.get("/{mode}")
 async def get_portfolio(
-    mode: str,
+    mode: Literal["paper", "real", "live"],
     current_user: dict = Depends(get_current_user),
     db: AsyncSession = Depends(get_db_session),
 ) -> Portfolio:
@@ -50,7 +90,8 @@ async def get_portfolio(
         if mode == "live":
             mode = "real"
 
-        if mode not in ["paper", "real"]:
+        # The route validates mode, but the portfolio WebSocket calls this directly
+        if mode not in ("paper", "real"):
             raise HTTPException(
                 status_code=400, detail="Mode must be 'paper' or 'real'"
             )
@@ -263,29 +304,7 @@ async def get_portfolio(
             except Exception as e:
                 logger.error(f"Failed to get live portfolio: {e}")
                 # Fall back to mock data
-                return Portfolio(
-                    totalBalance=50000.0,
-                    availableBalance=48000.0,
-                    positions={
-                        "BTC": Position(
-                            asset="BTC",
-                            amount=0.5,
-                            averagePrice=49000.0,
-                            currentPrice=50000.0,
-                            totalValue=25000.0,
-                            profitLoss=500.0,
-                            profitLossPercent=2.0,
-                        )
-                    },
-                    profitLoss24h=320.75,
-                    profitLossTotal=1820.0,
-                    successfulTrades=23,
-                    failedTrades=8,
-                    totalTrades=31,
-                    winRate=0.742,
-                    averageWin=145.25,
-                    averageLoss=-125.50,
-                )
+                return _LIVE_FALLBACK
 
         else:  # paper mode
             # Get paper trading portfolio from database
@@ -426,17 +445,4 @@ async def get_portfolio(
         logger.error(f"Error getting portfolio for mode {mode}: {e}", exc_info=True)
         # Return minimal portfolio instead of 500 error for better UX during development
         logger.warning(f"Returning minimal portfolio due to error: {e}")
-        user_id = current_user.get("id") or current_user.get("user_id") or current_user.get("sub") or 1
-        return Portfolio(
-            totalBalance=100000.0,
-            availableBalance=95000.0,
-            positions={},
-            profitLoss24h=0.0,
-            profitLossTotal=0.0,
-            successfulTrades=0,
-            failedTrades=0,
-            totalTrades=0,
-            winRate=0.0,
-            averageWin=0.0,
-            averageLoss=0.0,
-        )
+        return _MINIMAL
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException, Depends
-from datetime import datetime
 from typing import Optional, Dict, Any
 import logging
 import json
+import time
 
 from shared.schema import UserPreferences, UpdateUserPreferences, Theme
 from pydantic import BaseModel
@@ -73,6 +73,7 @@ async def get_user_preferences(current_user: dict = Depends(get_current_user)):
         if not user_id:
             logger.warning(f"User ID not found in current_user: {current_user}")
             # Return default preferences
+            now = time.time()
             return UserPreferences(
                 userId="1",
                 theme="dark",
@@ -89,8 +90,8 @@ async def get_user_preferences(current_user: dict = Depends(get_current_user)):
                     "confirm_orders": True,
                     "show_fees": True,
                 },
-                createdAt=float(datetime.now().timestamp()),
-                updatedAt=float(datetime.now().timestamp()),
+                createdAt=now,
+                updatedAt=now,
             )
         
         async with get_db_context() as session:
@@ -114,14 +115,15 @@ async def get_user_preferences(current_user: dict = Depends(get_current_user)):
         logger.warning(f"Returning default preferences due to error: {e}")
         # Import UserPreferences from shared schema
         user_id = current_user.get("id") or current_user.get("user_id") or "1"
+        now = time.time()
         return UserPreferences(
             userId=str(user_id),
             theme="dark",
             notifications={},
             uiSettings={},
             tradingSettings={},
-            createdAt=float(datetime.now().timestamp()),
-            updatedAt=float(datetime.now().timestamp()),
+            createdAt=now,
+            updatedAt=now,
         )
 
 
@@ -129,7 +131,6 @@ async def get_user_preferences(current_user: dict = Depends(get_current_user)):
 async def update_user_preferences(
     updates: UpdateUserPreferences, current_user: dict = Depends(get_current_user)
 ):
-    update_data = updates.dict(exclude_unset=True)
     async with get_db_context() as session:
         prefs = await preferences_repository.get_by_user_id(session, current_user["id"])
         if not prefs:
@@ -145,39 +146,40 @@ async def update_user_preferences(
             except Exception:
                 existing_json = {}
 
-        if update_data.get("notifications") is not None:
-            existing_json["notifications"] = update_data["notifications"]
-        if update_data.get("uiSettings") is not None:
+        # Unset fields are None, so read them directly instead of dumping a dict
+        if updates.notifications is not None:
+            existing_json["notifications"] = updates.notifications
+        if updates.uiSettings is not None:
             # Merge nested dict
             existing_json["uiSettings"] = {
                 **existing_json.get("uiSettings", {}),
-                **update_data["uiSettings"],
+                **updates.uiSettings,
             }
-        if update_data.get("tradingSettings") is not None:
+        if updates.tradingSettings is not None:
             existing_json["tradingSettings"] = {
                 **existing_json.get("tradingSettings", {}),
-                **update_data["tradingSettings"],
+                **updates.tradingSettings,
             }
 
-        await preferences_repository.upsert_for_user(
+        # upsert refreshes and returns the row, no need to reload it
+        prefs = await preferences_repository.upsert_for_user(
             session,
             current_user["id"],
-            theme=(update_data.get("theme") or prefs.theme),
+            existing=prefs,
+            theme=(updates.theme or prefs.theme),
             language=(
                 existing_json.get("uiSettings", {}).get("language") or prefs.language
             ),
             notifications_enabled=(
                 prefs.notifications_enabled
-                if update_data.get("notifications") is None
-                else all(update_data["notifications"].values())
+                if updates.notifications is None
+                else all(updates.notifications.values())
             ),
             data_json=json.dumps(existing_json),
         )
 
-        # Reload and return
-        prefs = await preferences_repository.get_by_user_id(session, current_user["id"])
         data = _merge_with_defaults(prefs)
-        logger.info(f"Updated preferences for user {current_user['id']}")
+        logger.info("Updated preferences for user %s", current_user["id"])
         return UserPreferences(**data)
 
 
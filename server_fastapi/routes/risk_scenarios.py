@@ -1,5 +1,4 @@
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,13 +6,10 @@ import logging
 from ..services.risk_scenarios import risk_scenario_service
 from ..services.notification_service import NotificationService, NotificationCategory
 from ..database import get_db_session
-import jwt
-import os
+from ..dependencies.auth import get_optional_user
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-security = HTTPBearer(auto_error=False)
-JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
 
 
 def get_notification_service(db: AsyncSession = Depends(get_db_session)) -> NotificationService:
@@ -21,23 +17,6 @@ def get_notification_service(db: AsyncSession = Depends(get_db_session)) -> Noti
     return NotificationService(db)
 
 
-def get_optional_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-) -> Optional[dict]:
-    """Optionally decode current user from JWT; returns None if no credentials provided."""
-    if not credentials:
-        return None
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
-        user_id = payload.get("id")
-        if not user_id:
-            return None
-        return {"id": user_id, "email": f"user{user_id}@example.com"}
-    except Exception:
-        return None
-
-
 class ScenarioRequest(BaseModel):
     portfolio_value: float = Field(
         ..., gt=0, description="Total portfolio value in quote currency"
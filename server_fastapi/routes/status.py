@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import Response
 from pydantic import BaseModel
 from typing import Dict, Any
 import logging
@@ -19,35 +20,22 @@ class SystemStatus(BaseModel):
     services: Dict[str, str]
 
 
-@router.get("/")
-async def get_status() -> SystemStatus:
+# Only timestamp and uptime vary, so the rest of the body is encoded once
+_START = time.monotonic()
+_STATUS_TMPL = (
+    b'{"status":"running","timestamp":"%s","uptime":%s,"version":"1.0.0",'
+    b'"services":{"fastapi":"healthy","database":"healthy","redis":"healthy"}}'
+)
+
+
+@router.get("/", response_model=SystemStatus)
+async def get_status() -> Response:
     """Get basic system status"""
-    try:
-        return SystemStatus(
-            status="running",
-            timestamp=datetime.utcnow().isoformat(),
-            uptime=time.time(),  # Would be actual uptime in real implementation
-            version="1.0.0",
-            services={
-                "fastapi": "healthy",
-                "database": "healthy",  # Mock
-                "redis": "healthy",  # Mock
-            },
-        )
-    except Exception as e:
-        logger.error(f"Failed to get status: {e}", exc_info=True)
-        # Return default status instead of 500 error
-        return SystemStatus(
-            status="degraded",
-            timestamp=datetime.utcnow().isoformat(),
-            uptime=0.0,
-            version="1.0.0",
-            services={
-                "fastapi": "unknown",
-                "database": "unknown",
-                "redis": "unknown",
-            },
-        )
+    body = _STATUS_TMPL % (
+        datetime.utcnow().isoformat().encode(),
+        b"%.3f" % (time.monotonic() - _START),
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/protected")
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 import time
@@ -14,6 +14,7 @@ from ..services.two_factor_service import two_factor_service
 from ..services.kyc_service import kyc_service
 from ..dependencies.auth import get_current_user
 from ..database import get_db_session
+from ..middleware.query_cache import invalidate_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +67,7 @@ safe_trading_system = SafeTradingSystem()
 @router.get("/", response_model=List[TradeResponse])
 async def get_trades(
     botId: Optional[str] = Query(None),
-    mode: Optional[str] = Query(None, pattern="^(paper|real|live)$"),
+    mode: Optional[Literal["paper", "real", "live"]] = Query(None),
     current_user: dict = Depends(get_current_user),
     db_session: AsyncSession = Depends(get_db_session),
 ):
@@ -469,6 +470,10 @@ async def create_trade(
                     f"Real money trade executed: trade_id={trade_id}, order_id={order_result.get('order_id')}"
                 )
 
+                # A real order moves the book, drop cached market data for the pair
+                invalidate_response_cache("price", trade.pair)
+                invalidate_response_cache("orderbook", trade.pair)
+
             except ValueError as e:
                 logger.error(f"Validation error for real money trade: {e}")
                 # Update trade status in database
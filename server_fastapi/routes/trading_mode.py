@@ -4,7 +4,6 @@ Manages trading mode (paper vs real money) requirements and validation
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPBearer
 from pydantic import BaseModel
 from typing import Dict, Any
 import logging
@@ -16,7 +15,6 @@ from ..dependencies.auth import get_current_user
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["trading-mode"])  # Prefix is added in main.py
-security = HTTPBearer()
 
 
 class RealMoneyRequirementsResponse(BaseModel):
@@ -11,7 +11,6 @@ from fastapi import (
     HTTPException,
     Query,
 )
-from fastapi.security import HTTPBearer
 import logging
 import jwt
 import os
@@ -25,7 +24,6 @@ from ..dependencies.auth import get_current_user
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ws", tags=["WebSocket"])
-security = HTTPBearer()
 
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
 
@@ -219,7 +217,6 @@ async def websocket_portfolio(
             # We need to call the portfolio endpoint logic directly
             from ..routes.portfolio import get_portfolio
             from fastapi import Request
-            from fastapi.security import HTTPAuthorizationCredentials
 
             # Create a mock request/dependency for get_portfolio
             # Since get_portfolio uses Depends(get_current_user), we need to pass user context
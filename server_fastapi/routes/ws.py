@@ -1,73 +1,123 @@
 from fastapi import WebSocket, WebSocketDisconnect, HTTPException, Depends
 from fastapi.routing import APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import json
 import asyncio
 import jwt
 import os
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Set, Tuple
+from pydantic_core import from_json, to_json
 from ..services.market_data import MarketDataService
 from ..services.trading_orchestrator import TradingOrchestrator
-from ..services.notification_service import NotificationService
+from ..services.notification_service import NotificationCategory, NotificationService
 from ..services.monitoring.performance_monitor import PerformanceMonitor
+from ..utils.token_cache import VerifiedTokenCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-security = HTTPBearer()
 
 # Environment variables
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")
+# Pre-encoded so PyJWT doesn't re-encode the secret on every verify
+_JWT_KEY = JWT_SECRET.encode()
+_JWT_ALGORITHMS = ["HS256"]
+
+
+async def _receive_json(websocket: WebSocket) -> Any:
+    """WebSocket.receive_json, decoded with pydantic-core instead of json.loads
+
+    Accepts text and binary frames; binary payloads are parsed as UTF-8 JSON
+    straight from the bytes.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    raw = message.get("text")
+    if raw is None:
+        raw = message.get("bytes") or b""
+    try:
+        return from_json(raw)
+    except ValueError as e:
+        # Keep the json.JSONDecodeError contract the handlers catch
+        doc = raw if isinstance(raw, str) else raw.decode("utf-8", "replace")
+        raise json.JSONDecodeError(str(e), doc, 0) from None
+
+
+async def _send_json(websocket: WebSocket, message: Any) -> None:
+    """WebSocket.send_json, encoded with pydantic-core instead of json.dumps"""
+    await websocket.send_text(to_json(message).decode())
 
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[Dict[str, Any]] = (
-            []
-        )  # Store connection info with user_id
+        # Connection info ({"websocket", "user_id", "subscriptions"}) indexed
+        # by socket and by user, so per-user sends skip unrelated sockets
+        self.by_ws: Dict[WebSocket, Dict[str, Any]] = {}
+        self.by_user: Dict[int, Dict[WebSocket, Dict[str, Any]]] = defaultdict(dict)
+
+    @property
+    def active_connections(self) -> List[Dict[str, Any]]:
+        return list(self.by_ws.values())
 
     async def connect(self, websocket: WebSocket, user_id: int):
         await websocket.accept()
-        self.active_connections.append(
-            {"websocket": websocket, "user_id": user_id, "subscriptions": set()}
-        )
+        conn = {"websocket": websocket, "user_id": user_id, "subscriptions": set()}
+        self.by_ws[websocket] = conn
+        self.by_user[user_id][websocket] = conn
         logger.info(f"WebSocket connection established for user {user_id}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections = [
-            conn for conn in self.active_connections if conn["websocket"] != websocket
-        ]
+        conn = self.by_ws.pop(websocket, None)
+        if conn is not None:
+            user_conns = self.by_user.get(conn["user_id"])
+            if user_conns is not None:
+                user_conns.pop(websocket, None)
+                if not user_conns:
+                    del self.by_user[conn["user_id"]]
         logger.info("WebSocket connection closed")
 
     def get_connection(self, websocket: WebSocket) -> Optional[Dict[str, Any]]:
-        for conn in self.active_connections:
-            if conn["websocket"] == websocket:
-                return conn
-        return None
+        return self.by_ws.get(websocket)
+
+    async def _send_to_user_connections(self, user_id: int, message: dict) -> int:
+        """Send to all of a user's sockets concurrently; returns the success count"""
+        conns = list(self.by_user.get(user_id, {}).values())
+        if not conns:
+            return 0
+        # Encode once for all of the user's sockets
+        text = to_json(message).decode()
+        results = await asyncio.gather(
+            *(conn["websocket"].send_text(text) for conn in conns),
+            return_exceptions=True,
+        )
+        sent = 0
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send message to user {user_id}: {result}")
+            else:
+                sent += 1
+        return sent
 
     async def send_to_user(self, user_id: int, message: dict):
         """Send message to specific user"""
-        for conn in self.active_connections:
-            if conn["user_id"] == user_id:
-                try:
-                    await conn["websocket"].send_json(message)
-                except Exception as e:
-                    logger.error(f"Failed to send message to user {user_id}: {e}")
+        await self._send_to_user_connections(user_id, message)
 
     async def broadcast_to_user(self, user_id: int, message: dict):
         """Broadcast message to user across all their connections"""
-        sent = False
-        for conn in self.active_connections:
-            if conn["user_id"] == user_id:
-                try:
-                    await conn["websocket"].send_json(message)
-                    sent = True
-                except Exception as e:
-                    logger.error(f"Failed to send broadcast to user {user_id}: {e}")
-        return sent
+        return await self._send_to_user_connections(user_id, message) > 0
+
 
+# Most market data updates sent in a single "market_batch" frame
+MARKET_BATCH_MAX = 32
+# Notifications buffered per socket, and how long one send may take
+NOTIFICATION_OUTBOX_SIZE = 256
+NOTIFICATION_SEND_TIMEOUT = 2.0
+
+# Category values accepted by mark_all_read
+_NOTIFICATION_CATEGORIES = {c.value: c for c in NotificationCategory}
 
 # Initialize managers and services
 manager = ConnectionManager()
@@ -80,13 +130,32 @@ notification_service = None  # Disabled - see TODO above
 performance_monitor = PerformanceMonitor()
 
 
+def _verify_ws_token(token: str) -> Tuple[dict, Optional[int]]:
+    payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+    return payload, payload.get("exp")
+
+
+_ws_token_cache = VerifiedTokenCache(maxsize=10_000)
+
+
+def _decode_ws_token(token: str) -> Tuple[dict, Optional[int]]:
+    """
+    Verify a token once; clients re-authenticate the same token on every
+    WebSocket they open. Invalid tokens raise and are never cached.
+    """
+    return _ws_token_cache.get_or_decode(token, _verify_ws_token)
+
+
 def get_current_user_ws(token: str = None) -> dict:
     """Get current user from JWT token for WebSocket connections"""
     try:
         if not token:
             raise HTTPException(status_code=401, detail="No token provided")
 
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+        payload, exp = _decode_ws_token(token)
+        # Cached entries outlive their token, so expiry is checked on every call
+        if exp is not None and exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
         user_id = payload.get("id")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token payload")
@@ -100,48 +169,133 @@ def get_current_user_ws(token: str = None) -> dict:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
+async def _ws_authenticate(websocket: WebSocket) -> Optional[dict]:
+    """Accept a WebSocket and run the auth handshake shared by all endpoints
+
+    Returns the connected user after sending auth_success. If the first
+    message is not an auth message the client is told and the socket is
+    closed, returning None. Bad tokens raise HTTPException.
+    """
+    await websocket.accept()
+    auth_data = await _receive_json(websocket)
+    if auth_data.get("type") != "auth":
+        await _send_json(websocket, {"error": "Authentication required"})
+        await websocket.close()
+        return None
+
+    user = get_current_user_ws(auth_data.get("token"))
+    await manager.connect(websocket, user["id"])
+    await _send_json(
+        websocket, {"type": "auth_success", "message": "Authenticated successfully"}
+    )
+    return user
+
+
+class MarketDataBroadcaster:
+    """Single consumer of the market data stream, fanned out per symbol
+
+    Every subscriber gets a bounded queue. A subscriber that falls behind
+    loses its oldest updates instead of holding up the stream.
+    """
+
+    def __init__(self, queue_size: int = 64):
+        self.queue_size = queue_size
+        self.symbol_subs: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, symbols: List[str]) -> asyncio.Queue:
+        """Register a queue for symbols, starting the stream if needed"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        for symbol in set(symbols):
+            self.symbol_subs[symbol].add(queue)
+        market_data_service.subscribed_symbols.update(self.symbol_subs)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Drop a queue, stopping the stream once nobody is subscribed"""
+        for symbol in list(self.symbol_subs):
+            subs = self.symbol_subs[symbol]
+            subs.discard(queue)
+            if not subs:
+                del self.symbol_subs[symbol]
+                market_data_service.subscribed_symbols.discard(symbol)
+        if not self.symbol_subs and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, item: Optional[dict]) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    async def _run(self) -> None:
+        try:
+            async for update in market_data_service.stream_market_data():
+                for queue in self.symbol_subs.get(update["symbol"], ()):
+                    self._offer(queue, update)
+        except Exception as e:
+            logger.error(f"Market data broadcaster stopped: {e}")
+        # Tell current subscribers the stream is gone (not on cancellation)
+        for queue in {q for subs in self.symbol_subs.values() for q in subs}:
+            self._offer(queue, None)
+
+
+market_broadcaster = MarketDataBroadcaster()
+
+
+async def _stream_market_batches(websocket: WebSocket, symbols: List[str]) -> None:
+    """Forward market data updates for symbols, one frame per ready batch
+
+    Updates come from the shared broadcaster and the sender coalesces
+    whatever has queued up since the last send (up to MARKET_BATCH_MAX
+    updates), so a burst of ticks costs one frame instead of one per symbol.
+    """
+    queue = market_broadcaster.subscribe(symbols)
+    try:
+        while True:
+            update = await queue.get()
+            batch = []
+            while update is not None:
+                batch.append(update)
+                if len(batch) >= MARKET_BATCH_MAX or queue.empty():
+                    break
+                update = queue.get_nowait()
+            if batch:
+                await _send_json(websocket, {"type": "market_batch", "updates": batch})
+            if update is None:
+                raise RuntimeError("Market data stream ended")
+    finally:
+        market_broadcaster.unsubscribe(queue)
+
+
 @router.websocket("/ws/market-data")
 async def websocket_market_data(websocket: WebSocket):
     """WebSocket endpoint for real-time market data"""
-    token = None
     user = None
 
     try:
-        # Accept connection to allow reading auth message
-        await websocket.accept()
-        # Wait for authentication message
-        auth_data = await websocket.receive_json()
-        if auth_data.get("type") != "auth":
-            await websocket.send_json({"error": "Authentication required"})
-            await websocket.close()
+        user = await _ws_authenticate(websocket)
+        if not user:
             return
 
-        token = auth_data.get("token")
-        user = get_current_user_ws(token)
-        await manager.connect(websocket, user["id"])
-
         logger.info(f"User {user['id']} authenticated for market data")
 
-        # Send initial confirmation
-        await websocket.send_json(
-            {"type": "auth_success", "message": "Authenticated successfully"}
-        )
-
         while True:
             try:
-                data = await websocket.receive_json()
+                data = await _receive_json(websocket)
+                action = data.get("action")
 
-                if data.get("action") == "subscribe":
+                if action == "subscribe":
                     symbols = data.get("symbols", ["BTC/USD"])
                     logger.info(f"User {user['id']} subscribing to {symbols}")
 
                     # Start sending market data updates
-                    async for update in market_data_service.stream_market_data():
-                        if update["symbol"] in symbols:
-                            await websocket.send_json(update)
-                        await asyncio.sleep(0.1)  # Small delay to prevent overwhelming
+                    await _stream_market_batches(websocket, symbols)
 
-                elif data.get("action") == "backfill_request":
+                elif action == "backfill_request":
                     # Client provides { action: 'backfill_request', since: { 'BTC/USD': 1690000000000 } }
                     since_map = data.get("since", {})
                     for sym, since_ts in since_map.items():
@@ -150,7 +304,8 @@ async def websocket_market_data(websocket: WebSocket):
                                 sym, int(since_ts)
                             )
                             if candles:
-                                await websocket.send_json(
+                                await _send_json(
+                                    websocket,
                                     {
                                         "type": "backfill",
                                         "symbol": sym,
@@ -160,7 +315,8 @@ async def websocket_market_data(websocket: WebSocket):
                                 )
                         except Exception as be:
                             logger.error(f"Backfill error for {sym}: {be}")
-                            await websocket.send_json(
+                            await _send_json(
+                                websocket,
                                 {
                                     "type": "backfill_error",
                                     "symbol": sym,
@@ -168,12 +324,12 @@ async def websocket_market_data(websocket: WebSocket):
                                 }
                             )
 
-                elif data.get("action") == "unsubscribe":
+                elif action == "unsubscribe":
                     logger.info(f"User {user['id']} unsubscribed from market data")
                     break
 
             except json.JSONDecodeError:
-                await websocket.send_json({"error": "Invalid JSON format"})
+                await _send_json(websocket, {"error": "Invalid JSON format"})
                 continue
 
     except WebSocketDisconnect:
@@ -181,7 +337,7 @@ async def websocket_market_data(websocket: WebSocket):
     except Exception as e:
         logger.error(f"Error in market data WebSocket: {e}")
         try:
-            await websocket.send_json({"error": str(e)})
+            await _send_json(websocket, {"error": str(e)})
         except:
             pass
     finally:
@@ -192,67 +348,62 @@ async def websocket_market_data(websocket: WebSocket):
 @router.websocket("/ws/bot-status")
 async def websocket_bot_status(websocket: WebSocket):
     """WebSocket endpoint for real-time bot status updates"""
-    token = None
     user = None
 
     try:
-        await websocket.accept()
-        # Authentication
-        auth_data = await websocket.receive_json()
-        if auth_data.get("type") != "auth":
-            await websocket.send_json({"error": "Authentication required"})
-            await websocket.close()
+        user = await _ws_authenticate(websocket)
+        if not user:
             return
 
-        token = auth_data.get("token")
-        user = get_current_user_ws(token)
-        await manager.connect(websocket, user["id"])
-
-        await websocket.send_json(
-            {"type": "auth_success", "message": "Authenticated successfully"}
-        )
-
         logger.info(f"User {user['id']} connected to bot status updates")
 
-        # Send initial bot statuses
+        # Send initial bot statuses in a single frame
         bots = await trading_orchestrator.get_user_bots(user["id"])
-        for bot in bots:
-            await websocket.send_json(
-                {
-                    "type": "bot_status",
-                    "bot_id": bot["id"],
-                    "status": bot["status"],
-                    "last_update": bot.get("last_update"),
-                }
-            )
+        await _send_json(
+            websocket,
+            {
+                "type": "initial_bot_statuses",
+                "bots": [
+                    {
+                        "type": "bot_status",
+                        "bot_id": bot["id"],
+                        "status": bot["status"],
+                        "last_update": bot.get("last_update"),
+                    }
+                    for bot in bots
+                ],
+            }
+        )
 
         # Listen for status updates (in real implementation, this would be event-driven)
         while True:
             try:
-                data = await websocket.receive_json()
+                data = await _receive_json(websocket)
+                action = data.get("action")
 
-                if data.get("action") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                if action == "ping":
+                    await _send_json(websocket, {"type": "pong"})
 
-                elif data.get("action") == "get_status":
+                elif action == "get_status":
                     bot_id = data.get("bot_id")
                     if bot_id:
                         bot = await trading_orchestrator.get_bot_status(
                             user["id"], bot_id
                         )
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {"type": "bot_status", "bot_id": bot_id, "status": bot}
                         )
 
             except json.JSONDecodeError:
-                await websocket.send_json({"error": "Invalid JSON format"})
+                await _send_json(websocket, {"error": "Invalid JSON format"})
 
     except WebSocketDisconnect:
         logger.info("Bot status WebSocket disconnected")
     except Exception as e:
         logger.error(f"Error in bot status WebSocket: {e}")
         try:
-            await websocket.send_json({"error": str(e)})
+            await _send_json(websocket, {"error": str(e)})
         except:
             pass
     finally:
@@ -263,11 +414,24 @@ async def websocket_bot_status(websocket: WebSocket):
 @router.websocket("/ws/notifications")
 async def websocket_notifications(websocket: WebSocket):
     """WebSocket endpoint for real-time notifications"""
-    token = None
     user = None
+    # Pending notifications for this socket, filled by the listener and
+    # drained by the sender task so a slow client never stalls dispatch
+    outbox: asyncio.Queue = asyncio.Queue(maxsize=NOTIFICATION_OUTBOX_SIZE)
+    sender: Optional[asyncio.Task] = None
 
     async def notification_listener(notification: dict):
-        """Callback for new notifications.
+        """Callback for new notifications, queues without waiting on the socket"""
+        if sender is not None and sender.done():
+            # Slow client already dropped, nothing will drain the outbox
+            return
+        if outbox.full():
+            outbox.get_nowait()
+            logger.warning("Notification outbox full, dropping the oldest entry")
+        outbox.put_nowait(notification)
+
+    async def send_notification(notification: dict):
+        """Send one notification to the client.
 
         Enhancement: If the notification wraps a risk scenario (notification['data']['type'] == 'risk_scenario'),
         emit a dedicated 'risk_scenario' event for clients that subscribe specifically to scenario updates.
@@ -275,12 +439,13 @@ async def websocket_notifications(websocket: WebSocket):
         """
         try:
             # Always send the generic notification event
-            await websocket.send_json({"type": "notification", "data": notification})
+            await _send_json(websocket, {"type": "notification", "data": notification})
 
             # Conditional second event for risk scenario broadcasts
             inner = notification.get("data") or {}
             if inner.get("type") == "risk_scenario":
-                await websocket.send_json(
+                await _send_json(
+                    websocket,
                     {
                         "type": "risk_scenario",
                         "data": notification,  # mirror structure expected by frontend hook
@@ -289,61 +454,66 @@ async def websocket_notifications(websocket: WebSocket):
         except Exception as e:
             logger.error(f"Failed to send notification/risk_scenario to WebSocket: {e}")
 
+    async def deliver_notifications():
+        while True:
+            notification = await outbox.get()
+            try:
+                await asyncio.wait_for(
+                    send_notification(notification), NOTIFICATION_SEND_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Notification send timed out, dropping slow client")
+                # Closing ends the receive loop, whose finally removes the
+                # listener; the close itself is bounded in case the client
+                # is not reading at all
+                try:
+                    await asyncio.wait_for(
+                        websocket.close(code=1011), NOTIFICATION_SEND_TIMEOUT
+                    )
+                except Exception as e:
+                    logger.debug(f"Closing slow notification client failed: {e}")
+                manager.disconnect(websocket)
+                return
+
     try:
-        await websocket.accept()
-        # Authentication
-        auth_data = await websocket.receive_json()
-        if auth_data.get("type") != "auth":
-            await websocket.send_json({"error": "Authentication required"})
-            await websocket.close()
+        user = await _ws_authenticate(websocket)
+        if not user:
             return
 
-        token = auth_data.get("token")
-        user = get_current_user_ws(token)
-        await manager.connect(websocket, user["id"])
-
-        # Add listener for real-time notifications (if service available)
-        if notification_service:
-            await notification_service.add_listener(user["id"], notification_listener)
-
-        await websocket.send_json(
-            {"type": "auth_success", "message": "Authenticated successfully"}
-        )
-
-        logger.info(f"User {user['id']} connected to notifications")
-
-        # Send recent notifications (if service available)
         if notification_service:
-            notifications = await notification_service.get_recent_notifications(
-                user["id"], limit=20
-            )
-            await websocket.send_json(
-                {"type": "initial_notifications", "data": notifications}
-            )
-
-            # Send current unread count
-            unread_count = await notification_service.get_unread_count(user["id"])
-            await websocket.send_json(
-                {"type": "unread_count_update", "count": unread_count}
+            # Register for real-time notifications and load the initial state
+            # concurrently, the calls are independent
+            sender = asyncio.create_task(deliver_notifications())
+            _, notifications, unread_count = await asyncio.gather(
+                notification_service.add_listener(user["id"], notification_listener),
+                notification_service.get_recent_notifications(user["id"], limit=20),
+                notification_service.get_unread_count(user["id"]),
             )
         else:
             # Service not available, send empty data
-            await websocket.send_json(
-                {"type": "initial_notifications", "data": []}
-            )
-            await websocket.send_json(
-                {"type": "unread_count_update", "count": 0}
-            )
+            notifications, unread_count = [], 0
 
+        logger.info(f"User {user['id']} connected to notifications")
+
+        # Recent notifications and the unread count in one frame
+        await _send_json(
+            websocket,
+            {
+                "type": "initial_notifications",
+                "data": notifications,
+                "unread_count": unread_count,
+            }
+        )
 
         while True:
             try:
-                data = await websocket.receive_json()
+                data = await _receive_json(websocket)
+                action = data.get("action")
 
-                if data.get("action") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                if action == "ping":
+                    await _send_json(websocket, {"type": "pong"})
 
-                elif data.get("action") == "mark_read":
+                elif action == "mark_read":
                     if notification_service:
                         notification_id = data.get("notification_id")
                         if notification_id:
@@ -351,65 +521,70 @@ async def websocket_notifications(websocket: WebSocket):
                                 user["id"], notification_id
                             )
                             if success:
-                                await websocket.send_json(
+                                # Ack carries the updated unread count
+                                unread_count = await notification_service.get_unread_count(
+                                    user["id"]
+                                )
+                                await _send_json(
+                                    websocket,
                                     {
                                         "type": "notification_read",
                                         "notification_id": notification_id,
+                                        "unread_count": unread_count,
                                     }
                                 )
-                                # Send updated unread count
-                                unread_count = await notification_service.get_unread_count(
-                                    user["id"]
-                                )
-                                await websocket.send_json(
-                                    {"type": "unread_count_update", "count": unread_count}
-                                )
                     else:
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {"error": "Notification service unavailable"}
                         )
 
-                elif data.get("action") == "mark_all_read":
+                elif action == "mark_all_read":
                     if notification_service:
                         category = data.get("category")
-                        from ..services.notification_service import NotificationCategory
-
-                        category_enum = NotificationCategory(category) if category else None
+                        category_enum = (
+                            _NOTIFICATION_CATEGORIES.get(category) if category else None
+                        )
+                        if category and category_enum is None:
+                            # Same error NotificationCategory(category) raised
+                            raise ValueError(
+                                f"{category!r} is not a valid NotificationCategory"
+                            )
                         count = await notification_service.mark_all_as_read(
                             user["id"], category_enum
                         )
-
-                        await websocket.send_json(
+                        # Ack carries the updated unread count
+                        unread_count = await notification_service.get_unread_count(
+                            user["id"]
+                        )
+                        await _send_json(
+                            websocket,
                             {
                                 "type": "all_notifications_read",
                                 "count": count,
                                 "category": category,
+                                "unread_count": unread_count,
                             }
                         )
-                        # Send updated unread count
-                        unread_count = await notification_service.get_unread_count(
-                            user["id"]
-                        )
-                        await websocket.send_json(
-                            {"type": "unread_count_update", "count": unread_count}
-                        )
                     else:
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {"error": "Notification service unavailable"}
                         )
 
-                elif data.get("action") == "get_stats":
+                elif action == "get_stats":
                     if notification_service:
                         stats = await notification_service.get_notification_stats(
                             user["id"]
                         )
-                        await websocket.send_json({"type": "stats_update", "data": stats})
+                        await _send_json(websocket, {"type": "stats_update", "data": stats})
                     else:
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {"type": "stats_update", "data": {}}
                         )
 
-                elif data.get("action") == "delete":
+                elif action == "delete":
                     if notification_service:
                         notification_id = data.get("notification_id")
                         if notification_id:
@@ -417,33 +592,33 @@ async def websocket_notifications(websocket: WebSocket):
                                 user["id"], notification_id
                             )
                             if success:
-                                await websocket.send_json(
+                                # Ack carries the updated unread count
+                                unread_count = await notification_service.get_unread_count(
+                                    user["id"]
+                                )
+                                await _send_json(
+                                    websocket,
                                     {
                                         "type": "notification_deleted",
                                         "notification_id": notification_id,
+                                        "unread_count": unread_count,
                                     }
                                 )
-                                # Send updated unread count
-                                unread_count = await notification_service.get_unread_count(
-                                    user["id"]
-                                )
-                                await websocket.send_json(
-                                    {"type": "unread_count_update", "count": unread_count}
-                                )
                     else:
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {"error": "Notification service unavailable"}
                         )
 
             except json.JSONDecodeError:
-                await websocket.send_json({"error": "Invalid JSON format"})
+                await _send_json(websocket, {"error": "Invalid JSON format"})
 
     except WebSocketDisconnect:
         logger.info("Notifications WebSocket disconnected")
     except Exception as e:
         logger.error(f"Error in notifications WebSocket: {e}")
         try:
-            await websocket.send_json({"error": str(e)})
+            await _send_json(websocket, {"error": str(e)})
         except:
             pass
     finally:
@@ -452,6 +627,8 @@ async def websocket_notifications(websocket: WebSocket):
             await notification_service.remove_listener(
                 user["id"], notification_listener
             )
+        if sender:
+            sender.cancel()
         if websocket:
             manager.disconnect(websocket)
 
@@ -459,33 +636,21 @@ async def websocket_notifications(websocket: WebSocket):
 @router.websocket("/ws/performance-metrics")
 async def websocket_performance_metrics(websocket: WebSocket):
     """WebSocket endpoint for real-time performance metrics"""
-    token = None
     user = None
 
     try:
-        await websocket.accept()
-        # Authentication
-        auth_data = await websocket.receive_json()
-        if auth_data.get("type") != "auth":
-            await websocket.send_json({"error": "Authentication required"})
-            await websocket.close()
+        user = await _ws_authenticate(websocket)
+        if not user:
             return
 
-        token = auth_data.get("token")
-        user = get_current_user_ws(token)
-        await manager.connect(websocket, user["id"])
-
-        await websocket.send_json(
-            {"type": "auth_success", "message": "Authenticated successfully"}
-        )
-
         logger.info(f"User {user['id']} connected to performance metrics")
 
         # Send initial performance metrics
         trading_metrics = performance_monitor.get_trading_metrics()
         system_metrics = await performance_monitor.collect_system_metrics()
 
-        await websocket.send_json(
+        await _send_json(
+            websocket,
             {
                 "type": "initial_metrics",
                 "trading": trading_metrics.dict(),
@@ -495,38 +660,42 @@ async def websocket_performance_metrics(websocket: WebSocket):
 
         while True:
             try:
-                data = await websocket.receive_json()
+                data = await _receive_json(websocket)
+                action = data.get("action")
 
-                if data.get("action") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                if action == "ping":
+                    await _send_json(websocket, {"type": "pong"})
 
-                elif data.get("action") == "get_trading_metrics":
+                elif action == "get_trading_metrics":
                     trading_metrics = performance_monitor.get_trading_metrics()
-                    await websocket.send_json(
+                    await _send_json(
+                        websocket,
                         {
                             "type": "trading_metrics_update",
                             "data": trading_metrics.dict(),
                         }
                     )
 
-                elif data.get("action") == "get_system_metrics":
+                elif action == "get_system_metrics":
                     system_metrics = await performance_monitor.collect_system_metrics()
-                    await websocket.send_json(
+                    await _send_json(
+                        websocket,
                         {"type": "system_metrics_update", "data": system_metrics.dict()}
                     )
 
-                elif data.get("action") == "get_metrics_history":
+                elif action == "get_metrics_history":
                     hours = data.get("hours", 24)
                     history = await performance_monitor.get_metrics_history(hours)
-                    await websocket.send_json(
+                    await _send_json(
+                        websocket,
                         {"type": "metrics_history", "data": [m.dict() for m in history]}
                     )
 
-                elif data.get("action") == "get_system_health":
+                elif action == "get_system_health":
                     health = await performance_monitor.get_system_health()
-                    await websocket.send_json({"type": "system_health", "data": health})
+                    await _send_json(websocket, {"type": "system_health", "data": health})
 
-                elif data.get("action") == "start_streaming":
+                elif action == "start_streaming":
                     # Start periodic streaming
                     interval = data.get("interval", 30)  # Default 30 seconds
                     logger.info(
@@ -540,7 +709,8 @@ async def websocket_performance_metrics(websocket: WebSocket):
                                 await performance_monitor.collect_system_metrics()
                             )
 
-                            await websocket.send_json(
+                            await _send_json(
+                                websocket,
                                 {
                                     "type": "metrics_stream",
                                     "trading": trading_metrics.dict(),
@@ -556,19 +726,19 @@ async def websocket_performance_metrics(websocket: WebSocket):
                             logger.error(f"Error streaming metrics: {e}")
                             await asyncio.sleep(interval)
 
-                elif data.get("action") == "stop_streaming":
+                elif action == "stop_streaming":
                     logger.info(f"Stopping metrics streaming for user {user['id']}")
                     break
 
             except json.JSONDecodeError:
-                await websocket.send_json({"error": "Invalid JSON format"})
+                await _send_json(websocket, {"error": "Invalid JSON format"})
 
     except WebSocketDisconnect:
         logger.info("Performance metrics WebSocket disconnected")
     except Exception as e:
         logger.error(f"Error in performance metrics WebSocket: {e}")
         try:
-            await websocket.send_json({"error": str(e)})
+            await _send_json(websocket, {"error": str(e)})
         except:
             pass
     finally:
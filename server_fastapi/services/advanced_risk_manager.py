@@ -1,12 +1,19 @@
 import asyncio
-from typing import Dict, Any, List, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Any, List, Optional, Union
 from pydantic import BaseModel
 import logging
 from datetime import datetime
 import numpy as np
 
+from .market import indicators
+
 logger = logging.getLogger(__name__)
 
+# Take-profit multiple of the stop distance per market regime
+_RISK_REWARD_BY_REGIME = {"trending": 3.0, "ranging": 2.0, "volatile": 2.5}
+
 
 class RiskProfile(BaseModel):
     max_position_size: float
@@ -33,6 +40,34 @@ class Trade(BaseModel):
     pnl: Optional[float] = None
 
 
+@dataclass(frozen=True, slots=True)
+class MarketConditions:
+    """Market regime inputs to the risk calculations"""
+
+    regime: str = "normal"
+    volatility: float = 0.02
+    trend_strength: float = 0.5
+    volume_level: str = "medium"
+    liquidity_sufficient: bool = True
+
+    @classmethod
+    def from_dict(cls, conditions: Dict[str, Any]) -> "MarketConditions":
+        """Build from the nested dict shape used by callers"""
+        return cls(
+            regime=conditions.get("regime", "normal"),
+            volatility=conditions.get("volatility", 0.02),
+            trend_strength=conditions.get("trend", {}).get("strength", 0.5),
+            volume_level=conditions.get("volume", {}).get("level", "medium"),
+            liquidity_sufficient=conditions.get("liquidity", {}).get(
+                "sufficient", True
+            ),
+        )
+
+
+# Mock market conditions - in real implementation, get from market analyzer
+_DEFAULT_MARKET_CONDITIONS = MarketConditions(trend_strength=0.6)
+
+
 class MarketData(BaseModel):
     timestamp: int
     open: float
@@ -50,7 +85,11 @@ class AdvancedRiskManager:
             raise Exception("AdvancedRiskManager is a singleton class")
 
         self.historical_data: List[MarketData] = []
-        self.recent_trades: List[Trade] = []
+        self.max_trades_history = 1000
+        # Bounded history, the oldest trade is evicted on append
+        self.recent_trades: Deque[Trade] = deque(maxlen=self.max_trades_history)
+        # Kelly fraction only changes when a trade is added
+        self._kelly_fraction: Optional[float] = None
         self.risk_metrics = RiskMetrics(
             current_risk=0.0,
             historical_volatility=0.0,
@@ -59,7 +98,6 @@ class AdvancedRiskManager:
             kelly_fraction=0.5,
         )
 
-        self.max_trades_history = 1000
         self.risk_update_interval = 5 * 60  # 5 minutes in seconds
         self.update_task: Optional[asyncio.Task] = None
 
@@ -99,9 +137,14 @@ class AdvancedRiskManager:
                 await asyncio.sleep(self.risk_update_interval)
 
     async def calculate_optimal_risk_profile(
-        self, current_price: float, volatility: float, market_conditions: Dict[str, Any]
+        self,
+        current_price: float,
+        volatility: float,
+        market_conditions: Union[MarketConditions, Dict[str, Any]],
     ) -> RiskProfile:
         """Calculate optimal risk profile based on current market conditions"""
+        if isinstance(market_conditions, dict):
+            market_conditions = MarketConditions.from_dict(market_conditions)
         metrics = self.risk_metrics
         kelly_fraction = self.calculate_kelly_fraction()
 
@@ -133,18 +176,32 @@ class AdvancedRiskManager:
 
     def calculate_kelly_fraction(self) -> float:
         """Calculate Kelly fraction based on trading performance"""
+        if self._kelly_fraction is None:
+            self._kelly_fraction = self._compute_kelly_fraction()
+        return self._kelly_fraction
+
+    def _compute_kelly_fraction(self) -> float:
         if len(self.recent_trades) < 10:
             return 0.1  # Default conservative value
 
-        wins = [t for t in self.recent_trades if t.pnl and t.pnl > 0]
-        losses = [t for t in self.recent_trades if t.pnl and t.pnl <= 0]
-
-        if not losses:
+        # Single pass over the history for both sides
+        win_count = loss_count = 0
+        win_total = loss_total = 0.0
+        for t in self.recent_trades:
+            if t.pnl:
+                if t.pnl > 0:
+                    win_count += 1
+                    win_total += t.pnl
+                else:
+                    loss_count += 1
+                    loss_total += t.pnl
+
+        if not loss_count:
             return 0.1  # Avoid division by zero
 
-        win_rate = len(wins) / len(self.recent_trades)
-        avg_win = sum(t.pnl for t in wins) / len(wins) if wins else 0
-        avg_loss = abs(sum(t.pnl for t in losses) / len(losses)) if losses else 0
+        win_rate = win_count / len(self.recent_trades)
+        avg_win = win_total / win_count if win_count else 0
+        avg_loss = abs(loss_total / loss_count)
 
         if avg_loss == 0:
             return 0.1  # Avoid division by zero
@@ -158,51 +215,36 @@ class AdvancedRiskManager:
         return max(0.0, min(kelly_fraction, 0.5))
 
     def calculate_dynamic_stop_loss(
-        self, volatility: float, market_conditions: Dict[str, Any]
+        self, volatility: float, market_conditions: MarketConditions
     ) -> float:
         """Calculate dynamic stop loss based on volatility and market conditions"""
         # Base stop loss on volatility (simplified ATR)
         stop_loss = volatility * 2
 
         # Adjust for market conditions
-        regime = market_conditions.get("regime", "normal")
-        if regime == "volatile":
+        if market_conditions.regime == "volatile":
             stop_loss *= 1.5
 
         # Ensure minimum stop loss
         return max(stop_loss, 0.01)
 
-    def calculate_risk_reward_ratio(self, market_conditions: Dict[str, Any]) -> float:
+    def calculate_risk_reward_ratio(self, market_conditions: MarketConditions) -> float:
         """Calculate risk-reward ratio based on market regime"""
-        regime = market_conditions.get("regime", "normal")
-
-        # Base RR ratio on market regime
-        if regime == "trending":
-            return 3.0  # Higher reward target in trending markets
-        elif regime == "ranging":
-            return 2.0  # Lower targets in ranging markets
-        elif regime == "volatile":
-            return 2.5  # Balanced in volatile markets
-        else:
-            return 2.0
+        # Higher targets when trending, balanced when volatile, lower otherwise
+        return _RISK_REWARD_BY_REGIME.get(market_conditions.regime, 2.0)
 
-    def calculate_entry_confidence(self, market_conditions: Dict[str, Any]) -> float:
+    def calculate_entry_confidence(self, market_conditions: MarketConditions) -> float:
         """Calculate entry confidence score"""
         confidence = 0.5  # Base confidence
 
         # Adjust for market conditions
-        trend_strength = market_conditions.get("trend", {}).get("strength", 0.5)
-        if trend_strength > 0.7:
+        if market_conditions.trend_strength > 0.7:
             confidence += 0.2
 
-        volume_level = market_conditions.get("volume", {}).get("level", "medium")
-        if volume_level == "high":
+        if market_conditions.volume_level == "high":
             confidence += 0.1
 
-        liquidity_sufficient = market_conditions.get("liquidity", {}).get(
-            "sufficient", True
-        )
-        if not liquidity_sufficient:
+        if not market_conditions.liquidity_sufficient:
             confidence -= 0.3
 
         # Ensure bounds
@@ -211,19 +253,12 @@ class AdvancedRiskManager:
     async def update_risk_assessment(self):
         """Update comprehensive risk assessment"""
         try:
-            # Mock market conditions - in real implementation, get from market analyzer
-            market_conditions = {
-                "regime": "normal",
-                "volatility": 0.02,
-                "trend": {"strength": 0.6},
-                "volume": {"level": "medium"},
-                "liquidity": {"sufficient": True},
-            }
+            market_conditions = _DEFAULT_MARKET_CONDITIONS
 
             # Update risk metrics
             self.risk_metrics = RiskMetrics(
                 current_risk=self.calculate_current_risk(),
-                historical_volatility=market_conditions["volatility"],
+                historical_volatility=market_conditions.volatility,
                 expected_drawdown=self.calculate_expected_drawdown(),
                 optimal_leverage=self.calculate_optimal_leverage(),
                 kelly_fraction=self.calculate_kelly_fraction(),
@@ -280,14 +315,16 @@ class AdvancedRiskManager:
             return 0.2  # Default
 
         # Calculate rolling volatility from price data
-        returns = []
-        for i in range(1, len(self.historical_data)):
-            ret = np.log(
-                self.historical_data[i].close / self.historical_data[i - 1].close
-            )
-            returns.append(ret)
-
-        volatility = np.std(returns) if returns else 0.02
+        closes = np.fromiter(
+            (bar.close for bar in self.historical_data),
+            dtype=np.float64,
+            count=len(self.historical_data),
+        )
+        if indicators.JIT_ENABLED:
+            # Compiled single pass, no intermediate return arrays
+            volatility = float(indicators.log_return_std(closes))
+        else:
+            volatility = float(np.std(np.diff(np.log(closes))))
         expected_drawdown = volatility * 2.5  # 2.5 sigma event
 
         return min(0.5, max(0.05, expected_drawdown))
@@ -345,8 +382,7 @@ class AdvancedRiskManager:
     def add_trade(self, trade: Trade):
         """Add a trade to the recent trades history"""
         self.recent_trades.append(trade)
-        if len(self.recent_trades) > self.max_trades_history:
-            self.recent_trades.pop(0)
+        self._kelly_fraction = None
 
     def get_risk_metrics(self) -> RiskMetrics:
         """Get current risk metrics"""
@@ -357,5 +393,8 @@ class AdvancedRiskManager:
         await self.stop_risk_updates()
 
 
-# Global instance
-advanced_risk_manager = AdvancedRiskManager.get_instance()
+# Global instance, created on first access rather than at import
+def __getattr__(name):
+    if name == "advanced_risk_manager":
+        return AdvancedRiskManager.get_instance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 import json
 import os
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Optional
 from pydantic import BaseModel
 import logging
@@ -31,20 +32,20 @@ CACHE_CONFIG = {
 
 
 class MemoryCache:
-    """In-memory cache with TTL support as Redis fallback"""
+    """In-memory LRU cache with per-entry TTL as Redis fallback"""
 
     def __init__(self, max_size: int = CACHE_CONFIG["max_memory_entries"]):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        # Insertion/access order doubles as LRU order, so eviction is O(1)
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.max_size = max_size
 
     def set(self, key: str, value: Any, ttl: int = CACHE_CONFIG["default_ttl"]):
         """Set cache entry with TTL"""
-        if len(self.cache) >= self.max_size:
-            # Remove oldest entry
-            oldest_key = min(
-                self.cache.keys(), key=lambda k: self.cache[k]["expires_at"]
-            )
-            del self.cache[oldest_key]
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # Remove least recently used entry
+            self.cache.popitem(last=False)
 
         expires_at = time.time() + ttl
         self.cache[key] = {"value": value, "expires_at": expires_at}
@@ -53,6 +54,7 @@ class MemoryCache:
         """Get cache entry if not expired"""
         entry = self.cache.get(key)
         if entry and time.time() < entry["expires_at"]:
+            self.cache.move_to_end(key)
             return entry["value"]
         elif entry:
             del self.cache[key]  # Remove expired entry
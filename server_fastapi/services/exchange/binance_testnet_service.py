@@ -3,14 +3,23 @@ Binance Testnet Service for Safe Testing
 Provides complete testnet integration for validating trading strategies without risk
 """
 
-import ccxt
+import asyncio
+import aiohttp
+import ccxt.async_support as ccxt
+import certifi
 import logging
-from typing import Dict, List, Optional, Any
+import ssl
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
+# How long fetched market/account data is reused, in seconds
+TICKER_CACHE_TTL = 0.2
+BALANCE_CACHE_TTL = 0.5
+
 
 class BinanceTestnetService:
     """
@@ -31,19 +40,28 @@ class BinanceTestnetService:
         )
         self.api_key = os.getenv("BINANCE_TESTNET_API_KEY", "")
         self.secret_key = os.getenv("BINANCE_TESTNET_SECRET_KEY", "")
+        # key -> (monotonic fetch time, raw exchange response)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # key -> fetch in progress, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        self.session: Optional[aiohttp.ClientSession] = None
 
         if self.testnet_enabled and self.api_key and self.secret_key:
             try:
-                self.exchange = ccxt.binance(
-                    {
-                        "apiKey": self.api_key,
-                        "secret": self.secret_key,
-                        "options": {
-                            "defaultType": "spot",
-                            "test": True,  # Enable testnet mode
-                        },
-                    }
-                )
+                config = {
+                    "apiKey": self.api_key,
+                    "secret": self.secret_key,
+                    "enableRateLimit": True,
+                    "options": {
+                        "defaultType": "spot",
+                        "test": True,  # Enable testnet mode
+                    },
+                }
+                self.session = self._create_session()
+                if self.session is not None:
+                    config["session"] = self.session
+                self.exchange = ccxt.binance(config)
                 logger.info("Binance Testnet Service initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Binance Testnet: {e}")
@@ -54,6 +72,60 @@ class BinanceTestnetService:
                 "Binance Testnet not configured. Set BINANCE_TESTNET_API_KEY and BINANCE_TESTNET_SECRET_KEY"
             )
 
+    @staticmethod
+    def _create_session() -> Optional[aiohttp.ClientSession]:
+        """HTTP session that keeps exchange connections and DNS answers warm
+
+        ccxt's own session drops idle connections after 15s and re-resolves
+        DNS every 10s, so sporadic requests keep paying for new TLS
+        handshakes. aiohttp needs a running loop; without one (construction
+        outside the server) ccxt falls back to opening its own session.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        connector = aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            limit=100,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    async def _fetch_cached(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a response younger than ttl, or join/start a single fetch
+
+        Concurrent callers for the same key share one request to the exchange.
+        The shared fetch is shielded, so a cancelled caller does not cancel it
+        for the others.
+        """
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._store_fetch(key, t))
+        return await asyncio.shield(task)
+
+    def _store_fetch(self, key: str, task: asyncio.Task) -> None:
+        # A fetch superseded by _invalidate must not repopulate the cache
+        if self._inflight.get(key) is not task:
+            return
+        del self._inflight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._cache[key] = (time.monotonic(), task.result())
+
+    def _invalidate(self, key: str) -> None:
+        self._cache.pop(key, None)
+        self._inflight.pop(key, None)
+
     async def create_market_order(
         self,
         symbol: str,
@@ -83,10 +155,11 @@ class BinanceTestnetService:
             }
 
         try:
-            order = self.exchange.create_market_order(
+            order = await self.exchange.create_market_order(
                 symbol=symbol, side=side, amount=quantity
             )
 
+            self._invalidate("balance")
             logger.info(
                 f"Testnet market order created: {symbol} {side} {quantity} - Order ID: {order['id']}"
             )
@@ -127,10 +200,11 @@ class BinanceTestnetService:
             return {"success": False, "error": "Testnet not configured"}
 
         try:
-            order = self.exchange.create_limit_order(
+            order = await self.exchange.create_limit_order(
                 symbol=symbol, side=side, amount=quantity, price=price
             )
 
+            self._invalidate("balance")
             logger.info(
                 f"Testnet limit order created: {symbol} {side} {quantity} @ {price}"
             )
@@ -156,7 +230,8 @@ class BinanceTestnetService:
             return {"success": False, "error": "Testnet not configured"}
 
         try:
-            result = self.exchange.cancel_order(order_id, symbol)
+            result = await self.exchange.cancel_order(order_id, symbol)
+            self._invalidate("balance")
             logger.info(f"Testnet order cancelled: {order_id}")
             return {"success": True, "order_id": order_id, "result": result}
         except Exception as e:
@@ -169,7 +244,9 @@ class BinanceTestnetService:
             return {"success": False, "error": "Testnet not configured"}
 
         try:
-            balance = self.exchange.fetch_balance()
+            balance = await self._fetch_cached(
+                "balance", BALANCE_CACHE_TTL, self.exchange.fetch_balance
+            )
 
             # Format balance data
             formatted_balance = {}
@@ -200,9 +277,9 @@ class BinanceTestnetService:
 
         try:
             if symbol:
-                orders = self.exchange.fetch_orders(symbol, limit=limit)
+                orders = await self.exchange.fetch_orders(symbol, limit=limit)
             else:
-                orders = self.exchange.fetch_orders(limit=limit)
+                orders = await self.exchange.fetch_orders(limit=limit)
 
             return {"success": True, "orders": orders, "count": len(orders)}
 
@@ -217,9 +294,9 @@ class BinanceTestnetService:
 
         try:
             if symbol:
-                orders = self.exchange.fetch_open_orders(symbol)
+                orders = await self.exchange.fetch_open_orders(symbol)
             else:
-                orders = self.exchange.fetch_open_orders()
+                orders = await self.exchange.fetch_open_orders()
 
             return {"success": True, "orders": orders, "count": len(orders)}
 
@@ -233,7 +310,11 @@ class BinanceTestnetService:
             return {"success": False, "error": "Testnet not configured"}
 
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
+            ticker = await self._fetch_cached(
+                f"ticker:{symbol}",
+                TICKER_CACHE_TTL,
+                lambda: self.exchange.fetch_ticker(symbol),
+            )
             return {
                 "success": True,
                 "symbol": symbol,
@@ -259,9 +340,10 @@ class BinanceTestnetService:
             }
 
         try:
-            # Test connection by fetching server time
-            server_time = self.exchange.fetch_time()
-            balance = await self.get_balance()
+            # Test connection by fetching server time and balance together
+            server_time, balance = await asyncio.gather(
+                self.exchange.fetch_time(), self.get_balance()
+            )
 
             return {
                 "success": True,
@@ -274,6 +356,15 @@ class BinanceTestnetService:
             logger.error(f"Testnet validation failed: {e}")
             return {"success": False, "connected": False, "error": str(e)}
 
+    async def close(self) -> None:
+        """Close the exchange client and its HTTP session"""
+        if self.exchange:
+            await self.exchange.close()
+        # ccxt leaves sessions it was given open
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
 
 # Singleton instance
 _binance_testnet_service = None
@@ -285,3 +376,9 @@ def get_binance_testnet_service() -> BinanceTestnetService:
     if _binance_testnet_service is None:
         _binance_testnet_service = BinanceTestnetService()
     return _binance_testnet_service
+
+
+async def close_binance_testnet_service() -> None:
+    """Close the singleton's exchange session if it was ever created"""
+    if _binance_testnet_service is not None:
+        await _binance_testnet_service.close()
@@ -1,7 +1,9 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import json
 
 # Create logs directory if it doesn't exist
@@ -45,14 +47,31 @@ combined_handler = RotatingFileHandler(
 combined_handler.setLevel(logging.INFO)
 combined_handler.setFormatter(json_formatter)
 
+# Callers only enqueue records; a background thread formats and writes them
+# so file I/O never runs on the event loop
+log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+queue_listener = QueueListener(
+    log_queue, error_handler, combined_handler, respect_handler_level=True
+)
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
 # Add handlers to logger
-logger.addHandler(error_handler)
-logger.addHandler(combined_handler)
+logger.addHandler(QueueHandler(log_queue))
 
 # Prevent duplicate logs
 logger.propagate = False
 
 
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
 class LoggerService:
     """Logger service with Winston-like functionality for FastAPI"""
 
@@ -77,16 +96,7 @@ class LoggerService:
 
     def log(self, level: str, message: str, extra: dict = None):
         """Generic log method"""
-        if level.lower() == "info":
-            self.info(message, extra)
-        elif level.lower() == "warn" or level.lower() == "warning":
-            self.warn(message, extra)
-        elif level.lower() == "error":
-            self.error(message, extra)
-        elif level.lower() == "debug":
-            self.debug(message, extra)
-        else:
-            self.info(message, extra)
+        self.logger.log(_LEVELS.get(level.lower(), logging.INFO), message, extra=extra)
 
 
 # Export singleton instance
@@ -0,0 +1,203 @@
+"""
+Technical indicator kernels (RSI, MACD, Bollinger Bands, log-return volatility,
+next-bar direction labels) over close-price arrays.
+Compiled with Numba when it is installed, plain NumPy/Python loops otherwise;
+callers check JIT_ENABLED and use the vectorized *_numpy variants when the
+kernels would run as Python.
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import config as numba_config, njit, prange
+
+    NUMBA_AVAILABLE = True
+    # main.py disables the JIT by default, in which case kernels run as Python
+    JIT_ENABLED = not numba_config.DISABLE_JIT
+except ImportError:  # pragma: no cover - depends on optional install
+    NUMBA_AVAILABLE = False
+    JIT_ENABLED = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def rsi(close: np.ndarray, period: int) -> float:
+    """Latest RSI using Wilder smoothing. Requires len(close) > period."""
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = close[i] - close[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, close.shape[0]):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+
+    if avg_loss == 0.0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def macd(
+    close: np.ndarray, fast: int, slow: int, signal: int
+) -> Tuple[float, float, float]:
+    """Latest (macd, signal, histogram) using EMAs seeded with the first close"""
+    fast_alpha = 2.0 / (fast + 1)
+    slow_alpha = 2.0 / (slow + 1)
+    signal_alpha = 2.0 / (signal + 1)
+
+    fast_ema = close[0]
+    slow_ema = close[0]
+    signal_ema = 0.0
+    macd_value = 0.0
+    for i in range(close.shape[0]):
+        fast_ema += (close[i] - fast_ema) * fast_alpha
+        slow_ema += (close[i] - slow_ema) * slow_alpha
+        macd_value = fast_ema - slow_ema
+        if i == 0:
+            signal_ema = macd_value
+        else:
+            signal_ema += (macd_value - signal_ema) * signal_alpha
+
+    return macd_value, signal_ema, macd_value - signal_ema
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def bollinger(close: np.ndarray, period: int, k: float) -> Tuple[float, float, float]:
+    """(upper, middle, lower) bands over the last `period` closes (population std)"""
+    n = close.shape[0]
+    start = n - period
+    middle = 0.0
+    for i in range(start, n):
+        middle += close[i]
+    middle /= period
+
+    variance = 0.0
+    for i in range(start, n):
+        diff = close[i] - middle
+        variance += diff * diff
+    std = np.sqrt(variance / period)
+
+    return middle + k * std, middle, middle - k * std
+
+
+def rsi_numpy(close: np.ndarray, period: int) -> float:
+    """Vectorized rsi(); the Wilder recursion is an EWM with alpha=1/period"""
+    changes = np.diff(close)
+    gains = np.maximum(changes, 0.0)
+    losses = np.maximum(-changes, 0.0)
+    alpha = 1.0 / period
+    # Seeded with the plain mean of the first `period` changes, like rsi()
+    avg_gain = (
+        pd.Series(np.concatenate(([gains[:period].mean()], gains[period:])))
+        .ewm(alpha=alpha, adjust=False)
+        .mean()
+        .iat[-1]
+    )
+    avg_loss = (
+        pd.Series(np.concatenate(([losses[:period].mean()], losses[period:])))
+        .ewm(alpha=alpha, adjust=False)
+        .mean()
+        .iat[-1]
+    )
+    if avg_loss == 0.0:
+        return 100.0
+    return float(100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+
+
+def macd_numpy(
+    close: np.ndarray, fast: int, slow: int, signal: int
+) -> Tuple[float, float, float]:
+    """Vectorized macd(), same EMAs seeded with the first close"""
+    series = pd.Series(close)
+    macd_line = (
+        series.ewm(span=fast, adjust=False).mean()
+        - series.ewm(span=slow, adjust=False).mean()
+    )
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    macd_value = float(macd_line.iat[-1])
+    signal_value = float(signal_line.iat[-1])
+    return macd_value, signal_value, macd_value - signal_value
+
+
+def bollinger_numpy(
+    close: np.ndarray, period: int, k: float
+) -> Tuple[float, float, float]:
+    """Vectorized bollinger()"""
+    window = close[-period:]
+    middle = float(window.mean())
+    std = float(window.std())
+    return middle + k * std, middle, middle - k * std
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def log_return_std(close: np.ndarray) -> float:
+    """Population std of log returns, in one pass without temporary arrays"""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, close.shape[0]):
+        ret = np.log(close[i] / close[i - 1])
+        count += 1
+        delta = ret - mean
+        mean += delta / count
+        m2 += delta * (ret - mean)
+    if count == 0:
+        return 0.0
+    return np.sqrt(m2 / count)
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def direction_labels(close: np.ndarray, threshold: float) -> np.ndarray:
+    """int8 label per bar from the move to the next close: 0=up, 1=down, 2=flat
+
+    A move counts when it exceeds threshold as a fraction of the current close.
+    Returns len(close) - 1 labels.
+    """
+    n = max(close.shape[0] - 1, 0)
+    out = np.empty(n, np.int8)
+    for i in prange(n):
+        change = (close[i + 1] - close[i]) / close[i]
+        if change > threshold:
+            out[i] = 0
+        elif change < -threshold:
+            out[i] = 1
+        else:
+            out[i] = 2
+    return out
+
+
+def warmup() -> None:
+    """Compile the kernels ahead of the first request"""
+    sample = np.linspace(1.0, 2.0, 50)
+    rsi(sample, 14)
+    macd(sample, 12, 26, 9)
+    bollinger(sample, 20, 2.0)
+    log_return_std(sample)
+    direction_labels(sample, 0.002)
+    if NUMBA_AVAILABLE:
+        logger.info("Technical indicator kernels compiled with Numba")
@@ -1,96 +1,173 @@
 import asyncio
-import random
-from typing import AsyncGenerator, Dict, Any, List
+from typing import AsyncGenerator, Dict, Any, List, Optional
 import time
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+MOCK_SYMBOLS = ["BTC/USD", "ETH/USD", "ADA/USD", "SOL/USD", "DOT/USD"]
+
+_BASE_PRICES: Dict[str, float] = {
+    "BTC/USD": 45000,
+    "ETH/USD": 2800,
+    "ADA/USD": 0.45,
+    "SOL/USD": 120,
+    "DOT/USD": 8.50,
+}
+
+_MOCK_BASES = np.array([_BASE_PRICES[symbol] for symbol in MOCK_SYMBOLS])
+
+
 class MarketDataService:
-    def __init__(self):
+    def __init__(self, exchange: Optional[Any] = None):
+        # Optional ccxt.pro client; without one the stream falls back to mock ticks
+        self.exchange = exchange
         self.subscribed_symbols = set()
         self.is_streaming = False
+        self._rng = np.random.default_rng()
         # Simple in-memory candle cache per symbol: list of (ts, open, high, low, close, volume)
         self.candles: Dict[str, List[List[float]]] = {}
 
     async def stream_market_data(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Stream real-time market data updates"""
         logger.info("Starting market data stream")
-
-        # Mock market data for demonstration
-        symbols = ["BTC/USD", "ETH/USD", "ADA/USD", "SOL/USD", "DOT/USD"]
         self.is_streaming = True
+        source = self._watch() if self.exchange is not None else self._mock_ticks()
 
         try:
-            while self.is_streaming:
-                # Generate mock price updates
-                for symbol in symbols:
-                    price_change = random.uniform(-0.02, 0.02)  # -2% to +2% change
-                    base_price = self._get_base_price(symbol)
-                    new_price = base_price * (1 + price_change)
-
-                    update = {
-                        "type": "market_data",
-                        "symbol": symbol,
-                        "price": round(new_price, 4),
-                        "change": round(price_change * 100, 2),  # percentage
-                        "volume": random.randint(1000, 10000),
-                        "timestamp": int(time.time() * 1000),
-                    }
-
-                    # Update simple 1m candle (mock aggregation)
-                    ts_minute = update["timestamp"] - (update["timestamp"] % 60_000)
-                    bucket = self.candles.setdefault(symbol, [])
-                    if bucket and bucket[-1][0] == ts_minute:
-                        # mutate existing candle
-                        candle = bucket[-1]
-                        candle[2] = max(candle[2], update["price"])  # high
-                        candle[3] = min(candle[3], update["price"])  # low
-                        candle[4] = update["price"]  # close
-                        candle[5] += update["volume"]
-                    else:
-                        # open new candle
-                        bucket.append(
-                            [
-                                ts_minute,  # 0 timestamp ms
-                                update["price"],  # 1 open
-                                update["price"],  # 2 high
-                                update["price"],  # 3 low
-                                update["price"],  # 4 close
-                                update["volume"],  # 5 volume
-                            ]
-                        )
-                        # Keep only last 500 candles
-                        if len(bucket) > 500:
-                            del bucket[0 : len(bucket) - 500]
-
-                    yield update
-
-                await asyncio.sleep(1)  # Update every second
+            async for update in source:
+                self._update_candle(update)
+                yield update
 
         except Exception as e:
             logger.error(f"Error in market data stream: {e}")
             raise
         finally:
+            await source.aclose()
             logger.info("Market data stream ended")
 
-    def _get_base_price(self, symbol: str) -> float:
-        """Get base price for a symbol (mock implementation)"""
-        base_prices = {
-            "BTC/USD": 45000,
-            "ETH/USD": 2800,
-            "ADA/USD": 0.45,
-            "SOL/USD": 120,
-            "DOT/USD": 8.50,
+    async def _watch(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield ticker updates as the exchange pushes them over its WebSocket
+
+        Uses a single watch_tickers subscription when the exchange supports
+        it, otherwise one watch_ticker task per symbol. Either way nothing is
+        yielded until a ticker actually changes.
+        """
+        if self.exchange.has.get("watchTickers"):
+            while self.is_streaming:
+                symbols = sorted(self.subscribed_symbols or MOCK_SYMBOLS)
+                tickers = await self.exchange.watch_tickers(symbols)
+                for symbol, ticker in tickers.items():
+                    update = self._ticker_update(symbol, ticker)
+                    if update is not None:
+                        yield update
+            return
+
+        tasks: Dict[str, asyncio.Task] = {}
+        try:
+            while self.is_streaming:
+                symbols = self.subscribed_symbols or set(MOCK_SYMBOLS)
+                for symbol in set(tasks) - symbols:
+                    tasks.pop(symbol).cancel()
+                for symbol in symbols - set(tasks):
+                    tasks[symbol] = asyncio.create_task(
+                        self.exchange.watch_ticker(symbol)
+                    )
+
+                done, _ = await asyncio.wait(
+                    tasks.values(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for symbol, task in list(tasks.items()):
+                    if task not in done:
+                        continue
+                    del tasks[symbol]
+                    update = self._ticker_update(symbol, task.result())
+                    if update is not None:
+                        yield update
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def _mock_ticks(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """Generate random price updates for MOCK_SYMBOLS once a second"""
+        count = len(MOCK_SYMBOLS)
+        while self.is_streaming:
+            # One draw per tick for every symbol; tolist() gives JSON-ready floats
+            changes = self._rng.uniform(-0.02, 0.02, count)  # -2% to +2% change
+            prices = np.round(_MOCK_BASES * (1 + changes), 4).tolist()
+            percents = np.round(changes * 100, 2).tolist()
+            volumes = self._rng.integers(1000, 10001, count).tolist()
+            timestamp = int(time.time() * 1000)
+
+            for symbol, price, change, volume in zip(
+                MOCK_SYMBOLS, prices, percents, volumes
+            ):
+                yield {
+                    "type": "market_data",
+                    "symbol": symbol,
+                    "price": price,
+                    "change": change,  # percentage
+                    "volume": volume,
+                    "timestamp": timestamp,
+                }
+
+            await asyncio.sleep(1)  # Update every second
+
+    @staticmethod
+    def _ticker_update(symbol: str, ticker: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert a ccxt ticker into a market_data update (None without a price)"""
+        price = ticker.get("last")
+        if price is None:
+            return None
+        return {
+            "type": "market_data",
+            "symbol": symbol,
+            "price": price,
+            "change": round(ticker.get("percentage") or 0.0, 2),
+            "volume": ticker.get("baseVolume") or 0,
+            "timestamp": ticker.get("timestamp") or int(time.time() * 1000),
         }
-        return base_prices.get(symbol, 100.0)
+
+    def _update_candle(self, update: Dict[str, Any]) -> None:
+        """Fold an update into the symbol's 1m candle (mock aggregation)"""
+        ts_minute = update["timestamp"] - (update["timestamp"] % 60_000)
+        bucket = self.candles.setdefault(update["symbol"], [])
+        if bucket and bucket[-1][0] == ts_minute:
+            # mutate existing candle
+            candle = bucket[-1]
+            candle[2] = max(candle[2], update["price"])  # high
+            candle[3] = min(candle[3], update["price"])  # low
+            candle[4] = update["price"]  # close
+            candle[5] += update["volume"]
+        else:
+            # open new candle
+            bucket.append(
+                [
+                    ts_minute,  # 0 timestamp ms
+                    update["price"],  # 1 open
+                    update["price"],  # 2 high
+                    update["price"],  # 3 low
+                    update["price"],  # 4 close
+                    update["volume"],  # 5 volume
+                ]
+            )
+            # Keep only last 500 candles
+            if len(bucket) > 500:
+                del bucket[0 : len(bucket) - 500]
 
     def stop_streaming(self):
         """Stop the market data stream"""
         self.is_streaming = False
         logger.info("Market data streaming stopped")
 
+    async def close(self) -> None:
+        """Close the exchange WebSocket client, if any"""
+        if self.exchange is not None:
+            await self.exchange.close()
+
     async def get_backfill(self, symbol: str, since_ms: int) -> List[List[float]]:
         """Return candles for a symbol since given millisecond timestamp."""
         candles = self.candles.get(symbol, [])
@@ -219,10 +219,9 @@ class AdaptiveLearningService:
             if len(patterns) < min_occurrences:
                 continue
 
-            successful = [p for p in patterns if p["successful"]]
-            failed = [p for p in patterns if not p["successful"]]
+            successful = sum(1 for p in patterns if p["successful"])
 
-            success_rate = len(successful) / len(patterns) * 100
+            success_rate = successful / len(patterns) * 100
             avg_profit = np.mean([p["pnl"] for p in patterns]) if patterns else 0.0
 
             results.append(
@@ -231,7 +230,8 @@ class AdaptiveLearningService:
                     "success_rate": success_rate,
                     "avg_profit": avg_profit,
                     "occurrences": len(patterns),
-                    "last_seen": max(p["timestamp"] for p in patterns).isoformat(),
+                    # Appended with datetime.now(), so the newest entry is last
+                    "last_seen": patterns[-1]["timestamp"].isoformat(),
                     "recommendation": self.get_recommendation(pattern_key),
                 }
             )
@@ -1,10 +1,15 @@
 from typing import Dict, Any, List, Optional, Tuple
 import asyncio
+import inspect
 import logging
+import numpy as np
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+_ACTIONS = ("buy", "sell", "hold")
+_ACTION_INDEX = {action: i for i, action in enumerate(_ACTIONS)}
+
 
 class EnsemblePrediction(BaseModel):
     action: str  # 'buy', 'sell', 'hold'
@@ -25,7 +30,13 @@ class EnsembleEngine:
     def __init__(self):
         self.q_learning_engine = None
         self.neural_network_engine = None
-        self.q_table: Dict[str, Dict[str, float]] = {}
+        # Q-table stored as state key -> row of a (capacity, 3) array whose
+        # columns follow _ACTIONS; rows past len(_q_index) are unused
+        self._q_index: Dict[str, int] = {}
+        self._q_values = np.zeros((64, len(_ACTIONS)))
+        # Confidence per known state, dropped when that state's row changes;
+        # bounded by the number of Q-table rows
+        self._confidence_cache: Dict[str, float] = {}
 
         # Import the engines dynamically to avoid circular imports
         try:
@@ -47,9 +58,35 @@ class EnsembleEngine:
             except AttributeError:
                 logger.warning("Neural network engine does not have load_model method")
 
+    @property
+    def q_table(self) -> Dict[str, Dict[str, float]]:
+        """Q-table as nested dicts (a copy, for inspection and export)"""
+        return {
+            state_key: dict(zip(_ACTIONS, self._q_values[row].tolist()))
+            for state_key, row in self._q_index.items()
+        }
+
     def set_q_table(self, q_table: Dict[str, Dict[str, float]]) -> None:
         """Set the Q-table for Q-learning predictions"""
-        self.q_table = q_table
+        # Build the values first so the index never points past them
+        q_values_array = np.zeros((max(len(q_table), 64), len(_ACTIONS)))
+        for row, q_values in zip(q_values_array, q_table.values()):
+            row[:] = [q_values.get(action, 0.0) for action in _ACTIONS]
+        self._q_values = q_values_array
+        self._q_index = {state_key: i for i, state_key in enumerate(q_table)}
+        self._confidence_cache.clear()
+
+    def _q_row(self, state_key: str) -> int:
+        """Row index for a state, adding a zeroed row if it is new"""
+        row = self._q_index.get(state_key)
+        if row is None:
+            row = len(self._q_index)
+            if row == len(self._q_values):
+                grown = np.zeros((row * 2, len(_ACTIONS)))
+                grown[:row] = self._q_values
+                self._q_values = grown
+            self._q_index[state_key] = row
+        return row
 
     async def train(self, market_data: List[MarketData]) -> None:
         """Train the neural network model"""
@@ -63,25 +100,36 @@ class EnsembleEngine:
             logger.warning("Neural network engine not available for training")
 
     def _calculate_q_learning_confidence_from_state_key(self, state_key: str) -> float:
-        """Calculate confidence from Q-table values for a given state"""
-        q_values = self.q_table.get(state_key, {"buy": 0.0, "sell": 0.0, "hold": 0.0})
-        vals = list(q_values.values())
-        if not vals:
+        """Calculate confidence from Q-table values for a given state
+
+        Reads and fills the confidence cache, so it runs on the event loop
+        alongside the Q-table updates that invalidate it.
+        """
+        confidence = self._confidence_cache.get(state_key)
+        if confidence is not None:
+            return confidence
+        row = self._q_index.get(state_key)
+        # Unseen states (all-zero Q-values) carry no confidence
+        if row is None:
             return 0.0
-        max_q = max(vals)
-        min_q = min(vals)
-        return (max_q - min_q) / (abs(max_q) + 1) if (max_q - min_q) != 0 else 0.0
+        q_values = self._q_values[row]
+        max_q = float(q_values.max())
+        spread = max_q - float(q_values.min())
+        confidence = spread / (abs(max_q) + 1) if spread != 0 else 0.0
+        self._confidence_cache[state_key] = confidence
+        return confidence
 
     async def predict(self, market_data: List[MarketData]) -> EnsemblePrediction:
         """Generate ensemble prediction from both models"""
 
-        # Get predictions from both engines
-        q_learning_prediction = await self._get_q_learning_prediction(market_data)
-        nn_prediction = await self._get_neural_network_prediction(market_data)
-
-        # Calculate Q-learning confidence from qTable using current state
-        state = self._derive_state(market_data)
-        state_key = self._get_state_key(state)
+        # Get predictions from both engines and the current Q-learning state
+        # concurrently, none of them depend on each other. Only the state is
+        # derived in a worker thread; the Q-table is read back on the loop
+        q_learning_prediction, nn_prediction, state_key = await asyncio.gather(
+            self._get_q_learning_prediction(market_data),
+            self._get_neural_network_prediction(market_data),
+            asyncio.to_thread(self._q_learning_state_key, market_data),
+        )
         q_learning_confidence = self._calculate_q_learning_confidence_from_state_key(
             state_key
         )
@@ -91,19 +139,19 @@ class EnsembleEngine:
         nn_weight = self._get_neural_network_accuracy()
         total_weight = q_learning_weight + nn_weight or 1.0
 
-        # Calculate weighted votes
-        votes: Dict[str, float] = {"buy": 0.0, "sell": 0.0, "hold": 0.0}
+        # Calculate weighted votes, one slot per entry in _ACTIONS
+        votes = [0.0, 0.0, 0.0]
 
-        votes[q_learning_prediction["action"]] += (
+        votes[_ACTION_INDEX[q_learning_prediction["action"]]] += (
             q_learning_weight / total_weight
         ) * q_learning_confidence
-        votes[nn_prediction["action"]] += (nn_weight / total_weight) * nn_prediction[
-            "confidence"
-        ]
+        votes[_ACTION_INDEX[nn_prediction["action"]]] += (
+            nn_weight / total_weight
+        ) * nn_prediction["confidence"]
 
-        # Determine final action
-        max_action = max(votes, key=votes.get)
-        max_score = votes[max_action]
+        # Determine final action (ties go to the earliest action, as before)
+        max_score = max(votes)
+        max_action = _ACTIONS[votes.index(max_score)]
 
         return EnsemblePrediction(
             action=max_action,
@@ -123,8 +171,11 @@ class EnsembleEngine:
         """Get prediction from Q-learning engine"""
         if self.q_learning_engine:
             try:
-                # Assuming the MLModel has a predict method
-                result = self.q_learning_engine.predict(market_data)
+                # Assuming the MLModel has a predict method; it is synchronous
+                # pandas work, so keep it off the event loop
+                result = await asyncio.to_thread(
+                    self.q_learning_engine.predict, market_data
+                )
                 return {"action": result.get("prediction", "hold"), "confidence": 0.5}
             except Exception as e:
                 logger.error(f"Q-learning prediction error: {e}")
@@ -138,12 +189,18 @@ class EnsembleEngine:
         if self.neural_network_engine:
             try:
                 result = self.neural_network_engine.predict(market_data)
+                if inspect.isawaitable(result):
+                    result = await result
                 return result
             except Exception as e:
                 logger.error(f"Neural network prediction error: {e}")
                 return {"action": "hold", "confidence": 0.0}
         return {"action": "hold", "confidence": 0.0}
 
+    def _q_learning_state_key(self, market_data: List[MarketData]) -> str:
+        """Q-table key for the current market state"""
+        return self._get_state_key(self._derive_state(market_data))
+
     def _get_q_learning_accuracy(self) -> float:
         """Get recent accuracy of Q-learning engine"""
         if self.q_learning_engine and hasattr(self.q_learning_engine, "get_accuracy"):
@@ -175,22 +232,21 @@ class EnsembleEngine:
         state_key = self._get_state_key(state)
         next_state_key = self._get_state_key(next_state)
 
-        if state_key not in self.q_table:
-            self.q_table[state_key] = {"buy": 0.0, "sell": 0.0, "hold": 0.0}
-
-        if next_state_key not in self.q_table:
-            self.q_table[next_state_key] = {"buy": 0.0, "sell": 0.0, "hold": 0.0}
+        row = self._q_row(state_key)
+        next_row = self._q_row(next_state_key)
+        column = _ACTION_INDEX[action]
 
         # Q-learning update
         learning_rate = 0.1
         discount_factor = 0.95
 
-        old_value = self.q_table[state_key][action]
-        next_max = max(self.q_table[next_state_key].values())
+        old_value = self._q_values[row, column]
+        next_max = self._q_values[next_row].max()
         new_value = old_value + learning_rate * (
             reward + discount_factor * next_max - old_value
         )
-        self.q_table[state_key][action] = new_value
+        self._q_values[row, column] = new_value
+        self._confidence_cache.pop(state_key, None)
 
     def calculate_reward(
         self,
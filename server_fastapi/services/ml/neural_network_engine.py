@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from typing import Callable, Deque, List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
 import logging
 import numpy as np
@@ -7,11 +8,17 @@ from datetime import datetime
 import math
 import os
 
+from ..market import indicators
+
 try:
     import tensorflow as tf
     from tensorflow.keras import layers, models, optimizers
 
     TENSORFLOW_AVAILABLE = True
+
+    # bfloat16 compute with float32 weights only pays off on accelerators
+    if tf.config.list_physical_devices("GPU"):
+        tf.keras.mixed_precision.set_global_policy("mixed_bfloat16")
 except ImportError:
     TENSORFLOW_AVAILABLE = False
     logging.warning("TensorFlow not available, using mock implementations")
@@ -37,14 +44,76 @@ class MarketData(BaseModel):
     volume: float
 
 
+class _InferenceBatcher:
+    """Coalesces concurrent single-sample predictions into one model call
+
+    Requests wait at most max_latency seconds, or until max_batch of them are
+    queued, and are then stacked into one batch so the per-call framework
+    overhead is paid once per batch instead of once per prediction.
+    """
+
+    def __init__(
+        self,
+        model_fn: Callable[[np.ndarray], np.ndarray],
+        max_batch: int = 32,
+        max_latency: float = 0.01,
+    ):
+        self.model_fn = model_fn
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self._pending: Deque[Tuple[np.ndarray, asyncio.Future]] = deque()
+        self._flush_handle: Optional[asyncio.Handle] = None
+
+    async def predict(self, features: np.ndarray) -> np.ndarray:
+        """Queue one feature vector and wait for its row of the batch output"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((features, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_latency, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        size = min(len(self._pending), self.max_batch)
+        batch = [self._pending.popleft() for _ in range(size)]
+        if batch:
+            try:
+                outputs = self.model_fn(np.stack([features for features, _ in batch]))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), row in zip(batch, outputs):
+                    if not future.done():
+                        future.set_result(row)
+
+        # Anything queued beyond this batch goes out on the next loop pass
+        if self._pending:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+
+
 class NeuralNetworkEngine:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = NeuralNetworkConfig(**(config or {}))
         self.model: Optional[tf.keras.Model] = None
         self.is_trained: bool = False
-        self.recent_predictions: List[Dict[str, str]] = []
         self.max_recent_predictions: int = 100
+        self.recent_predictions: Deque[Dict[str, str]] = deque(
+            maxlen=self.max_recent_predictions
+        )
+        # Correct entries currently in recent_predictions
+        self._correct_predictions: int = 0
         self.validation_history: List[Dict[str, float]] = []
+        # Traced inference graph for the current model (see _build_infer_fn)
+        self._infer_fn: Optional[Callable] = None
+        self._batcher = _InferenceBatcher(lambda batch: self._infer_fn(batch).numpy())
 
         self.initialize_model()
 
@@ -52,16 +121,18 @@ class NeuralNetworkEngine:
         """Get recent prediction accuracy"""
         if len(self.recent_predictions) == 0:
             return 0.5  # Default to neutral weight
-        correct = sum(
-            1 for p in self.recent_predictions if p["predicted"] == p["actual"]
-        )
-        return correct / len(self.recent_predictions)
+        return self._correct_predictions / len(self.recent_predictions)
 
     def record_prediction_result(self, predicted: str, actual: str) -> None:
         """Record a prediction result for accuracy tracking"""
+        if len(self.recent_predictions) == self.recent_predictions.maxlen:
+            # The append below evicts the oldest entry
+            evicted = self.recent_predictions[0]
+            if evicted["predicted"] == evicted["actual"]:
+                self._correct_predictions -= 1
         self.recent_predictions.append({"predicted": predicted, "actual": actual})
-        if len(self.recent_predictions) > self.max_recent_predictions:
-            self.recent_predictions.pop(0)
+        if predicted == actual:
+            self._correct_predictions += 1
 
     def initialize_model(self) -> None:
         """Initialize the neural network model"""
@@ -100,74 +171,99 @@ class NeuralNetworkEngine:
                     self.config.output_size,
                     activation="softmax",
                     kernel_initializer="glorot_uniform",
+                    # Keep softmax in float32 under mixed precision
+                    dtype="float32",
                 )
             )
 
-            self.model.compile(
-                optimizer=optimizers.Adam(self.config.learning_rate),
-                loss="categorical_crossentropy",
-                metrics=["accuracy"],
-            )
+            self._compile_model()
+            self._build_infer_fn()
 
             logger.info("Neural network model initialized successfully")
         except Exception as error:
             logger.error(f"Failed to initialize neural network model: {error}")
             raise error
 
+    @staticmethod
+    def _ohlcv_array(market_data: List[MarketData]) -> np.ndarray:
+        """(N, 5) array of open, high, low, close, volume"""
+        return np.array(
+            [(d.open, d.high, d.low, d.close, d.volume) for d in market_data],
+            dtype=np.float64,
+        ).reshape(-1, 5)
+
+    def _compile_model(self) -> None:
+        # Labels are class indices (0=buy, 1=sell, 2=hold), not one-hot rows
+        self.model.compile(
+            optimizer=optimizers.Adam(self.config.learning_rate),
+            loss="sparse_categorical_crossentropy",
+            metrics=["accuracy"],
+        )
+
+    def _build_infer_fn(self) -> None:
+        """Trace the forward pass once so each batch skips Keras dispatch
+
+        The graph reads the model's variables, so training updates are seen
+        without retracing; only swapping the model object needs a rebuild.
+        """
+        model = self.model
+        self._infer_fn = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec([None, self.config.input_size], tf.float32)],
+        )
+
     def preprocess_data(
         self, market_data: List[MarketData]
     ) -> Tuple[np.ndarray, np.ndarray]:
         """Preprocess market data for training"""
-        inputs: List[List[float]] = []
-        labels: List[List[float]] = []
-
-        for i in range(self.config.input_size, len(market_data) - 1):
-            # Create input features from technical indicators
-            input_features = self.extract_features(market_data, i)
-            inputs.append(input_features)
-
-            # Create labels based on future price movement
-            current_price = market_data[i].close
-            future_price = market_data[i + 1].close
-            price_change = (future_price - current_price) / current_price
-
-            # Label: 0=buy, 1=sell, 2=hold
-            label = [0, 0, 1]  # Default to hold
-            if price_change > 0.002:
-                label = [1, 0, 0]  # Buy signal
-            elif price_change < -0.002:
-                label = [0, 1, 0]  # Sell signal
+        size = self.config.input_size
+        ohlcv = self._ohlcv_array(market_data)
+        indices = np.arange(size, len(market_data) - 1)
+
+        # Every sample has a full lookback, so all windows share one shape and
+        # can be gathered and normalised at once; only the first
+        # ceil(size / 5) bars fit in the feature vector
+        bars = -(-size // 5)
+        windows = ohlcv[(indices - size)[:, None] + np.arange(bars)]
+        base_price = windows[:, :1, 3:4]
+        windows[:, :, :4] = (windows[:, :, :4] - base_price) / base_price
+        windows[:, :, 4] /= 1000000  # Normalize volume
+        # float32 is what the model computes in, so convert once here
+        inputs = np.ascontiguousarray(
+            windows.reshape(len(indices), bars * 5)[:, :size], dtype=np.float32
+        )
 
-            labels.append(label)
+        # Labels based on the next bar's price movement: 0=buy, 1=sell, 2=hold
+        closes = ohlcv[size:, 3]
+        if indicators.JIT_ENABLED:
+            labels = indicators.direction_labels(closes, 0.002)
+        else:
+            price_change = np.diff(closes) / closes[:-1]
+            labels = np.full(len(indices), 2, dtype=np.int8)
+            labels[price_change > 0.002] = 0
+            labels[price_change < -0.002] = 1
 
-        return np.array(inputs), np.array(labels)
+        return inputs, labels
 
-    def extract_features(
-        self, market_data: List[MarketData], index: int
-    ) -> List[float]:
+    def extract_features(self, market_data: List[MarketData], index: int) -> np.ndarray:
         """Extract feature vector from market data at given index"""
-        features: List[float] = []
-        lookback = min(self.config.input_size, index)
-
-        # Price data (normalized)
-        for i in range(index - lookback, index):
-            data = market_data[i]
-            base_price = market_data[index - lookback].close
-            features.extend(
-                [
-                    (data.open - base_price) / base_price,
-                    (data.high - base_price) / base_price,
-                    (data.low - base_price) / base_price,
-                    (data.close - base_price) / base_price,
-                    data.volume / 1000000,  # Normalize volume
-                ]
-            )
+        size = self.config.input_size
+        lookback = min(size, index)
+        start = index - lookback
+        # Only the first ceil(size / 5) bars of the window fit in the vector
+        bars = min(lookback, -(-size // 5))
 
         # Fill remaining features with zeros if not enough data
-        while len(features) < self.config.input_size:
-            features.append(0.0)
+        features = np.zeros(size, dtype=np.float32)
+        if bars:
+            window = self._ohlcv_array(market_data[start : start + bars])
+            base_price = window[0, 3]
+            window[:, :4] = (window[:, :4] - base_price) / base_price
+            window[:, 4] /= 1000000  # Normalize volume
+            flat = window.reshape(-1)[:size]
+            features[: flat.size] = flat
 
-        return features[: self.config.input_size]
+        return features
 
     async def train(self, market_data: List[MarketData]) -> None:
         """Train the neural network model"""
@@ -181,19 +277,37 @@ class NeuralNetworkEngine:
             return
 
         try:
-            inputs, labels = self.preprocess_data(market_data)
+            inputs, labels = await asyncio.to_thread(self.preprocess_data, market_data)
 
             if len(inputs) == 0:
                 raise ValueError("Insufficient processed data for training")
 
-            history = self.model.fit(
-                inputs,
-                labels,
+            # Same split as validation_split=0.2 (last 20% held out), but as
+            # tf.data pipelines so batches are prefetched while a step runs
+            batch_size = self.config.batch_size
+            split_at = int(len(inputs) * 0.8)
+            dataset = tf.data.Dataset.from_tensor_slices((inputs, labels))
+            train_ds = (
+                dataset.take(split_at)
+                .cache()
+                .shuffle(split_at or 1)
+                .batch(batch_size)
+                .prefetch(tf.data.AUTOTUNE)
+            )
+            val_ds = (
+                dataset.skip(split_at)
+                .cache()
+                .batch(batch_size)
+                .prefetch(tf.data.AUTOTUNE)
+            )
+
+            # fit() holds its thread for every epoch; keep it off the event loop
+            history = await asyncio.to_thread(
+                self.model.fit,
+                train_ds,
+                validation_data=val_ds,
                 epochs=self.config.epochs,
-                batch_size=self.config.batch_size,
-                validation_split=0.2,
-                shuffle=True,
-                verbose=1,
+                verbose=0,
                 callbacks=[
                     tf.keras.callbacks.EarlyStopping(
                         monitor="val_loss", patience=10, restore_best_weights=True
@@ -224,10 +338,7 @@ class NeuralNetworkEngine:
                 )
 
             features = self.extract_features(market_data, len(market_data) - 1)
-            input_tensor = tf.convert_to_tensor([features])
-
-            prediction = self.model.predict(input_tensor, verbose=0)
-            prediction_array = prediction.numpy()[0]
+            prediction_array = await self._batcher.predict(features)
 
             actions = ["buy", "sell", "hold"]
             max_index = np.argmax(prediction_array)
@@ -241,6 +352,11 @@ class NeuralNetworkEngine:
             logger.error(f"Error generating neural network prediction: {e}")
             return {"action": "hold", "confidence": 0.0}
 
+    @staticmethod
+    def _write_model(model, model_path: str) -> None:
+        os.makedirs(model_path, exist_ok=True)
+        model.save(model_path)
+
     async def save_model(self, bot_id: str) -> None:
         """Save the trained model to disk"""
         if not self.model:
@@ -248,8 +364,8 @@ class NeuralNetworkEngine:
 
         try:
             model_path = f"./models/{bot_id}"
-            os.makedirs(model_path, exist_ok=True)
-            self.model.save(model_path)
+            # Disk I/O and graph serialization run off the event loop
+            await asyncio.to_thread(self._write_model, self.model, model_path)
             logger.info(
                 f"Neural network model saved successfully for bot {bot_id} at {model_path}"
             )
@@ -262,7 +378,12 @@ class NeuralNetworkEngine:
         try:
             model_path = f"./models/{bot_id}"
             if os.path.exists(model_path):
-                self.model = tf.keras.models.load_model(model_path)
+                self.model = await asyncio.to_thread(
+                    tf.keras.models.load_model, model_path
+                )
+                # Models saved with one-hot labels need the sparse loss for retraining
+                self._compile_model()
+                self._build_infer_fn()
                 self.is_trained = True
                 logger.info(
                     f"Neural network model loaded successfully for bot {bot_id}"
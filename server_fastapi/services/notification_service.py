@@ -3,9 +3,28 @@ Real-time Notification Service
 Handles push notifications, email alerts, and in-app notifications.
 """
 
+import asyncio
+import bisect
+import inspect
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass, replace
+from operator import itemgetter
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Any,
+    Set,
+    Tuple,
+    Union,
+)
+from datetime import datetime, timezone
 from enum import Enum
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
@@ -75,10 +94,103 @@ class NotificationPriority(str, Enum):
     CRITICAL = "critical"
 
 
+# Rank used to order notifications, higher is more urgent
+_PRIORITY_RANK = {p.value: i for i, p in enumerate(NotificationPriority)}
+
+# In-app notifications older than this are dropped
+NOTIFICATION_TTL_SECONDS = 7 * 24 * 3600
+# Expired notifications are swept at most this often per user, and at most
+# this many per sweep; reads skip expired ones the sweep has not reached yet
+NOTIFICATION_CLEANUP_INTERVAL_SECONDS = 60.0
+NOTIFICATION_CLEANUP_BATCH_SIZE = 4096
+# Each user keeps at most this many notifications; past it the least urgent,
+# oldest ones are dropped on insert
+NOTIFICATION_RETENTION_MAX = 1000
+
+
+def _format_title(category_value: str, level: str) -> str:
+    return category_value.replace("_", " ").title() + " " + level.capitalize()
+
+
+# Default titles for the known levels, shared by every notification using them
+_DEFAULT_TITLES = {
+    (c.value, level): _format_title(c.value, level)
+    for c in NotificationCategory
+    for level in ("info", "success", "warning", "error")
+}
+
+# Listeners may be coroutine functions or plain callables
+NotificationListener = Callable[[Dict[str, Any]], Union[Awaitable[None], None]]
+
+
+@dataclass(slots=True)
+class _StoredNotification:
+    """Compact in-memory form of an in-app notification"""
+
+    id: int
+    user_id: str
+    level: str
+    title: str
+    message: str
+    category: str
+    priority: str
+    data: Dict[str, Any]
+    created_at: float  # epoch seconds
+    read: bool = False
+
+    def sort_key(self) -> Tuple[int, float, int]:
+        """Most urgent, then newest, first; the id breaks same-tick ties"""
+        return (-_PRIORITY_RANK[self.priority], -self.created_at, -self.id)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API form, with the ISO-8601 timestamp clients expect"""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "type": self.level,
+            "level": self.level,
+            "title": self.title,
+            "message": self.message,
+            "category": self.category,
+            "priority": self.priority,
+            "data": self.data,
+            "created_at": self.created_at,
+            "timestamp": datetime.fromtimestamp(
+                self.created_at, timezone.utc
+            ).isoformat(),
+            "read": self.read,
+        }
+
+
 class NotificationService:
     """Service for sending real-time notifications"""
 
-    def __init__(self, db: AsyncSession):
+    # In-app notifications live in process memory and are shared by every
+    # instance, since routes build a service per request around a DB session.
+    # Each user's entries are (sort key, notification) pairs kept sorted by
+    # the key (-priority rank, -created epoch, -id): most urgent, then newest,
+    # first. Inserts bisect into place so reads never sort.
+    _notifications: Dict[
+        str, List[Tuple[Tuple[int, float, int], _StoredNotification]]
+    ] = defaultdict(list)
+    # Per-user id -> notification, for lookups without scanning the list
+    _by_id: Dict[str, Dict[int, _StoredNotification]] = defaultdict(dict)
+    # Per-user counts keyed by (category, priority), updated on every
+    # create/read/delete/expiry so counts and stats never scan the list
+    _total_counts: Dict[str, Counter] = defaultdict(Counter)
+    _unread_counts: Dict[str, Counter] = defaultdict(Counter)
+    # Per-user ids of unread notifications, so mark-all only visits those
+    _unread_ids: Dict[str, Set[int]] = defaultdict(set)
+    # (created epoch, id) per user in creation order; with a single TTL this
+    # is also expiry order, so the oldest entries are always at the left
+    _expiry_queues: Dict[str, Deque[Tuple[float, int]]] = defaultdict(deque)
+    _last_cleanup: Dict[str, float] = {}
+    _listeners: Dict[str, List[NotificationListener]] = defaultdict(list)
+    # Class-level so ids stay unique across the per-request instances;
+    # next() on a count is a single C call, unlike a read-modify-write
+    _ids = itertools.count(1)
+
+    def __init__(self, db: Optional[AsyncSession] = None):
         self.db = db
 
     async def send_notification(
@@ -274,3 +386,386 @@ class NotificationService:
                 "direction": direction,
             },
         )
+
+    async def create_notification(
+        self,
+        user_id: Any,
+        message: str,
+        level: str = "info",
+        title: Optional[str] = None,
+        category: NotificationCategory = NotificationCategory.SYSTEM,
+        priority: NotificationPriority = NotificationPriority.MEDIUM,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Store an in-app notification and push it to the user's listeners"""
+        notification = self._build_notification(
+            str(user_id), message, level, title, category, priority, data
+        )
+        self._store(notification)
+
+        public = notification.to_dict()
+        await self._notify_listeners(notification.user_id, public)
+        return public
+
+    async def broadcast_notification(
+        self,
+        user_ids: List[Any],
+        message: str,
+        level: str = "info",
+        title: Optional[str] = None,
+        category: NotificationCategory = NotificationCategory.SYSTEM,
+        priority: NotificationPriority = NotificationPriority.MEDIUM,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Create the same notification for several users"""
+        # Title, timestamp and enum values are resolved once for everyone;
+        # each recipient only gets its own id and user_id
+        template = self._build_notification(
+            "", message, level, title, category, priority, data
+        )
+        template_public = None
+        deliveries = []
+        for user_id in user_ids:
+            # Each recipient gets its own data dict, so a change made through
+            # one user's notification does not show up in everyone else's
+            notification = replace(
+                template,
+                id=next(self._ids),
+                user_id=str(user_id),
+                data=dict(template.data),
+            )
+            self._store(notification)
+            listeners = self._listeners.get(notification.user_id)
+            if listeners:
+                # The API form differs per recipient only in id, user_id and
+                # data, so the timestamp formatting is done once per broadcast
+                if template_public is None:
+                    template_public = template.to_dict()
+                public = {
+                    **template_public,
+                    "id": notification.id,
+                    "user_id": notification.user_id,
+                    "data": notification.data,
+                }
+                deliveries.extend((callback, public) for callback in listeners)
+
+        await self._dispatch(deliveries)
+
+    async def get_recent_notifications(
+        self,
+        user_id: Any,
+        limit: int = 50,
+        category: Optional[NotificationCategory] = None,
+        unread_only: bool = False,
+        priority_filter: Optional[List[NotificationPriority]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Most urgent, then newest, notifications for a user"""
+        user_key = str(user_id)
+        now = time.time()
+        self._cleanup_expired_notifications(user_key, now)
+        entries = self._notifications.get(user_key, ())
+        cutoff = now - NOTIFICATION_TTL_SECONDS
+        priority_values = (
+            frozenset(p.value for p in priority_filter) if priority_filter else None
+        )
+
+        # Entries are already in order, so stop once limit of them match
+        result = []
+        for sort_key, notification in entries:
+            # Sort keys hold the negated creation epoch
+            if -sort_key[1] < cutoff:
+                continue
+            if category and notification.category != category.value:
+                continue
+            if unread_only and notification.read:
+                continue
+            if priority_values and notification.priority not in priority_values:
+                continue
+            result.append(notification.to_dict())
+            if len(result) >= limit:
+                break
+        return result
+
+    async def get_unread_count(
+        self,
+        user_id: Any,
+        category: Optional[NotificationCategory] = None,
+        priority_filter: Optional[List[NotificationPriority]] = None,
+    ) -> int:
+        """Number of unread notifications, optionally filtered"""
+        counts = self._unread_counts.get(str(user_id))
+        if not counts:
+            return 0
+        priority_values = (
+            frozenset(p.value for p in priority_filter) if priority_filter else None
+        )
+        if category and priority_values:
+            # Both filters name exact counter keys
+            return sum(counts[(category.value, p)] for p in priority_values)
+        # At most one key per (category, priority) pair, independent of volume
+        return sum(
+            count
+            for (category_value, priority_value), count in counts.items()
+            if (not category or category_value == category.value)
+            and (not priority_values or priority_value in priority_values)
+        )
+
+    async def mark_as_read(self, user_id: Any, notification_id: Any) -> bool:
+        """Mark one notification as read; False if the user has no such id"""
+        user_key = str(user_id)
+        notification = self._by_id.get(user_key, {}).get(int(notification_id))
+        if notification is None:
+            return False
+        if not notification.read:
+            self._mark_read(user_key, notification)
+        return True
+
+    async def mark_all_as_read(
+        self, user_id: Any, category: Optional[NotificationCategory] = None
+    ) -> int:
+        """Mark unread notifications as read, returning how many changed"""
+        user_key = str(user_id)
+        if not await self.get_unread_count(user_key, category=category):
+            return 0
+
+        by_id = self._by_id[user_key]
+        count = 0
+        # Snapshot, since _mark_read removes ids from the set
+        for notification_id in list(self._unread_ids[user_key]):
+            notification = by_id[notification_id]
+            if category and notification.category != category.value:
+                continue
+            self._mark_read(user_key, notification)
+            count += 1
+        return count
+
+    async def delete_notification(self, user_id: Any, notification_id: Any) -> bool:
+        """Delete one notification; False if the user has no such id"""
+        user_key = str(user_id)
+        notification = self._by_id.get(user_key, {}).pop(int(notification_id), None)
+        if notification is None:
+            return False
+        # Sort keys are unique, so bisect lands exactly on the entry
+        entries = self._notifications[user_key]
+        index = bisect.bisect_left(entries, notification.sort_key(), key=itemgetter(0))
+        del entries[index]
+        self._count(user_key, notification, -1)
+        return True
+
+    async def delete_many(self, user_id: Any, notification_ids: List[Any]) -> int:
+        """Delete several notifications in one pass, returning how many existed"""
+        return self._remove_many(str(user_id), {int(i) for i in notification_ids})
+
+    async def get_notification_stats(self, user_id: Any) -> Dict[str, Any]:
+        """Totals by read state, category and priority"""
+        user_key = str(user_id)
+        by_category: Dict[str, int] = defaultdict(int)
+        by_priority: Dict[str, int] = defaultdict(int)
+        for (category_value, priority_value), count in self._total_counts.get(
+            user_key, Counter()
+        ).items():
+            if count:
+                by_category[category_value] += count
+                by_priority[priority_value] += count
+        return {
+            "total": sum(by_category.values()),
+            "unread": sum(self._unread_counts.get(user_key, Counter()).values()),
+            "by_category": dict(by_category),
+            "by_priority": dict(by_priority),
+        }
+
+    async def add_listener(self, user_id: Any, callback: NotificationListener) -> None:
+        """Call callback with every new notification for the user"""
+        self._listeners[str(user_id)].append(callback)
+
+    async def remove_listener(
+        self, user_id: Any, callback: NotificationListener
+    ) -> None:
+        """Stop calling a listener registered with add_listener"""
+        user_key = str(user_id)
+        listeners = self._listeners.get(user_key)
+        if not listeners:
+            return
+        try:
+            listeners.remove(callback)
+        except ValueError:
+            return
+        if not listeners:
+            del self._listeners[user_key]
+
+    def _build_notification(
+        self,
+        user_key: str,
+        message: str,
+        level: str,
+        title: Optional[str],
+        category: NotificationCategory,
+        priority: NotificationPriority,
+        data: Optional[Dict[str, Any]],
+    ) -> _StoredNotification:
+        return _StoredNotification(
+            id=next(self._ids),
+            user_id=user_key,
+            level=level,
+            title=title or self._generate_title(category, level),
+            message=message,
+            category=category.value,
+            priority=priority.value,
+            data=data or {},
+            created_at=time.time(),
+        )
+
+    def _store(self, notification: _StoredNotification) -> None:
+        """Insert into the user's sorted list, index, counters and expiry queue"""
+        user_key = notification.user_id
+        bisect.insort(
+            self._notifications[user_key],
+            (notification.sort_key(), notification),
+            key=itemgetter(0),
+        )
+        self._by_id[user_key][notification.id] = notification
+        self._count(user_key, notification, 1)
+        self._expiry_queues[user_key].append((notification.created_at, notification.id))
+        self._enforce_retention(user_key, notification)
+        self._cleanup_expired_notifications(user_key, notification.created_at)
+
+    def _enforce_retention(self, user_key: str, newest: _StoredNotification) -> None:
+        """Trim the user's list to NOTIFICATION_RETENTION_MAX entries
+
+        The list is sorted most urgent, newest first, so the tail goes. The
+        notification just stored is always kept, since its id is returned to
+        the caller and sent to listeners; if it falls in the tail, the lowest
+        ranked of the other entries goes instead.
+        """
+        entries = self._notifications[user_key]
+        if len(entries) <= NOTIFICATION_RETENTION_MAX:
+            return
+        keep = NOTIFICATION_RETENTION_MAX
+        newest_entry = None
+        index = bisect.bisect_left(entries, newest.sort_key(), key=itemgetter(0))
+        if index >= keep:
+            newest_entry = entries.pop(index)
+            keep -= 1
+
+        by_id = self._by_id[user_key]
+        for _, notification in entries[keep:]:
+            del by_id[notification.id]
+            self._count(user_key, notification, -1)
+        del entries[keep:]
+        if newest_entry is not None:
+            # Ranks below everything kept, so appending keeps the order
+            entries.append(newest_entry)
+
+        # Trimmed ids stay in the expiry queue until they age out; compact it
+        # once they outnumber the live ones so it stays bounded as well
+        queue = self._expiry_queues[user_key]
+        if len(queue) > 2 * NOTIFICATION_RETENTION_MAX:
+            self._expiry_queues[user_key] = deque(
+                item for item in queue if item[1] in by_id
+            )
+
+    async def _notify_listeners(
+        self, user_key: str, notification: Dict[str, Any]
+    ) -> None:
+        listeners = self._listeners.get(user_key)
+        if not listeners:
+            return
+        # Built before any callback runs, so listeners added or removed during
+        # delivery do not affect this round
+        await self._dispatch([(callback, notification) for callback in listeners])
+
+    @staticmethod
+    async def _dispatch(
+        deliveries: List[Tuple[NotificationListener, Dict[str, Any]]],
+    ) -> None:
+        """Call listeners, logging rather than raising their failures
+
+        Plain callables run inline; only the awaitables they return are
+        awaited, directly when there is one and through gather otherwise.
+        """
+        pending = []
+        for callback, notification in deliveries:
+            try:
+                result = callback(notification)
+            except Exception as e:
+                logger.warning(f"Notification listener failed: {e}")
+                continue
+            if inspect.isawaitable(result):
+                pending.append(result)
+
+        if len(pending) == 1:
+            try:
+                await pending[0]
+            except Exception as e:
+                logger.warning(f"Notification listener failed: {e}")
+        elif pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Notification listener failed: {result}")
+
+    def _cleanup_expired_notifications(self, user_key: str, now: float) -> None:
+        """Drop a batch of the user's expired notifications, if a sweep is due"""
+        if now - self._last_cleanup.get(user_key, 0.0) < (
+            NOTIFICATION_CLEANUP_INTERVAL_SECONDS
+        ):
+            return
+        self._last_cleanup[user_key] = now
+
+        queue = self._expiry_queues.get(user_key)
+        cutoff = now - NOTIFICATION_TTL_SECONDS
+        expired = set()
+        while (
+            queue
+            and queue[0][0] < cutoff
+            and len(expired) < NOTIFICATION_CLEANUP_BATCH_SIZE
+        ):
+            expired.add(queue.popleft()[1])
+        if expired:
+            self._remove_many(user_key, expired)
+
+    def _remove_many(self, user_key: str, notification_ids: set) -> int:
+        """Remove the user's notifications with these ids in a single pass"""
+        by_id = self._by_id.get(user_key, {})
+        # Ids already deleted are not in the index and are ignored
+        removed = {nid for nid in notification_ids if by_id.pop(nid, None) is not None}
+        if not removed:
+            return 0
+
+        kept = []
+        for entry in self._notifications.get(user_key, ()):
+            if entry[1].id in removed:
+                self._count(user_key, entry[1], -1)
+            else:
+                kept.append(entry)
+        self._notifications[user_key] = kept
+        return len(removed)
+
+    def _count(
+        self, user_key: str, notification: _StoredNotification, delta: int
+    ) -> None:
+        """Add delta to the counters a stored notification contributes to"""
+        key = (notification.category, notification.priority)
+        self._total_counts[user_key][key] += delta
+        if not notification.read:
+            self._unread_counts[user_key][key] += delta
+            if delta > 0:
+                self._unread_ids[user_key].add(notification.id)
+            else:
+                self._unread_ids[user_key].discard(notification.id)
+
+    def _mark_read(self, user_key: str, notification: _StoredNotification) -> None:
+        """Flag an unread notification as read and update the unread count"""
+        notification.read = True
+        key = (notification.category, notification.priority)
+        self._unread_counts[user_key][key] -= 1
+        self._unread_ids[user_key].discard(notification.id)
+
+    @staticmethod
+    def _generate_title(category: NotificationCategory, level: str) -> str:
+        """Default title from category and level, e.g. Copy Trading Warning"""
+        title = _DEFAULT_TITLES.get((category.value, level))
+        if title is None:
+            # Levels are caller supplied, so unknown ones are not cached
+            title = _format_title(category.value, level)
+        return title
@@ -12,7 +12,11 @@ from ...services.ml.enhanced_ml_engine import EnhancedMLEngine, MLPrediction
 from ...services.ml.ensemble_engine import EnsembleEngine, EnsemblePrediction
 from ...services.ml.neural_network_engine import NeuralNetworkEngine
 from ...services.ml.adaptive_learning import adaptive_learning_service
-from ...services.advanced_risk_manager import AdvancedRiskManager, RiskProfile
+from ...services.advanced_risk_manager import (
+    AdvancedRiskManager,
+    MarketConditions,
+    RiskProfile,
+)
 from .bot_control_service import BotControlService
 from .bot_monitoring_service import BotMonitoringService
 from .smart_bot_engine import SmartBotEngine, MarketSignal
@@ -52,11 +56,11 @@ class BotTradingService:
             user_id = bot_config["user_id"]
             strategy = bot_config.get("strategy", "simple_ma")
 
-            logger.info(f"Executing trading cycle for bot {bot_id} ({strategy})")
+            logger.info("Executing trading cycle for bot %s (%s)", bot_id, strategy)
 
             # Check if bot is still active before proceeding
             if not await self.control_service.is_bot_active(bot_id, user_id):
-                logger.info(f"Bot {bot_id} is no longer active, skipping cycle")
+                logger.info("Bot %s is no longer active, skipping cycle", bot_id)
                 return {"action": "skipped", "reason": "bot_inactive"}
 
             # Validate start conditions
@@ -65,7 +69,9 @@ class BotTradingService:
             )
             if not validation["can_start"]:
                 logger.warning(
-                    f"Bot {bot_id} cannot proceed with trading: {validation['blockers']}"
+                    "Bot %s cannot proceed with trading: %s",
+                    bot_id,
+                    validation["blockers"],
                 )
                 return {
                     "action": "blocked",
@@ -80,7 +86,7 @@ class BotTradingService:
             signal = await self._get_trading_signal(strategy, market_data, bot_config)
 
             if not signal or signal["action"] not in ["buy", "sell"]:
-                logger.info(f"No trading action for bot {bot_id}")
+                logger.info("No trading action for bot %s", bot_id)
                 return {"action": "hold", "signal": signal}
 
             # Calculate risk profile
@@ -103,7 +109,9 @@ class BotTradingService:
 
             if not validation["valid"]:
                 logger.warning(
-                    f"Trade blocked by safety system for bot {bot_id}: {validation['errors']}"
+                    "Trade blocked by safety system for bot %s: %s",
+                    bot_id,
+                    validation["errors"],
                 )
                 return {
                     "action": "blocked",
@@ -132,7 +140,9 @@ class BotTradingService:
 
             if not safety_result["valid"]:
                 logger.warning(
-                    f"Trade blocked by trading safety service for bot {bot_id}: {safety_result['reason']}"
+                    "Trade blocked by trading safety service for bot %s: %s",
+                    bot_id,
+                    safety_result["reason"],
                 )
                 return {
                     "action": "blocked",
@@ -147,12 +157,16 @@ class BotTradingService:
                     "adjusted_quantity"
                 ]
                 logger.info(
-                    f"Position size adjusted by safety service for bot {bot_id}: "
-                    f"{original_qty:.6f} -> {trade_details['quantity']:.6f}"
+                    "Position size adjusted by safety service for bot %s: %.6f -> %.6f",
+                    bot_id,
+                    original_qty,
+                    trade_details["quantity"],
                 )
 
             # Execute trade
             trade_result = await self._execute_trade(trade_details)
+            # Single timestamp reused for every generated id in this cycle
+            cycle_ts = datetime.now().timestamp()
 
             # Record trade result with both systems
             await safe_system.record_trade_result(
@@ -162,10 +176,7 @@ class BotTradingService:
             # Record with new safety service
             if trade_result.get("success"):
                 # Generate trade ID if not present
-                trade_id = (
-                    trade_result.get("order_id")
-                    or f"{bot_id}_{datetime.now().timestamp()}"
-                )
+                trade_id = trade_result.get("order_id") or f"{bot_id}_{cycle_ts}"
 
                 # Calculate P&L (for now, 0 until position is closed)
                 pnl = trade_result.get("pnl", 0.0)
@@ -212,8 +223,10 @@ class BotTradingService:
                     )
 
                     logger.info(
-                        f"Auto-created stop-loss for position {position_id}: "
-                        f"Entry ${executed_price:.2f}, Stop ${sl_order['trigger_price']:.2f}"
+                        "Auto-created stop-loss for position %s: Entry $%.2f, Stop $%.2f",
+                        position_id,
+                        executed_price,
+                        sl_order["trigger_price"],
                     )
 
                     # Create take-profit order
@@ -229,8 +242,10 @@ class BotTradingService:
                     )
 
                     logger.info(
-                        f"Auto-created take-profit for position {position_id}: "
-                        f"Entry ${executed_price:.2f}, Target ${tp_order['trigger_price']:.2f}"
+                        "Auto-created take-profit for position %s: Entry $%.2f, Target $%.2f",
+                        position_id,
+                        executed_price,
+                        tp_order["trigger_price"],
                     )
 
                     # Store order IDs in trade result for reference
@@ -239,20 +254,20 @@ class BotTradingService:
 
                 except Exception as e:
                     logger.error(
-                        f"Failed to create SL/TP orders for position {position_id}: {e}"
+                        "Failed to create SL/TP orders for position %s: %s",
+                        position_id,
+                        e,
                     )
                     # Don't fail the trade, just log the error
 
                 logger.info(
-                    f"Trade result recorded with safety service for bot {bot_id}"
+                    "Trade result recorded with safety service for bot %s", bot_id
                 )
 
             # Adaptive Learning: Learn from trade
             try:
                 trade_record = {
-                    "id": trade_result.get(
-                        "trade_id", f"{bot_id}_{int(datetime.now().timestamp())}"
-                    ),
+                    "id": trade_result.get("trade_id", f"{bot_id}_{int(cycle_ts)}"),
                     "pnl": trade_result.get("pnl", 0.0),
                     "symbol": bot_config.get("tradingPair", "UNKNOWN"),
                 }
@@ -260,14 +275,14 @@ class BotTradingService:
                     trade_record, market_data
                 )
                 logger.info(
-                    f"Bot {bot_id} trade pattern analyzed for adaptive learning"
+                    "Bot %s trade pattern analyzed for adaptive learning", bot_id
                 )
             except Exception as learn_error:
                 logger.warning(
-                    f"Error in adaptive learning for bot {bot_id}: {learn_error}"
+                    "Error in adaptive learning for bot %s: %s", bot_id, learn_error
                 )
 
-            logger.info(f"Bot {bot_id} executed {signal['action']} trade")
+            logger.info("Bot %s executed %s trade", bot_id, signal["action"])
             return {
                 "action": signal["action"],
                 "trade_details": trade_details,
@@ -277,14 +292,14 @@ class BotTradingService:
 
         except Exception as e:
             logger.error(
-                f"Error executing trading cycle for bot {bot_config['id']}: {str(e)}"
+                "Error executing trading cycle for bot %s: %s", bot_config["id"], str(e)
             )
             return {"action": "error", "error": str(e)}
 
     async def run_bot_loop(self, bot_id: str, user_id: int):
         """Background task to run bot trading loop"""
         try:
-            logger.info(f"Starting trading loop for bot {bot_id} (user {user_id})")
+            logger.info("Starting trading loop for bot %s (user %s)", bot_id, user_id)
 
             while True:
                 try:
@@ -293,7 +308,7 @@ class BotTradingService:
                         bot_id, user_id
                     )
                     if not bot_status or not bot_status.get("active", False):
-                        logger.info(f"Bot {bot_id} is no longer active, stopping loop")
+                        logger.info("Bot %s is no longer active, stopping loop", bot_id)
                         break
 
                     # Execute trading cycle
@@ -301,21 +316,25 @@ class BotTradingService:
 
                     # Log cycle result
                     if result["action"] in ["buy", "sell"]:
-                        logger.info(f"Bot {bot_id} cycle result: {result['action']}")
+                        logger.info("Bot %s cycle result: %s", bot_id, result["action"])
                     elif result["action"] == "error":
                         logger.error(
-                            f"Bot {bot_id} cycle error: {result.get('error', 'unknown')}"
+                            "Bot %s cycle error: %s",
+                            bot_id,
+                            result.get("error", "unknown"),
                         )
 
                 except Exception as e:
-                    logger.error(f"Error in trading cycle for bot {bot_id}: {str(e)}")
+                    logger.error(
+                        "Error in trading cycle for bot %s: %s", bot_id, str(e)
+                    )
                     # Don't break loop for individual cycle errors
 
                 # Wait before next cycle (5 minutes)
                 await asyncio.sleep(300)
 
         except Exception as e:
-            logger.error(f"Critical error in bot loop {bot_id}: {str(e)}")
+            logger.error("Critical error in bot loop %s: %s", bot_id, str(e))
             # Ensure bot is marked as inactive on critical error
             try:
                 await self.control_service.update_bot_status(
@@ -323,7 +342,7 @@ class BotTradingService:
                 )
             except Exception as stop_error:
                 logger.error(
-                    f"Error stopping bot {bot_id} after critical error: {stop_error}"
+                    "Error stopping bot %s after critical error: %s", bot_id, stop_error
                 )
 
     async def _get_market_data(
@@ -351,7 +370,8 @@ class BotTradingService:
 
             if not api_key_data or not api_key_data.get("is_validated", False):
                 logger.warning(
-                    f"No validated API keys for {exchange_name}, cannot fetch real market data"
+                    "No validated API keys for %s, cannot fetch real market data",
+                    exchange_name,
                 )
                 raise ValueError(f"No validated API keys for {exchange_name}")
 
@@ -373,7 +393,7 @@ class BotTradingService:
 
             if not ohlcv_data:
                 logger.warning(
-                    f"No market data returned for {symbol} on {exchange_name}"
+                    "No market data returned for %s on %s", symbol, exchange_name
                 )
                 raise ValueError(f"No market data available for {symbol}")
 
@@ -396,12 +416,15 @@ class BotTradingService:
                 raise ValueError(f"Failed to parse market data for {symbol}")
 
             logger.info(
-                f"Fetched {len(market_data)} candles for {symbol} from {exchange_name}"
+                "Fetched %s candles for %s from %s",
+                len(market_data),
+                symbol,
+                exchange_name,
             )
             return market_data
 
         except Exception as e:
-            logger.error(f"Error fetching market data: {e}", exc_info=True)
+            logger.error("Error fetching market data: %s", e, exc_info=True)
             # In production, we should not fall back to mock data
             from ..config.settings import get_settings
 
@@ -434,7 +457,7 @@ class BotTradingService:
             if strategy == "smart_adaptive" or bot_config.get("config", {}).get(
                 "use_smart_engine", False
             ):
-                logger.info(f"Using SmartBotEngine for analysis")
+                logger.info("Using SmartBotEngine for analysis")
 
                 # Prepare market data for smart engine
                 smart_data = self._prepare_smart_market_data(market_data, bot_config)
@@ -515,7 +538,7 @@ class BotTradingService:
 
         except Exception as e:
             logger.error(
-                f"Error getting trading signal for strategy {strategy}: {str(e)}"
+                "Error getting trading signal for strategy %s: %s", strategy, str(e)
             )
             return None
 
@@ -568,7 +591,8 @@ class BotTradingService:
         try:
             if len(market_data) < 200:
                 logger.warning(
-                    f"Insufficient data for MA crossover: {len(market_data)} candles (need 200)"
+                    "Insufficient data for MA crossover: %s candles (need 200)",
+                    len(market_data),
                 )
                 return {
                     "action": "hold",
@@ -678,7 +702,7 @@ class BotTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error calculating MA signal: {e}", exc_info=True)
+            logger.error("Error calculating MA signal: %s", e, exc_info=True)
             return {
                 "action": "hold",
                 "confidence": 0.3,
@@ -703,7 +727,9 @@ class BotTradingService:
 
             if len(market_data) < rsi_period + 1:
                 logger.warning(
-                    f"Insufficient data for RSI: {len(market_data)} candles (need {rsi_period + 1})"
+                    "Insufficient data for RSI: %s candles (need %s)",
+                    len(market_data),
+                    rsi_period + 1,
                 )
                 return {
                     "action": "hold",
@@ -803,7 +829,7 @@ class BotTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error calculating RSI signal: {e}", exc_info=True)
+            logger.error("Error calculating RSI signal: %s", e, exc_info=True)
             return {
                 "action": "hold",
                 "confidence": 0.3,
@@ -962,7 +988,7 @@ class BotTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error calculating momentum signal: {e}", exc_info=True)
+            logger.error("Error calculating momentum signal: %s", e, exc_info=True)
             return {
                 "action": "hold",
                 "confidence": 0.3,
@@ -979,11 +1005,11 @@ class BotTradingService:
             return await self.risk_manager.calculate_optimal_risk_profile(
                 current_price=current_price,
                 volatility=0.02,  # Mock volatility
-                market_conditions={"regime": "normal", "trend": {"strength": 0.6}},
+                market_conditions=MarketConditions(trend_strength=0.6),
             )
 
         except Exception as e:
-            logger.error(f"Error calculating risk profile: {str(e)}")
+            logger.error("Error calculating risk profile: %s", str(e))
             # Return default risk profile
             return RiskProfile(
                 max_position_size=0.1,
@@ -1083,7 +1109,9 @@ class BotTradingService:
             )
 
             logger.info(
-                f"Real money trade executed: {result.get('order_id')} for bot {bot_id}"
+                "Real money trade executed: %s for bot %s",
+                result.get("order_id"),
+                bot_id,
             )
 
             return {
@@ -1097,7 +1125,7 @@ class BotTradingService:
             }
 
         except Exception as e:
-            logger.error(f"Error executing trade: {e}", exc_info=True)
+            logger.error("Error executing trade: %s", e, exc_info=True)
             # In production, don't fall back to mock
             from ..config.settings import get_settings
 
@@ -1144,15 +1172,19 @@ class BotTradingService:
                 # Get real balance (implementation depends on exchange service)
                 # For now, return a default value
                 # TODO: Implement actual balance fetching
-                logger.info(f"Getting account balance for user {user_id} on {exchange}")
+                logger.info(
+                    "Getting account balance for user %s on %s", user_id, exchange
+                )
                 return 10000.0  # Default for now
             else:
                 # Paper trading mode or no API keys
-                logger.info(f"Using default balance for user {user_id} (paper trading)")
+                logger.info(
+                    "Using default balance for user %s (paper trading)", user_id
+                )
                 return 10000.0  # Default paper trading balance
 
         except Exception as e:
-            logger.warning(f"Error getting account balance: {e}, using default")
+            logger.warning("Error getting account balance: %s, using default", e)
             return 10000.0  # Safe default
 
     async def _get_current_positions(
@@ -1183,13 +1215,15 @@ class BotTradingService:
                 # Get real positions (implementation depends on exchange service)
                 # For now, return empty dict
                 # TODO: Implement actual position fetching
-                logger.info(f"Getting positions for user {user_id} on {exchange}")
+                logger.info("Getting positions for user %s on %s", user_id, exchange)
                 return {}  # Empty for now
             else:
                 # Paper trading mode or no API keys
-                logger.info(f"Using empty positions for user {user_id} (paper trading)")
+                logger.info(
+                    "Using empty positions for user %s (paper trading)", user_id
+                )
                 return {}
 
         except Exception as e:
-            logger.warning(f"Error getting positions: {e}, using empty positions")
+            logger.warning("Error getting positions: %s, using empty positions", e)
             return {}  # Safe default
@@ -1,9 +1,12 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel
 import logging
 import asyncio
+import inspect
+import math
 import sys
 import os
+import time
 
 # Add integrations to path
 integrations_path = os.path.join(os.path.dirname(__file__), "../../server/integrations")
@@ -11,6 +14,9 @@ sys.path.insert(0, integrations_path)
 
 logger = logging.getLogger(__name__)
 
+# Bot lists are reloaded at most this often per user
+BOTS_CACHE_TTL = 5.0
+
 try:
     from freqtrade_adapter import FreqtradeManager
     from jesse_adapter import JesseManager
@@ -49,12 +55,19 @@ class BacktestResult(BaseModel):
     summary: BacktestSummary
 
 
+# Order in which adapters are queried and their results reported
+_ADAPTER_SOURCES = ("freqtrade", "jesse")
+
+
 class TradingOrchestrator:
     def __init__(self, db_session=None):
         self.db = db_session
         self.started = False
         self.freqtrade_adapter: Optional[FreqtradeManager] = None
         self.jesse_adapter: Optional[JesseManager] = None
+        # user_id -> (loaded at, bots), plus the same bots indexed by id
+        self._bots_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._bots_by_id: Dict[int, Dict[int, Dict[str, Any]]] = {}
 
         # Initialize adapters if available
         if FreqtradeManager:
@@ -86,6 +99,7 @@ class TradingOrchestrator:
 
             logger.info("Starting all trading adapters")
             self.started = True
+            self.invalidate_user_bots()
         except Exception as e:
             logger.warning(f"Failed to start some adapters: {e}")
             self.started = False
@@ -97,6 +111,19 @@ class TradingOrchestrator:
             logger.info("Stopping all trading adapters")
         finally:
             self.started = False
+            self.invalidate_user_bots()
+
+    @staticmethod
+    async def _call_adapter(
+        adapter: Any, method: str, payload: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Call an adapter method, running synchronous ones in a worker thread"""
+        if adapter is None:
+            return None
+        func = getattr(adapter, method)
+        if inspect.iscoroutinefunction(func):
+            return await func(payload)
+        return await asyncio.to_thread(func, payload)
 
     async def get_ensemble_prediction(
         self, payload: Dict[str, Any]
@@ -104,50 +131,25 @@ class TradingOrchestrator:
         """Get ensemble prediction from all available adapters"""
         votes: List[Prediction] = []
 
-        # Always include a local 'none' baseline to avoid division by zero
-        try:
-            freqtrade_result = (
-                await self.freqtrade_adapter.predict(payload)
-                if self.freqtrade_adapter
-                else None
-            )
-            if freqtrade_result and freqtrade_result.get("action"):
+        # Query both adapters concurrently, a failing one is skipped
+        results = await asyncio.gather(
+            self._call_adapter(self.freqtrade_adapter, "predict", payload),
+            self._call_adapter(self.jesse_adapter, "predict", payload),
+            return_exceptions=True,
+        )
+        for source, result in zip(_ADAPTER_SOURCES, results):
+            if isinstance(result, Exception):
+                logger.warning(f"{source.capitalize()} prediction failed: {result}")
+            elif result and result.get("action"):
                 votes.append(
                     Prediction(
-                        action=freqtrade_result["action"],
-                        confidence=isinstance(
-                            freqtrade_result.get("confidence"), (int, float)
-                        )
-                        and freqtrade_result["confidence"]
+                        action=result["action"],
+                        confidence=isinstance(result.get("confidence"), (int, float))
+                        and result["confidence"]
                         or 0.5,
-                        source="freqtrade",
+                        source=source,
                     )
                 )
-        except Exception as e:
-            # ignore
-            logger.warning(f"Freqtrade prediction failed: {e}")
-
-        try:
-            # Jesse adapter uses synchronous calls in a wrapper
-            if self.jesse_adapter:
-                jesse_result = await asyncio.get_event_loop().run_in_executor(
-                    None, self.jesse_adapter.predict, payload
-                )
-                if jesse_result and jesse_result.get("action"):
-                    votes.append(
-                        Prediction(
-                            action=jesse_result["action"],
-                            confidence=isinstance(
-                                jesse_result.get("confidence"), (int, float)
-                            )
-                            and jesse_result["confidence"]
-                            or 0.5,
-                            source="jesse",
-                        )
-                    )
-        except Exception as e:
-            # ignore
-            logger.warning(f"Jesse prediction failed: {e}")
 
         # If no external votes, return neutral
         if not votes:
@@ -206,49 +208,61 @@ class TradingOrchestrator:
         """Run backtest across all adapters"""
         results: List[Dict[str, Any]] = []
 
-        try:
-            freqtrade_result = (
-                await self.freqtrade_adapter.backtest(payload)
-                if self.freqtrade_adapter
-                else None
-            )
-            if freqtrade_result:
-                results.append({**freqtrade_result, "source": "freqtrade"})
-        except Exception as e:
-            # ignore
-            logger.warning(f"Freqtrade backtest failed: {e}")
-
-        try:
-            # Jesse adapter uses synchronous calls in a wrapper
-            if self.jesse_adapter:
-                jesse_result = await asyncio.get_event_loop().run_in_executor(
-                    None, self.jesse_adapter.backtest, payload
-                )
-                if jesse_result:
-                    results.append({**jesse_result, "source": "jesse"})
-        except Exception as e:
-            # ignore
-            logger.warning(f"Jesse backtest failed: {e}")
-
-        # Build summary from combined results
-        profits = [float(r.get("profit_pct", r.get("profitPct", 0))) for r in results]
-        total_trades_arr = [
-            int(r.get("trades", r.get("totalTrades", 0))) for r in results
-        ]
-        sum_profit = sum(profits) if profits else 0.0
-        sum_trades = sum(total_trades_arr) if total_trades_arr else 0
-        avg_profit_pct = sum_profit / len(results) if results else 0.0
+        adapter_results = await asyncio.gather(
+            self._call_adapter(self.freqtrade_adapter, "backtest", payload),
+            self._call_adapter(self.jesse_adapter, "backtest", payload),
+            return_exceptions=True,
+        )
+        for source, result in zip(_ADAPTER_SOURCES, adapter_results):
+            if isinstance(result, Exception):
+                logger.warning(f"{source.capitalize()} backtest failed: {result}")
+            elif result:
+                results.append({**result, "source": source})
+
+        # Build summary from combined results in one pass; the average only
+        # covers results that actually report a profit
+        profits: List[float] = []
+        total_trades = 0
+        for r in results:
+            profit = r.get("profit_pct", r.get("profitPct"))
+            if isinstance(profit, (int, float)):
+                profits.append(profit)
+            trades = r.get("trades", r.get("totalTrades"))
+            if isinstance(trades, (int, float)):
+                total_trades += int(trades)
+        avg_profit_pct = math.fsum(profits) / len(profits) if profits else 0.0
 
         return BacktestResult(
             results=results,
             summary=BacktestSummary(
-                avg_profit_pct=avg_profit_pct, total_trades=sum_trades
+                avg_profit_pct=avg_profit_pct, total_trades=total_trades
             ),
         )
 
     async def get_user_bots(self, user_id: int) -> List[Dict[str, Any]]:
-        """Get bots for a specific user"""
+        """Get bots for a specific user, cached for BOTS_CACHE_TTL seconds"""
+        cached = self._bots_cache.get(user_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < BOTS_CACHE_TTL:
+            return cached[1]
+
+        bots = await self._load_user_bots(user_id)
+        self._bots_cache[user_id] = (now, bots)
+        self._bots_by_id[user_id] = {bot["id"]: bot for bot in bots}
+        return bots
+
+    def invalidate_user_bots(self, user_id: Optional[int] = None) -> None:
+        """Drop cached bots for one user, or for everyone if no user is given"""
+        if user_id is None:
+            self._bots_cache.clear()
+            self._bots_by_id.clear()
+        else:
+            self._bots_cache.pop(user_id, None)
+            self._bots_by_id.pop(user_id, None)
+
+    async def _load_user_bots(self, user_id: int) -> List[Dict[str, Any]]:
         # Mock implementation - in real implementation, query database
+        now = time.monotonic()
         return [
             {
                 "id": 1,
@@ -257,7 +271,7 @@ class TradingOrchestrator:
                 "status": "running",
                 "strategy": "scalping",
                 "symbol": "BTC/USD",
-                "last_update": asyncio.get_event_loop().time(),
+                "last_update": now,
             },
             {
                 "id": 2,
@@ -266,17 +280,14 @@ class TradingOrchestrator:
                 "status": "stopped",
                 "strategy": "hold",
                 "symbol": "ETH/USD",
-                "last_update": asyncio.get_event_loop().time(),
+                "last_update": now,
             },
         ]
 
     async def get_bot_status(self, user_id: int, bot_id: int) -> Dict[str, Any]:
         """Get status of a specific bot"""
-        bots = await self.get_user_bots(user_id)
-        for bot in bots:
-            if bot["id"] == bot_id:
-                return bot
-        return {"error": "Bot not found"}
+        await self.get_user_bots(user_id)
+        return self._bots_by_id[user_id].get(bot_id) or {"error": "Bot not found"}
 
 
 # Global instance
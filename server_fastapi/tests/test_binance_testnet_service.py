@@ -0,0 +1,76 @@
+"""
+Tests for response caching in the Binance testnet service
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from server_fastapi.services.exchange.binance_testnet_service import (
+    BinanceTestnetService,
+)
+
+TICKER = {
+    "last": 50000.0,
+    "bid": 49990.0,
+    "ask": 50010.0,
+    "high": 51000.0,
+    "low": 49000.0,
+    "quoteVolume": 1.0e6,
+    "timestamp": 1,
+}
+
+
+@pytest.fixture
+def service():
+    """Service with a mocked exchange client"""
+    svc = BinanceTestnetService()
+    svc.exchange = MagicMock()
+    svc.exchange.fetch_balance = AsyncMock(
+        return_value={"total": {"USDT": 100.0}, "free": {"USDT": 100.0}, "used": {}}
+    )
+    return svc
+
+
+@pytest.mark.asyncio
+class TestBinanceTestnetCache:
+    """Test TTL caching and request coalescing"""
+
+    async def test_concurrent_tickers_share_one_fetch(self, service):
+        """Test that concurrent callers for one symbol make a single request"""
+
+        async def fetch_ticker(symbol):
+            await asyncio.sleep(0.01)
+            return TICKER
+
+        service.exchange.fetch_ticker = AsyncMock(side_effect=fetch_ticker)
+        results = await asyncio.gather(
+            *(service.get_ticker("BTC/USDT") for _ in range(5))
+        )
+        await service.get_ticker("BTC/USDT")
+
+        assert service.exchange.fetch_ticker.await_count == 1
+        assert all(r["price"] == 50000.0 for r in results)
+
+    async def test_failed_fetch_not_cached(self, service):
+        """Test that an error is returned to callers but not cached"""
+        service.exchange.fetch_ticker = AsyncMock(
+            side_effect=[RuntimeError("down"), TICKER]
+        )
+
+        assert (await service.get_ticker("BTC/USDT"))["success"] is False
+        assert (await service.get_ticker("BTC/USDT"))["success"] is True
+
+    async def test_order_invalidates_balance(self, service):
+        """Test that placing an order forces a fresh balance fetch"""
+        service.exchange.create_limit_order = AsyncMock(
+            return_value={"id": "1", "status": "open", "timestamp": 1}
+        )
+
+        await service.get_balance()
+        await service.get_balance()
+        await service.create_limit_order("BTC/USDT", "buy", 1.0, 50000.0)
+        await service.get_balance()
+
+        assert service.exchange.fetch_balance.await_count == 2
@@ -0,0 +1,42 @@
+"""
+Tests for the in-memory fallback cache used by CacheService
+"""
+
+from server_fastapi.services.cache_service import MemoryCache
+
+
+class TestMemoryCache:
+    """Test TTL expiry and LRU eviction"""
+
+    def test_evicts_least_recently_used(self):
+        """Test that a read protects an entry from eviction"""
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_overwrite_does_not_evict(self):
+        """Test that updating an existing key keeps the other entries"""
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert len(cache.cache) == 2
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+
+    def test_expired_entry_removed(self):
+        """Test that an expired entry reads as missing and is dropped"""
+        cache = MemoryCache()
+        cache.set("a", 1, ttl=-1)
+
+        assert cache.exists("a") is False
+        assert cache.get("a") is None
+        assert "a" not in cache.cache
@@ -0,0 +1,61 @@
+"""
+Tests for the push-based market data stream
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from server_fastapi.services.market_data import MarketDataService
+
+
+def _ticker(symbol: str, last: float) -> dict:
+    return {"symbol": symbol, "last": last, "percentage": 1.234, "baseVolume": 10.0}
+
+
+@pytest.mark.asyncio
+class TestMarketDataWatch:
+    """Test streaming tickers pushed by a ccxt.pro exchange"""
+
+    async def test_watch_tickers(self):
+        """Test that one watch_tickers call yields an update per symbol"""
+        exchange = MagicMock(has={"watchTickers": True})
+        exchange.watch_tickers = AsyncMock(
+            return_value={
+                "BTC/USD": _ticker("BTC/USD", 50000.0),
+                "ETH/USD": _ticker("ETH/USD", None),
+            }
+        )
+        service = MarketDataService(exchange)
+        service.subscribed_symbols = {"BTC/USD", "ETH/USD"}
+
+        stream = service.stream_market_data()
+        update = await stream.__anext__()
+        await stream.aclose()
+
+        exchange.watch_tickers.assert_awaited_once_with(["BTC/USD", "ETH/USD"])
+        assert update["symbol"] == "BTC/USD"
+        assert update["price"] == 50000.0
+        assert update["change"] == 1.23
+        assert service.candles["BTC/USD"][-1][4] == 50000.0
+
+    async def test_watch_ticker_fallback(self):
+        """Test that per-symbol watches yield whichever symbol updates first"""
+        release_eth = asyncio.Event()
+
+        async def watch_ticker(symbol):
+            if symbol == "ETH/USD":
+                await release_eth.wait()
+            return _ticker(symbol, 1.0)
+
+        exchange = MagicMock(has={"watchTickers": False})
+        exchange.watch_ticker = AsyncMock(side_effect=watch_ticker)
+        service = MarketDataService(exchange)
+        service.subscribed_symbols = {"BTC/USD", "ETH/USD"}
+
+        stream = service.stream_market_data()
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first["symbol"] == "BTC/USD"
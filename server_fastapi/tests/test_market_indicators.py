@@ -0,0 +1,70 @@
+"""
+Tests for the technical indicator kernels
+"""
+
+import numpy as np
+import pytest
+
+from server_fastapi.services.market import indicators
+
+
+@pytest.fixture
+def closes():
+    """Deterministic random-walk close series"""
+    rng = np.random.default_rng(42)
+    return 100.0 + np.cumsum(rng.normal(0.0, 1.0, 200))
+
+
+class TestIndicators:
+    """Test RSI, MACD and Bollinger Band kernels"""
+
+    def test_rsi_bounds(self, closes):
+        """Test RSI stays in range and saturates on a monotonic series"""
+        assert 0.0 <= indicators.rsi(closes, 14) <= 100.0
+        assert indicators.rsi(np.arange(1.0, 30.0), 14) == 100.0
+        assert indicators.rsi(np.arange(30.0, 1.0, -1.0), 14) == 0.0
+
+    def test_macd_histogram(self, closes):
+        """Test MACD histogram is the MACD line minus the signal line"""
+        macd_value, signal_line, histogram = indicators.macd(closes, 12, 26, 9)
+        assert histogram == pytest.approx(macd_value - signal_line)
+
+    def test_bollinger_matches_numpy(self, closes):
+        """Test Bollinger Bands match a NumPy mean/std over the window"""
+        upper, middle, lower = indicators.bollinger(closes, 20, 2.0)
+        window = closes[-20:]
+        assert middle == pytest.approx(window.mean())
+        assert upper - middle == pytest.approx(2.0 * window.std())
+        assert middle - lower == pytest.approx(2.0 * window.std())
+
+    def test_log_return_std_matches_numpy(self, closes):
+        """Test one-pass log-return volatility matches NumPy"""
+        expected = np.std(np.diff(np.log(closes)))
+        assert indicators.log_return_std(closes) == pytest.approx(expected)
+        assert indicators.log_return_std(closes[:1]) == 0.0
+
+    def test_direction_labels(self, closes):
+        """Test next-bar labels match a NumPy threshold on relative change"""
+        change = np.diff(closes) / closes[:-1]
+        expected = np.where(change > 0.002, 0, np.where(change < -0.002, 1, 2))
+        labels = indicators.direction_labels(closes, 0.002)
+        assert labels.dtype == np.int8
+        np.testing.assert_array_equal(labels, expected)
+        assert indicators.direction_labels(closes[:1], 0.002).size == 0
+
+    def test_numpy_variants_match_kernels(self, closes):
+        """Test the vectorized fallbacks agree with the kernels"""
+        assert indicators.rsi_numpy(closes, 14) == pytest.approx(
+            indicators.rsi(closes, 14)
+        )
+        assert indicators.rsi_numpy(np.arange(1.0, 30.0), 14) == 100.0
+        assert indicators.macd_numpy(closes, 12, 26, 9) == pytest.approx(
+            indicators.macd(closes, 12, 26, 9)
+        )
+        assert indicators.bollinger_numpy(closes, 20, 2.0) == pytest.approx(
+            indicators.bollinger(closes, 20, 2.0)
+        )
+
+    def test_warmup(self):
+        """Test warmup runs every kernel without error"""
+        indicators.warmup()
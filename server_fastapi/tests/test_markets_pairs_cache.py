@@ -0,0 +1,163 @@
+"""
+Tests for the shared trading-pair cache used by the markets routes
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from server_fastapi.routes import markets
+from server_fastapi.services.exchange_service import TradingPair
+
+
+def _pair(symbol: str, volume: float) -> TradingPair:
+    base, quote = symbol.split("/")
+    return TradingPair(
+        symbol=symbol,
+        base_asset=base,
+        quote_asset=quote,
+        current_price=1.0,
+        change_24h=0.0,
+        volume_24h=volume,
+        high_24h=1.0,
+        low_24h=1.0,
+    )
+
+
+@pytest.fixture
+def exchange():
+    """Mock exchange returning three pairs in non-volume order"""
+    markets._pairs_cache.clear()
+    markets._pairs_read.clear()
+    ex = MagicMock()
+    ex.name = "test-exchange"
+    ex.get_all_trading_pairs = AsyncMock(
+        return_value=[
+            _pair("ETH/USD", 600.0),
+            _pair("BTC/USD", 1200.0),
+            _pair("XRP/USD", 200.0),
+        ]
+    )
+    yield ex
+    markets._pairs_cache.clear()
+    markets._pairs_read.clear()
+
+
+@pytest.mark.asyncio
+class TestPairsCache:
+    """Test trading pair caching across market endpoints"""
+
+    async def test_pairs_fetched_once_within_ttl(self, exchange):
+        """Test that repeated endpoint calls reuse the cached pairs"""
+        await markets.get_tickers(limit=2, exchange=exchange, if_none_match=None)
+        await markets.get_market_summary(
+            top_count=2, exchange=exchange, if_none_match=None
+        )
+        await markets.get_favorite_pairs(current_user={"id": 1}, exchange=exchange)
+
+        assert exchange.get_all_trading_pairs.await_count == 1
+
+    async def test_sorted_by_volume(self, exchange):
+        """Test that endpoints return pairs ordered by volume"""
+        response = await markets.get_tickers(
+            limit=2, exchange=exchange, if_none_match=None
+        )
+        tickers = json.loads(response.body)
+        assert [t["symbol"] for t in tickers] == ["BTC/USD", "ETH/USD"]
+        assert tickers[0]["last_price"] == 1.0
+
+        response = await markets.get_market_summary(
+            top_count=3, exchange=exchange, if_none_match=None
+        )
+        summary = json.loads(response.body)
+        assert summary["total_pairs"] == 3
+        assert summary["total_volume_24h"] == 2000.0
+        assert [p["symbol"] for p in summary["top_pairs"]] == [
+            "BTC/USD",
+            "ETH/USD",
+            "XRP/USD",
+        ]
+
+    async def test_search_keeps_volume_order(self, exchange):
+        """Test that search results are filtered and ordered by volume"""
+        results = await markets.search_trading_pairs(
+            query="usd", limit=2, exchange=exchange
+        )
+        assert [p.symbol for p in results] == ["BTC/USD", "ETH/USD"]
+
+    async def test_empty_result_not_cached(self, exchange):
+        """Test that a failed (empty) fetch is retried on the next call"""
+        exchange.get_all_trading_pairs = AsyncMock(return_value=[])
+        await markets.get_tickers(limit=5, exchange=exchange, if_none_match=None)
+        await markets.get_tickers(limit=5, exchange=exchange, if_none_match=None)
+
+        assert exchange.get_all_trading_pairs.await_count == 2
+
+    async def test_search_matches_single_field(self, exchange):
+        """Test that search matches base/quote case-insensitively, not across fields"""
+        results = await markets.search_trading_pairs(
+            query="Eth", limit=10, exchange=exchange
+        )
+        assert [p.symbol for p in results] == ["ETH/USD"]
+
+        results = await markets.search_trading_pairs(
+            query="usdeth", limit=10, exchange=exchange
+        )
+        assert results == []
+
+    async def test_background_refresh_populates_snapshot(self, exchange):
+        """Test that the refresher materialises the snapshot ahead of requests"""
+        task = asyncio.create_task(
+            markets.refresh_pairs_forever(exchange, interval=0.01)
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        assert "test-exchange" in markets._pairs_cache
+        calls = exchange.get_all_trading_pairs.await_count
+        await markets.get_tickers(limit=3, exchange=exchange, if_none_match=None)
+        assert exchange.get_all_trading_pairs.await_count == calls
+
+    async def test_background_refresh_skips_unread_snapshot(self, exchange):
+        """Test that the refresher only refetches after someone read the snapshot"""
+        task = asyncio.create_task(
+            markets.refresh_pairs_forever(exchange, interval=0.01)
+        )
+        await asyncio.sleep(0.05)
+        assert exchange.get_all_trading_pairs.await_count == 1
+
+        await markets.get_tickers(limit=3, exchange=exchange, if_none_match=None)
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        assert exchange.get_all_trading_pairs.await_count == 2
+
+    async def test_etag_not_modified(self, exchange):
+        """Test that a matching If-None-Match gets 304 and a changed limit does not"""
+        first = await markets.get_tickers(
+            limit=2, exchange=exchange, if_none_match=None
+        )
+        etag = first.headers["etag"]
+
+        cached = await markets.get_tickers(
+            limit=2, exchange=exchange, if_none_match=etag
+        )
+        assert cached.status_code == 304
+        assert cached.body == b""
+
+        other = await markets.get_tickers(
+            limit=3, exchange=exchange, if_none_match=etag
+        )
+        assert other.status_code == 200
+
+    async def test_markets_list_etag(self, exchange):
+        """Test that GET / serves the snapshot's pair list with an ETag"""
+        response = await markets.get_markets(exchange=exchange, if_none_match=None)
+        assert len(json.loads(response.body)) == 3
+
+        cached = await markets.get_markets(
+            exchange=exchange, if_none_match=f'W/{response.headers["etag"]}'
+        )
+        assert cached.status_code == 304
@@ -0,0 +1,60 @@
+"""
+Tests for micro-batching of neural network inference
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from server_fastapi.services.ml.neural_network_engine import _InferenceBatcher
+
+
+@pytest.mark.asyncio
+class TestInferenceBatcher:
+    """Test coalescing of concurrent predictions into model calls"""
+
+    async def test_concurrent_requests_share_one_call(self):
+        """Test that requests queued together are answered by one batch"""
+        calls = []
+
+        def model_fn(batch):
+            calls.append(batch.shape)
+            return batch * 2
+
+        batcher = _InferenceBatcher(model_fn, max_batch=32, max_latency=0.01)
+        results = await asyncio.gather(
+            *(batcher.predict(np.full(3, float(i))) for i in range(5))
+        )
+
+        assert calls == [(5, 3)]
+        for i, row in enumerate(results):
+            assert row.tolist() == [2.0 * i] * 3
+
+    async def test_max_batch_splits_calls(self):
+        """Test that a full batch is dispatched and the rest follows"""
+        calls = []
+
+        def model_fn(batch):
+            calls.append(len(batch))
+            return batch
+
+        batcher = _InferenceBatcher(model_fn, max_batch=4, max_latency=0.01)
+        await asyncio.gather(*(batcher.predict(np.zeros(2)) for _ in range(6)))
+
+        assert calls == [4, 2]
+
+    async def test_model_error_reaches_callers(self):
+        """Test that a failing model call raises in every waiting request"""
+
+        def model_fn(batch):
+            raise RuntimeError("model down")
+
+        batcher = _InferenceBatcher(model_fn, max_latency=0.0)
+        results = await asyncio.gather(
+            batcher.predict(np.zeros(2)),
+            batcher.predict(np.zeros(2)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,268 @@
+"""
+Tests for the in-app notification store on NotificationService
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from server_fastapi.services import notification_service
+from server_fastapi.services.notification_service import (
+    NotificationCategory,
+    NotificationPriority,
+    NotificationService,
+)
+
+
+@pytest.fixture
+def service():
+    """Service with an empty in-memory store"""
+    stores = (
+        NotificationService._notifications,
+        NotificationService._by_id,
+        NotificationService._total_counts,
+        NotificationService._unread_counts,
+        NotificationService._unread_ids,
+        NotificationService._expiry_queues,
+        NotificationService._last_cleanup,
+        NotificationService._listeners,
+    )
+    for store in stores:
+        store.clear()
+    yield NotificationService()
+    for store in stores:
+        store.clear()
+
+
+@pytest.mark.asyncio
+class TestNotificationStore:
+    """Test storing, ordering and updating in-app notifications"""
+
+    async def test_recent_ordered_by_priority_then_newest(self, service):
+        """Test that urgent notifications come first, newest first within a rank"""
+        await service.create_notification(
+            1, "old low", priority=NotificationPriority.LOW
+        )
+        await service.create_notification(
+            1, "critical", priority=NotificationPriority.CRITICAL
+        )
+        await service.create_notification(
+            1, "new low", priority=NotificationPriority.LOW
+        )
+
+        recent = await service.get_recent_notifications(1)
+
+        assert [n["message"] for n in recent] == ["critical", "new low", "old low"]
+        assert isinstance(recent[0]["created_at"], float)
+        assert recent[0]["timestamp"].endswith("+00:00")
+
+    async def test_filters_and_limit(self, service):
+        """Test category, unread and priority filters plus the limit"""
+        risk = await service.create_notification(
+            1, "risk", category=NotificationCategory.RISK
+        )
+        await service.create_notification(
+            1,
+            "bot",
+            category=NotificationCategory.BOT,
+            priority=NotificationPriority.HIGH,
+        )
+        await service.mark_as_read(1, risk["id"])
+
+        by_category = await service.get_recent_notifications(
+            1, category=NotificationCategory.RISK
+        )
+        unread = await service.get_recent_notifications(1, unread_only=True)
+        high = await service.get_recent_notifications(
+            1, priority_filter=[NotificationPriority.HIGH]
+        )
+
+        assert [n["message"] for n in by_category] == ["risk"]
+        assert [n["message"] for n in unread] == ["bot"]
+        assert [n["message"] for n in high] == ["bot"]
+        assert len(await service.get_recent_notifications(1, limit=1)) == 1
+
+    async def test_read_delete_and_counts(self, service):
+        """Test unread counts follow mark-as-read and delete"""
+        first = await service.create_notification(1, "a")
+        await service.create_notification(1, "b", category=NotificationCategory.RISK)
+        await service.create_notification(2, "other user")
+
+        assert await service.get_unread_count(1) == 2
+        assert await service.mark_as_read(1, str(first["id"])) is True
+        assert await service.mark_as_read(2, first["id"]) is False
+        assert await service.get_unread_count(1) == 1
+        assert await service.mark_all_as_read(1, NotificationCategory.RISK) == 1
+        assert await service.delete_notification(1, first["id"]) is True
+
+        stats = await service.get_notification_stats(1)
+        assert stats["total"] == 1 and stats["unread"] == 0
+        assert stats["by_category"] == {"risk": 1}
+        assert stats["by_priority"] == {"medium": 1}
+
+    async def test_mark_all_only_touches_unread(self, service):
+        """Test mark-all honours the category and skips deleted entries"""
+        await service.create_notification(1, "a")
+        deleted = await service.create_notification(1, "b")
+        await service.create_notification(1, "c", category=NotificationCategory.RISK)
+        await service.delete_notification(1, deleted["id"])
+
+        assert await service.mark_all_as_read(1, NotificationCategory.BOT) == 0
+        assert await service.mark_all_as_read(1, NotificationCategory.SYSTEM) == 1
+        assert await service.mark_all_as_read(1) == 1
+        assert await service.mark_all_as_read(1) == 0
+        assert await service.get_unread_count(1) == 0
+
+    async def test_delete_keeps_order_and_delete_many(self, service):
+        """Test single and bulk deletes remove exactly the requested entries"""
+        created = [
+            await service.create_notification(1, str(i), priority=priority)
+            for i, priority in enumerate(
+                [NotificationPriority.LOW, NotificationPriority.HIGH] * 3
+            )
+        ]
+
+        assert await service.delete_notification(1, created[3]["id"]) is True
+        assert await service.delete_notification(1, created[3]["id"]) is False
+        assert await service.delete_many(1, [c["id"] for c in created[:2]] + [999]) == 2
+
+        recent = await service.get_recent_notifications(1)
+        assert [n["message"] for n in recent] == ["5", "4", "2"]
+        assert (await service.get_notification_stats(1))["total"] == 3
+
+    async def test_counts_with_combined_filters(self, service):
+        """Test unread counts by category and priority together"""
+        await service.create_notification(
+            1,
+            "a",
+            category=NotificationCategory.RISK,
+            priority=NotificationPriority.HIGH,
+        )
+        await service.create_notification(
+            1,
+            "b",
+            category=NotificationCategory.RISK,
+            priority=NotificationPriority.LOW,
+        )
+        await service.create_notification(
+            1,
+            "c",
+            category=NotificationCategory.BOT,
+            priority=NotificationPriority.HIGH,
+        )
+
+        assert (
+            await service.get_unread_count(
+                1,
+                category=NotificationCategory.RISK,
+                priority_filter=[NotificationPriority.HIGH],
+            )
+            == 1
+        )
+        assert (
+            await service.get_unread_count(
+                1, priority_filter=[NotificationPriority.HIGH, NotificationPriority.LOW]
+            )
+            == 3
+        )
+
+    async def test_listeners(self, service):
+        """Test listeners receive new notifications until removed"""
+        listener = AsyncMock()
+        await service.add_listener(1, listener)
+
+        created = await service.create_notification(1, "hello")
+        await service.remove_listener(1, listener)
+        await service.create_notification(1, "after removal")
+
+        listener.assert_awaited_once_with(created)
+
+    async def test_expired_notifications_swept_in_batches(self, service, monkeypatch):
+        """Test that expired notifications are hidden, then removed by a sweep"""
+        now = [1_000_000.0]
+        monkeypatch.setattr(notification_service.time, "time", lambda: now[0])
+        monkeypatch.setattr(notification_service, "NOTIFICATION_CLEANUP_BATCH_SIZE", 1)
+        await service.create_notification(1, "first")
+        await service.create_notification(1, "second")
+
+        now[0] += notification_service.NOTIFICATION_TTL_SECONDS + 1
+        assert await service.get_recent_notifications(1) == []
+        # One expired entry removed per sweep
+        assert (await service.get_notification_stats(1))["total"] == 1
+
+        now[0] += notification_service.NOTIFICATION_CLEANUP_INTERVAL_SECONDS
+        await service.get_recent_notifications(1)
+        assert (await service.get_notification_stats(1))["total"] == 0
+
+    async def test_retention_cap_drops_least_urgent_oldest(self, service, monkeypatch):
+        """Test that past the cap the tail of the ordering is dropped"""
+        monkeypatch.setattr(notification_service, "NOTIFICATION_RETENTION_MAX", 2)
+        await service.create_notification(
+            1, "old low", priority=NotificationPriority.LOW
+        )
+        await service.create_notification(1, "high", priority=NotificationPriority.HIGH)
+        for i in range(4):
+            await service.create_notification(
+                1, f"low {i}", priority=NotificationPriority.LOW
+            )
+
+        recent = await service.get_recent_notifications(1)
+        assert [n["message"] for n in recent] == ["high", "low 3"]
+        assert await service.get_unread_count(1) == 2
+        assert len(NotificationService._by_id["1"]) == 2
+        assert len(NotificationService._unread_ids["1"]) == 2
+        assert len(NotificationService._expiry_queues["1"]) <= 4
+
+    async def test_retention_keeps_new_lowest_ranked(self, service, monkeypatch):
+        """Test that a new notification ranked below the cap is still stored"""
+        monkeypatch.setattr(notification_service, "NOTIFICATION_RETENTION_MAX", 2)
+        for message in ("old high", "new high"):
+            await service.create_notification(
+                1, message, priority=NotificationPriority.HIGH
+            )
+        created = await service.create_notification(
+            1, "low", priority=NotificationPriority.LOW
+        )
+
+        recent = await service.get_recent_notifications(1)
+        assert [n["message"] for n in recent] == ["new high", "low"]
+        assert await service.mark_as_read(1, created["id"]) is True
+        assert await service.delete_notification(1, created["id"]) is True
+
+    async def test_broadcast(self, service):
+        """Test that a broadcast stores one notification per user and notifies each"""
+        listener = AsyncMock()
+        await service.add_listener(2, listener)
+
+        await service.broadcast_notification(
+            [1, 2],
+            "maintenance",
+            category=NotificationCategory.SYSTEM,
+            data={"window": "02:00"},
+        )
+
+        first = await service.get_recent_notifications(1)
+        second = await service.get_recent_notifications(2)
+        assert first[0]["message"] == second[0]["message"] == "maintenance"
+        assert first[0]["id"] != second[0]["id"]
+        assert first[0]["user_id"] == "1" and second[0]["user_id"] == "2"
+        listener.assert_awaited_once_with(second[0])
+
+        # Recipients do not share the data payload
+        first[0]["data"]["window"] = "03:00"
+        assert (await service.get_recent_notifications(2))[0]["data"] == {
+            "window": "02:00"
+        }
+        assert listener.await_args.args[0]["data"] is second[0]["data"]
+
+    async def test_sync_and_failing_listeners(self, service):
+        """Test plain callables are called and one failure does not stop others"""
+        sync_listener = MagicMock()
+        failing = AsyncMock(side_effect=RuntimeError("socket closed"))
+        healthy = AsyncMock()
+        for listener in (sync_listener, failing, healthy):
+            await service.add_listener(1, listener)
+
+        created = await service.create_notification(1, "hello")
+
+        sync_listener.assert_called_once_with(created)
+        healthy.assert_awaited_once_with(created)
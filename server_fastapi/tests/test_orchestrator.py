@@ -207,3 +207,110 @@ class TestRiskManagement:
         # Cleanup
         await db_session.delete(limit)
         await db_session.commit()
+
+
+@pytest.mark.asyncio
+class TestAdapterFanOut:
+    """Test that adapter calls run concurrently and tolerate failures"""
+
+    @staticmethod
+    def _orchestrator(freqtrade, jesse):
+        from server_fastapi.services.trading_orchestrator import TradingOrchestrator
+
+        orchestrator = TradingOrchestrator()
+        orchestrator.freqtrade_adapter = freqtrade
+        orchestrator.jesse_adapter = jesse
+        return orchestrator
+
+    async def test_predictions_gathered_concurrently(self):
+        """Test that both adapters are in flight at the same time"""
+        import asyncio
+
+        in_flight = []
+        both_started = asyncio.Event()
+
+        class Adapter:
+            def __init__(self, action):
+                self.action = action
+
+            async def predict(self, payload):
+                # Times out unless the other adapter is awaited concurrently
+                in_flight.append(self)
+                if len(in_flight) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), 1.0)
+                return {"action": self.action, "confidence": 0.8}
+
+        orchestrator = self._orchestrator(Adapter("buy"), Adapter("buy"))
+        prediction = await orchestrator.get_ensemble_prediction({})
+
+        assert [v.source for v in prediction.votes] == ["freqtrade", "jesse"]
+        assert prediction.action == "buy"
+        assert prediction.confidence == 1.0
+
+    async def test_failing_adapter_skipped(self):
+        """Test that a failing adapter does not drop the other result"""
+
+        class Broken:
+            async def backtest(self, payload):
+                raise RuntimeError("down")
+
+        class Jesse:
+            def backtest(self, payload):
+                return {"profit_pct": 4.0, "trades": 3}
+
+        orchestrator = self._orchestrator(Broken(), Jesse())
+        result = await orchestrator.backtest({})
+
+        assert result.results == [{"profit_pct": 4.0, "trades": 3, "source": "jesse"}]
+        assert result.summary.avg_profit_pct == 4.0
+        assert result.summary.total_trades == 3
+
+    async def test_backtest_average_skips_missing_profit(self):
+        """Test that results without a profit do not dilute the average"""
+
+        class Freqtrade:
+            async def backtest(self, payload):
+                return {"trades": 2, "error": "no profit reported"}
+
+        class Jesse:
+            async def backtest(self, payload):
+                return {"totalTrades": 5, "profitPct": 0.1}
+
+        result = await self._orchestrator(Freqtrade(), Jesse()).backtest({})
+
+        assert result.summary.avg_profit_pct == 0.1
+        assert result.summary.total_trades == 7
+
+
+@pytest.mark.asyncio
+class TestUserBotsCache:
+    """Test caching of per-user bot lists"""
+
+    async def test_bots_cached_and_indexed(self):
+        """Test that repeat lookups reuse the loaded list"""
+        from unittest.mock import patch
+        from server_fastapi.services.trading_orchestrator import TradingOrchestrator
+
+        orchestrator = TradingOrchestrator()
+        with patch.object(
+            orchestrator, "_load_user_bots", wraps=orchestrator._load_user_bots
+        ) as load:
+            bots = await orchestrator.get_user_bots(7)
+            assert await orchestrator.get_user_bots(7) is bots
+            assert (await orchestrator.get_bot_status(7, 2))["name"] == "ETH Holder"
+            assert await orchestrator.get_bot_status(7, 99) == {"error": "Bot not found"}
+            assert load.await_count == 1
+
+            orchestrator.invalidate_user_bots(7)
+            await orchestrator.get_bot_status(7, 1)
+            assert load.await_count == 2
+
+    async def test_cache_expires(self, monkeypatch):
+        """Test that a stale entry is reloaded after the TTL"""
+        from server_fastapi.services import trading_orchestrator as module
+
+        orchestrator = module.TradingOrchestrator()
+        bots = await orchestrator.get_user_bots(7)
+        monkeypatch.setattr(module, "BOTS_CACHE_TTL", 0.0)
+        assert await orchestrator.get_user_bots(7) is not bots
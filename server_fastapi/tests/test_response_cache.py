@@ -0,0 +1,66 @@
+"""
+Tests for the in-memory response body cache on market data endpoints
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from server_fastapi.middleware import query_cache
+from server_fastapi.middleware.query_cache import invalidate_response_cache
+from server_fastapi.routes import markets
+from server_fastapi.services.exchange_service import OrderBook
+
+
+@pytest.fixture
+def exchange():
+    """Mock exchange with a fixed price and order book"""
+    query_cache._response_cache.clear()
+    ex = MagicMock()
+    ex.get_market_price = AsyncMock(return_value=50000.0)
+    ex.get_order_book = AsyncMock(
+        return_value=OrderBook(
+            pair="BTC/USD", bids=[[49990.0, 1.0]], asks=[[50010.0, 2.0]], timestamp=1
+        )
+    )
+    yield ex
+    query_cache._response_cache.clear()
+
+
+@pytest.mark.asyncio
+class TestResponseCache:
+    """Test caching of serialized market data responses"""
+
+    async def test_price_served_from_cache(self, exchange):
+        """Test that a second request within the TTL skips the exchange"""
+        first = await markets.get_price(pair="BTC/USD", exchange=exchange)
+        second = await markets.get_price(pair="BTC/USD", exchange=exchange)
+
+        assert exchange.get_market_price.await_count == 1
+        assert json.loads(first.body) == {"pair": "BTC/USD", "price": 50000.0}
+        assert second.body == first.body
+
+    async def test_keyed_by_pair(self, exchange):
+        """Test that different pairs are cached separately"""
+        await markets.get_price(pair="BTC/USD", exchange=exchange)
+        await markets.get_price(pair="ETH/USD", exchange=exchange)
+
+        assert exchange.get_market_price.await_count == 2
+
+    async def test_invalidate(self, exchange):
+        """Test that invalidation forces the next request upstream"""
+        await markets.get_order_book(pair="BTC/USD", exchange=exchange)
+        invalidate_response_cache("orderbook", "BTC/USD")
+        await markets.get_order_book(pair="BTC/USD", exchange=exchange)
+
+        assert exchange.get_order_book.await_count == 2
+
+    async def test_fallback_not_cached(self, exchange):
+        """Test that the empty order book returned on errors is not cached"""
+        exchange.get_order_book = AsyncMock(side_effect=RuntimeError("down"))
+        book = await markets.get_order_book(pair="BTC/USD", exchange=exchange)
+        await markets.get_order_book(pair="BTC/USD", exchange=exchange)
+
+        assert book.bids == [] and book.asks == []
+        assert exchange.get_order_book.await_count == 2
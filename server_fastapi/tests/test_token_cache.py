@@ -0,0 +1,46 @@
+"""
+Tests for the digest-keyed verified token cache
+"""
+
+import pytest
+
+from server_fastapi.utils.token_cache import VerifiedTokenCache
+
+
+def _decode(token: str):
+    if token == "bad":
+        raise ValueError("invalid")
+    return {"id": token}, None
+
+
+class TestVerifiedTokenCache:
+    """Test hits, LRU eviction and error handling"""
+
+    def test_hit_skips_decode(self):
+        """Test that a repeated token is only decoded once"""
+        cache = VerifiedTokenCache(maxsize=4)
+        assert cache.get_or_decode("a", _decode) == ({"id": "a"}, None)
+        assert cache.get_or_decode("a", _decode) == ({"id": "a"}, None)
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched token is evicted at capacity"""
+        cache = VerifiedTokenCache(maxsize=2)
+        cache.get_or_decode("a", _decode)
+        cache.get_or_decode("b", _decode)
+        cache.get_or_decode("a", _decode)
+        cache.get_or_decode("c", _decode)
+
+        assert len(cache) == 2
+        cache.get_or_decode("a", _decode)
+        assert cache.misses == 3
+        cache.get_or_decode("b", _decode)
+        assert cache.misses == 4
+
+    def test_errors_not_cached(self):
+        """Test that a failing decode raises every time"""
+        cache = VerifiedTokenCache(maxsize=2)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cache.get_or_decode("bad", _decode)
+        assert len(cache) == 0
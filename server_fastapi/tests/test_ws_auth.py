@@ -23,3 +23,25 @@ async def test_ws_market_data_accepts_valid_token(monkeypatch):
     decoded = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
     assert decoded["id"] == 1
     # Full WS handshake is covered in end-to-end runs; unit-level validation ensures decode path works
+
+
+def test_ws_token_verified_once():
+    """Repeated WebSocket auth with the same token reuses the verified payload"""
+    import time
+    from fastapi import HTTPException
+    from server_fastapi.routes import ws
+
+    ws._ws_token_cache.clear()
+    token = jwt.encode(
+        {"id": 7, "exp": int(time.time()) + 60}, ws.JWT_SECRET, algorithm="HS256"
+    )
+    assert ws.get_current_user_ws(token)["id"] == 7
+    assert ws.get_current_user_ws(token)["id"] == 7
+    assert ws._ws_token_cache.misses == 1
+
+    expired = jwt.encode(
+        {"id": 7, "exp": int(time.time()) - 1}, ws.JWT_SECRET, algorithm="HS256"
+    )
+    with pytest.raises(HTTPException) as exc:
+        ws.get_current_user_ws(expired)
+    assert exc.value.detail == "Token expired"
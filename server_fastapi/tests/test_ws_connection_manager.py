@@ -0,0 +1,144 @@
+"""
+Tests for the WebSocket ConnectionManager and auth handshake
+"""
+
+import jwt
+import pytest
+from fastapi import WebSocketDisconnect
+from unittest.mock import AsyncMock, MagicMock
+
+from server_fastapi.routes import ws
+from server_fastapi.routes.ws import ConnectionManager
+
+
+def _socket() -> MagicMock:
+    return MagicMock(accept=AsyncMock(), send_text=AsyncMock())
+
+
+@pytest.mark.asyncio
+class TestConnectionManager:
+    """Test per-user delivery and cleanup"""
+
+    async def test_broadcast_only_reaches_user_sockets(self):
+        """Test that a user broadcast skips other users' sockets"""
+        manager = ConnectionManager()
+        mine, other = _socket(), _socket()
+        await manager.connect(mine, 1)
+        await manager.connect(other, 2)
+
+        assert await manager.broadcast_to_user(1, {"type": "ping"}) is True
+        mine.send_text.assert_awaited_once_with('{"type":"ping"}')
+        other.send_text.assert_not_awaited()
+
+    async def test_failed_send_does_not_block_others(self):
+        """Test that one failing socket does not stop delivery to the rest"""
+        manager = ConnectionManager()
+        broken, healthy = _socket(), _socket()
+        broken.send_text = AsyncMock(side_effect=RuntimeError("closed"))
+        await manager.connect(broken, 1)
+        await manager.connect(healthy, 1)
+
+        assert await manager.broadcast_to_user(1, {"type": "ping"}) is True
+        healthy.send_text.assert_awaited_once()
+
+    async def test_disconnect_removes_indices(self):
+        """Test that disconnecting the last socket drops the user entry"""
+        manager = ConnectionManager()
+        socket = _socket()
+        await manager.connect(socket, 1)
+        manager.disconnect(socket)
+
+        assert manager.get_connection(socket) is None
+        assert 1 not in manager.by_user
+        assert manager.active_connections == []
+        assert await manager.broadcast_to_user(1, {"type": "ping"}) is False
+
+
+@pytest.mark.asyncio
+class TestWsAuthenticate:
+    """Test the auth handshake shared by the WebSocket endpoints"""
+
+    async def test_valid_token_connects(self, monkeypatch):
+        """Test that a valid auth message registers the socket"""
+        manager = ConnectionManager()
+        monkeypatch.setattr(ws, "manager", manager)
+        token = jwt.encode({"id": 5}, ws.JWT_SECRET, algorithm="HS256")
+        socket = _socket()
+        socket.receive = AsyncMock(
+            return_value={
+                "type": "websocket.receive",
+                "bytes": f'{{"type":"auth","token":"{token}"}}'.encode(),
+            }
+        )
+
+        user = await ws._ws_authenticate(socket)
+
+        assert user["id"] == 5
+        assert manager.get_connection(socket)["user_id"] == 5
+        assert "auth_success" in socket.send_text.await_args.args[0]
+
+    async def test_non_auth_message_closes(self):
+        """Test that a first message other than auth closes the socket"""
+        socket = _socket()
+        socket.close = AsyncMock()
+        socket.receive = AsyncMock(
+            return_value={"type": "websocket.receive", "text": '{"action":"subscribe"}'}
+        )
+
+        assert await ws._ws_authenticate(socket) is None
+        socket.close.assert_awaited_once()
+
+    async def test_disconnect_raises(self):
+        """Test that a disconnect during the handshake raises WebSocketDisconnect"""
+        socket = _socket()
+        socket.receive = AsyncMock(
+            return_value={"type": "websocket.disconnect", "code": 1001}
+        )
+
+        with pytest.raises(WebSocketDisconnect):
+            await ws._ws_authenticate(socket)
+
+
+@pytest.mark.asyncio
+class TestNotificationsSocket:
+    """Test the notifications endpoint's handling of slow clients"""
+
+    async def test_slow_client_closed_and_listener_removed(self, monkeypatch):
+        """Test that a timed-out send closes the socket and unregisters it"""
+        import asyncio
+
+        from server_fastapi.services.notification_service import NotificationService
+
+        service = NotificationService()
+        monkeypatch.setattr(ws, "notification_service", service)
+        monkeypatch.setattr(ws, "NOTIFICATION_SEND_TIMEOUT", 0.05)
+        monkeypatch.setattr(
+            ws, "_ws_authenticate", AsyncMock(return_value={"id": 9001})
+        )
+
+        closed = asyncio.Event()
+        sent = []
+
+        async def send_text(text):
+            sent.append(text)
+            if len(sent) > 1:
+                # Client stops reading after the initial frame
+                await asyncio.Event().wait()
+
+        async def receive():
+            await closed.wait()
+            return {"type": "websocket.disconnect", "code": 1011}
+
+        socket = _socket()
+        socket.send_text = send_text
+        socket.receive = receive
+        socket.close = AsyncMock(side_effect=lambda code: closed.set())
+
+        handler = asyncio.create_task(ws.websocket_notifications(socket))
+        while not sent:
+            await asyncio.sleep(0)
+        await service.create_notification(9001, "hello")
+        await asyncio.wait_for(handler, 1.0)
+
+        socket.close.assert_awaited_once_with(code=1011)
+        assert "9001" not in service._listeners
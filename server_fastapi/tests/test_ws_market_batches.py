@@ -0,0 +1,86 @@
+"""
+Tests for batched market data delivery on the market-data WebSocket
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from server_fastapi.routes import ws
+
+
+@pytest.mark.asyncio
+class TestMarketBatches:
+    """Test coalescing of market data updates into batch frames"""
+
+    async def test_filters_and_coalesces(self, monkeypatch):
+        """Test that a burst of updates is sent as one filtered frame"""
+
+        async def stream():
+            for symbol in ["BTC/USD", "ETH/USD", "SOL/USD"] * 2:
+                yield {"type": "market_data", "symbol": symbol}
+
+        monkeypatch.setattr(ws.market_data_service, "stream_market_data", stream)
+        socket = MagicMock(send_text=AsyncMock())
+
+        with pytest.raises(RuntimeError):
+            await ws._stream_market_batches(socket, ["BTC/USD", "SOL/USD"])
+
+        socket.send_text.assert_awaited_once()
+        frame = json.loads(socket.send_text.await_args.args[0])
+        assert frame["type"] == "market_batch"
+        assert [u["symbol"] for u in frame["updates"]] == [
+            "BTC/USD",
+            "SOL/USD",
+            "BTC/USD",
+            "SOL/USD",
+        ]
+
+    async def test_stream_error_ends_sender(self, monkeypatch):
+        """Test that a failing stream ends the sender after flushing"""
+
+        async def stream():
+            yield {"type": "market_data", "symbol": "BTC/USD"}
+            raise RuntimeError("feed down")
+
+        monkeypatch.setattr(ws.market_data_service, "stream_market_data", stream)
+        socket = MagicMock(send_text=AsyncMock())
+
+        with pytest.raises(RuntimeError, match="stream ended"):
+            await ws._stream_market_batches(socket, ["BTC/USD"])
+        socket.send_text.assert_awaited_once()
+
+    async def test_shared_stream_fans_out(self, monkeypatch):
+        """Test that two subscribers share one upstream stream"""
+        started = 0
+
+        async def stream():
+            nonlocal started
+            started += 1
+            await asyncio.sleep(0)
+            for symbol in ["BTC/USD", "ETH/USD"]:
+                yield {"type": "market_data", "symbol": symbol}
+
+        monkeypatch.setattr(ws.market_data_service, "stream_market_data", stream)
+        broadcaster = ws.MarketDataBroadcaster()
+        btc = broadcaster.subscribe(["BTC/USD"])
+        both = broadcaster.subscribe(["BTC/USD", "ETH/USD"])
+        await broadcaster._task
+
+        assert started == 1
+        assert [btc.get_nowait()["symbol"], btc.get_nowait()] == ["BTC/USD", None]
+        assert both.qsize() == 3
+
+        broadcaster.unsubscribe(btc)
+        broadcaster.unsubscribe(both)
+        assert not broadcaster.symbol_subs
+
+    async def test_slow_subscriber_drops_oldest(self):
+        """Test that a full queue keeps the newest updates"""
+        queue = asyncio.Queue(maxsize=2)
+        for i in range(3):
+            ws.MarketDataBroadcaster._offer(queue, {"i": i})
+
+        assert [queue.get_nowait()["i"], queue.get_nowait()["i"]] == [1, 2]
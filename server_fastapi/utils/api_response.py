@@ -6,6 +6,17 @@ from typing import Any, Dict, Optional
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from fastapi import status
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with pydantic-core's Rust encoder instead of json.dumps.
+    Meant as a router's default_response_class for large list payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
 
 
 def success_response(
@@ -0,0 +1,53 @@
+"""
+Bounded LRU cache of verified JWT claims, keyed by a short token digest.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+# (payload, exp) as returned by the auth decoders
+TokenClaims = Tuple[dict, Optional[int]]
+
+
+class VerifiedTokenCache:
+    """
+    LRU of verified token claims keyed by a 16-byte blake2b digest of the
+    token, so an entry costs the same however long the token is.
+    Decode errors propagate and nothing is cached for that token.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, TokenClaims]" = OrderedDict()
+        # Sync dependencies run in the threadpool, so guard the LRU updates
+        self._lock = threading.Lock()
+
+    def get_or_decode(
+        self, token: str, decode: Callable[[str], TokenClaims]
+    ) -> TokenClaims:
+        """Return cached claims for token, verifying it with decode on a miss"""
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is not None:
+                self._entries.move_to_end(key)
+                return claims
+
+        claims = decode(token)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = claims
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return claims
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)